@@ -44,6 +44,7 @@ thai_characters = "".join(
 from pythainlp.soundex import soundex
 from pythainlp.spell import correct, spell
 from pythainlp.tag import pos_tag
+from pythainlp.tools import preload
 from pythainlp.tokenize import (
     Tokenizer,
     sent_tokenize,
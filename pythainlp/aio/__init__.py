@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio-friendly API for PyThaiNLP.
+"""
+
+__all__ = [
+    "MicroBatcher",
+    "dependency_parsing",
+    "get_executor",
+    "ner_batcher",
+    "ner_tag",
+    "normalize_batcher",
+    "pos_tag",
+    "romanize",
+    "run",
+    "sent_tokenize",
+    "set_executor",
+    "summarize",
+    "summarize_batcher",
+    "translate",
+    "translate_batcher",
+    "word_tokenize",
+]
+
+from pythainlp.aio.core import (
+    MicroBatcher,
+    dependency_parsing,
+    get_executor,
+    ner_batcher,
+    ner_tag,
+    normalize_batcher,
+    pos_tag,
+    romanize,
+    run,
+    sent_tokenize,
+    set_executor,
+    summarize,
+    summarize_batcher,
+    translate,
+    translate_batcher,
+    word_tokenize,
+)
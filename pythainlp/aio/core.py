@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio wrappers for PyThaiNLP functions.
+
+Heavy engines (transformers, PyTorch, ONNX) block for tens to hundreds
+of milliseconds per call. The coroutines here run them in an executor,
+so an asyncio event loop can keep serving other requests.
+"""
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+_EXECUTOR = None
+
+
+def set_executor(executor: Optional[Executor]) -> None:
+    """
+    Set the executor used by coroutines in :mod:`pythainlp.aio`.
+
+    :param concurrent.futures.Executor executor: executor to run blocking
+        functions in. If `None`, the default executor of the event loop
+        will be used.
+
+    :Example:
+    ::
+
+        from concurrent.futures import ThreadPoolExecutor
+        from pythainlp import aio
+
+        aio.set_executor(ThreadPoolExecutor(max_workers=4))
+    """
+    global _EXECUTOR
+    _EXECUTOR = executor
+
+
+def get_executor() -> Optional[Executor]:
+    """
+    Get the executor used by coroutines in :mod:`pythainlp.aio`.
+
+    :return: executor, or `None` for the default executor of the event loop
+    """
+    return _EXECUTOR
+
+
+async def run(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking function in the executor and wait for its result.
+
+    :param Callable func: function to be called
+    :return: return value of the function
+
+    :Example:
+    ::
+
+        from pythainlp import aio
+        from pythainlp.tag import NER
+
+        ner = NER("thainer")
+        await aio.run(ner.tag, "วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.")
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR, partial(func, *args, **kwargs)
+    )
+
+
+async def word_tokenize(text: str, **kwargs) -> List[str]:
+    """
+    Coroutine version of :func:`pythainlp.tokenize.word_tokenize`.
+    """
+    from pythainlp.tokenize import word_tokenize as _word_tokenize
+
+    return await run(_word_tokenize, text, **kwargs)
+
+
+async def sent_tokenize(text: str, **kwargs) -> List[str]:
+    """
+    Coroutine version of :func:`pythainlp.tokenize.sent_tokenize`.
+    """
+    from pythainlp.tokenize import sent_tokenize as _sent_tokenize
+
+    return await run(_sent_tokenize, text, **kwargs)
+
+
+async def pos_tag(words: List[str], **kwargs) -> List[Tuple[str, str]]:
+    """
+    Coroutine version of :func:`pythainlp.tag.pos_tag`.
+    """
+    from pythainlp.tag import pos_tag as _pos_tag
+
+    return await run(_pos_tag, words, **kwargs)
+
+
+async def romanize(text: str, **kwargs) -> str:
+    """
+    Coroutine version of :func:`pythainlp.transliterate.romanize`.
+    """
+    from pythainlp.transliterate import romanize as _romanize
+
+    return await run(_romanize, text, **kwargs)
+
+
+async def summarize(text: str, **kwargs) -> List[str]:
+    """
+    Coroutine version of :func:`pythainlp.summarize.summarize`.
+    """
+    from pythainlp.summarize import summarize as _summarize
+
+    return await run(_summarize, text, **kwargs)
+
+
+async def dependency_parsing(
+    text: str, **kwargs
+) -> Union[List[List[str]], str]:
+    """
+    Coroutine version of :func:`pythainlp.parse.dependency_parsing`.
+    """
+    from pythainlp.parse import dependency_parsing as _dependency_parsing
+
+    return await run(_dependency_parsing, text, **kwargs)
+
+
+async def ner_tag(ner, text: str, **kwargs) -> Union[List[tuple], str]:
+    """
+    Coroutine version of :meth:`pythainlp.tag.NER.tag`.
+
+    :param pythainlp.tag.NER ner: named-entity tagger
+    :param str text: text in Thai to be tagged
+
+    :Example:
+    ::
+
+        from pythainlp import aio
+        from pythainlp.tag import NER
+
+        ner = NER("thainer")
+        await aio.ner_tag(ner, "ทดสอบนายวรรณพงษ์ ภัททิยไพบูลย์", tag=True)
+    """
+    return await run(ner.tag, text, **kwargs)
+
+
+async def translate(translator, text: str) -> str:
+    """
+    Coroutine version of :meth:`pythainlp.translate.Translate.translate`.
+
+    :param pythainlp.translate.Translate translator: translator
+    :param str text: input text in source language
+
+    :Example:
+    ::
+
+        from pythainlp import aio
+        from pythainlp.translate import Translate
+
+        th2en = Translate("th", "en")
+        await aio.translate(th2en, "ฉันรักแมว")
+    """
+    return await run(translator.translate, text)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into micro-batches.
+
+    Requests submitted with :meth:`submit` are queued. A background task
+    collects them into a batch of up to `max_batch_size` items, waiting
+    at most `max_wait` seconds for the batch to fill, then calls
+    `batch_func` with the list of items in the executor.
+    `batch_func` must return a list of results in the same order.
+
+    The queue is bounded by `max_queue_size`. When it is full,
+    :meth:`submit` waits until there is room (backpressure).
+
+    :param Callable batch_func: function that takes a list of items
+        and returns a list of results
+    :param int max_batch_size: maximum number of items in a batch
+    :param float max_wait: maximum time (in seconds) to wait for
+        a batch to fill
+    :param int max_queue_size: maximum number of waiting items
+    :param concurrent.futures.Executor executor: executor to run
+        `batch_func` in (default: executor from :func:`set_executor`)
+
+    :Example:
+    ::
+
+        from pythainlp import aio
+        from pythainlp.tag import NER
+
+        ner = NER("thainer")
+        batcher = aio.MicroBatcher(
+            lambda texts: [ner.tag(text) for text in texts],
+            max_batch_size=16,
+        )
+
+        await batcher.submit("ทดสอบนายวรรณพงษ์ ภัททิยไพบูลย์")
+    """
+
+    def __init__(
+        self,
+        batch_func: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.005,
+        max_queue_size: int = 1024,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_func = batch_func
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue_size = max_queue_size
+        self.executor = executor
+        self._queue = None
+        self._loop = None
+        self._worker = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit an item and wait for its result.
+
+        :param item: input of `batch_func`
+        :return: result for the item
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            # items left in the queue by a stopped worker are processed
+            # by the new one, unless the queue belongs to another loop
+            if self._queue is None or self._loop is not loop:
+                self._fail_pending()
+                self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+                self._loop = loop
+            self._worker = asyncio.ensure_future(self._process())
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Stop the background task. Waiting requests are cancelled.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            try:
+                future.cancel()
+            except RuntimeError:  # its event loop is closed
+                pass
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(self._queue.get(), timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+            except asyncio.CancelledError:
+                # collected items are no longer in the queue
+                for _, future in batch:
+                    future.cancel()
+                raise
+        return batch
+
+    async def _process(self) -> None:
+        loop = asyncio.get_running_loop()
+        executor = self.executor if self.executor is not None else _EXECUTOR
+        while True:
+            batch = await self._collect()
+            batch = [(x, f) for x, f in batch if not f.cancelled()]
+            if not batch:
+                continue
+            items = [x for x, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    executor, self.batch_func, items
+                )
+                if len(results) != len(items):
+                    raise ValueError(
+                        "batch_func returned {0} results for {1} items".format(
+                            len(results), len(items)
+                        )
+                    )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+def ner_batcher(ner, pos: bool = True, tag: bool = False, **kwargs):
+    """
+    Create a :class:`MicroBatcher` for :meth:`pythainlp.tag.NER.tag_batch`.
+
+    Each micro-batch is tagged in one call of `tag_batch`, so
+    engines with batched inference (*wangchanberta*, *lst20_onnx*)
+    run one forward pass for up to `max_batch_size` concurrent requests.
+
+    :param pythainlp.tag.NER ner: named-entity tagger
+    :param bool pos: output with part-of-speech tag
+    :param bool tag: output like html tag
+    :param kwargs: parameters of :class:`MicroBatcher`
+    :return: batcher, submit a text and get the output of
+        :meth:`pythainlp.tag.NER.tag`
+    :rtype: MicroBatcher
+
+    :Example:
+    ::
+
+        from pythainlp import aio
+        from pythainlp.tag import NER
+
+        batcher = aio.ner_batcher(NER("lst20_onnx"), max_batch_size=16)
+        await batcher.submit("แมวทำอะไรตอนห้าโมงเช้า")
+    """
+    batch_size = kwargs.get("max_batch_size", 32)
+    return MicroBatcher(
+        partial(ner.tag_batch, pos=pos, tag=tag, batch_size=batch_size),
+        **kwargs,
+    )
+
+
+def translate_batcher(translator, **kwargs):
+    """
+    Create a :class:`MicroBatcher` for
+    :meth:`pythainlp.translate.Translate.translate_batch`.
+
+    :param pythainlp.translate.Translate translator: translator
+    :param kwargs: parameters of :class:`MicroBatcher`
+    :return: batcher, submit a text and get its translation
+    :rtype: MicroBatcher
+    """
+    batch_size = kwargs.get("max_batch_size", 32)
+    return MicroBatcher(
+        partial(translator.translate_batch, batch_size=batch_size), **kwargs
+    )
+
+
+def normalize_batcher(**kwargs):
+    """
+    Create a :class:`MicroBatcher` for
+    :func:`pythainlp.util.normalize_batch`.
+
+    :param kwargs: parameters of :class:`MicroBatcher`
+    :return: batcher, submit a text and get the normalized text
+    :rtype: MicroBatcher
+    """
+    from pythainlp.util import normalize_batch
+
+    return MicroBatcher(normalize_batch, **kwargs)
+
+
+def summarize_batcher(
+    n: int = 1, engine: str = "frequency", tokenizer: str = "newmm", **kwargs
+):
+    """
+    Create a :class:`MicroBatcher` for
+    :func:`pythainlp.summarize.summarize_batch`.
+
+    :param int n: number of sentences to be included in each summary
+    :param str engine: text summarization engine
+    :param str tokenizer: word tokenizer engine name
+    :param kwargs: parameters of :class:`MicroBatcher`
+    :return: batcher, submit a text and get its summary
+    :rtype: MicroBatcher
+    """
+    from pythainlp.summarize import summarize_batch
+
+    batch_size = kwargs.get("max_batch_size", 32)
+    return MicroBatcher(
+        partial(
+            summarize_batch,
+            n=n,
+            engine=engine,
+            tokenizer=tokenizer,
+            batch_size=batch_size,
+        ),
+        **kwargs,
+    )
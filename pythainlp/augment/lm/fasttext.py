@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 from gensim.models.fasttext import FastText as FastText_gensim
+from pythainlp.augment.word2vec.core import Word2VecAug
 from pythainlp.tokenize import word_tokenize
 from gensim.models.keyedvectors import KeyedVectors
 import itertools
@@ -23,6 +24,7 @@ class FastTextAug:
         else:
             self.model = FastText_gensim.load(model_path)
         self.dict_wv = list(self.model.key_to_index.keys())
+        self.aug = Word2VecAug(self.model, self.tokenize, type="model")
 
     def tokenize(self, text: str) -> List[str]:
         """
@@ -41,19 +43,7 @@ class FastTextAug:
         :param float p: probability
         :rtype: List[List[str]]
         """
-        list_sent_new = []
-        for i in sent:
-            if i in self.dict_wv:
-                w = [
-                    j for j, v in self.model.most_similar(i) if v >= p
-                ]
-                if w == []:
-                    list_sent_new.append([i])
-                else:
-                    list_sent_new.append(w)
-            else:
-                list_sent_new.append([i])
-        return list_sent_new
+        return self.aug.modify_sent(sent, p=p)
 
     def augment(
         self, sentence: str, n_sent: int = 1, p: float = 0.7
@@ -73,7 +63,21 @@ class FastTextAug:
         """
         self.sentence = self.tokenize(sentence)
         self.list_synonym = self.modify_sent(self.sentence, p=p)
-        new_sentences = []
-        for x in list(itertools.product(*self.list_synonym))[0:n_sent]:
-            new_sentences.append(x)
-        return new_sentences
+        return list(
+            itertools.islice(itertools.product(*self.list_synonym), n_sent)
+        )
+
+    def augment_batch(
+        self, sentences: Iterable[str], n_sent: int = 1, p: float = 0.7
+    ) -> List[List[Tuple[str]]]:
+        """
+        Text Augment from FastText for many sentences
+
+        :param Iterable[str] sentences: thai sentences
+        :param int n_sent: number sentence
+        :param float p: Probability of word
+
+        :return: list of synonyms of each sentence
+        :rtype: List[List[Tuple[str]]]
+        """
+        return self.aug.augment_batch(sentences, n_sent, p=p)
@@ -1,16 +1,29 @@
 # -*- coding: utf-8 -*-
 from transformers import (
+    AutoModelForMaskedLM,
     CamembertTokenizer,
     pipeline,
 )
-import random
-from typing import List
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+import torch
 
 model_name = "airesearch/wangchanberta-base-att-spm-uncased"
 
 
 class Thai2transformersAug:
-    def __init__(self):
+    """
+    Text Augment using wangchanberta
+
+    :param bool quantize: quantize linear layers of the model to int8
+        (dynamic quantization, faster on CPU)
+    :param str onnx_path: path of wangchanberta masked language model
+        exported to ONNX. If given, the model is run by
+        `onnxruntime <https://onnxruntime.ai/>`_ instead of PyTorch.
+    """
+    def __init__(
+        self, quantize: bool = False, onnx_path: Optional[str] = None
+    ):
         self.model_name = "airesearch/wangchanberta-base-att-spm-uncased"
         self.target_tokenizer = CamembertTokenizer
         self.tokenizer = CamembertTokenizer.from_pretrained(
@@ -21,34 +34,111 @@ class Thai2transformersAug:
             '</s>NOTUSED',
             '<_>'
         ]
-        self.fill_mask = pipeline(
-            task='fill-mask',
-            tokenizer=self.tokenizer,
-            model=f'{self.model_name}',
-            revision='main'
-        )
+        if onnx_path is None:
+            self.model = AutoModelForMaskedLM.from_pretrained(
+                self.model_name,
+                revision='main'
+            )
+            if quantize:
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            self.model.eval()
+            self.fill_mask = pipeline(
+                task='fill-mask',
+                tokenizer=self.tokenizer,
+                model=self.model
+            )
+            self.session = None
+        else:
+            from onnxruntime import (
+                GraphOptimizationLevel,
+                InferenceSession,
+                SessionOptions,
+            )
+            options = SessionOptions()
+            options.graph_optimization_level = (
+                GraphOptimizationLevel.ORT_ENABLE_ALL
+            )
+            self.model = None
+            self.fill_mask = None
+            self.session = InferenceSession(
+                onnx_path,
+                sess_options=options,
+                providers=['CPUExecutionProvider']
+            )
+            self._onnx_inputs = [i.name for i in self.session.get_inputs()]
         self.MASK_TOKEN = self.tokenizer.mask_token
 
+    def _mask_logits(self, inputs: dict) -> Tuple[np.ndarray, List[int]]:
+        # logits at the (last) mask token of each sequence,
+        # and position of the mask token
+        input_ids = inputs["input_ids"]
+        positions = [
+            np.nonzero(ids == self.tokenizer.mask_token_id)[0][-1]
+            for ids in input_ids
+        ]
+        rows = np.arange(len(input_ids))
+        if self.session is None:
+            with torch.no_grad():
+                logits = self.model(
+                    **{k: torch.from_numpy(v) for k, v in inputs.items()}
+                ).logits
+            return logits[rows, positions].numpy(), positions
+        logits = self.session.run(
+            None, {k: inputs[k] for k in self._onnx_inputs}
+        )[0]
+        return logits[rows, positions], positions
+
+    def fill_mask_batch(
+        self, texts: List[str], top_k: int = 5, batch_size: int = 32
+    ) -> List[List[str]]:
+        """
+        Predict the mask token of many texts.
+
+        Texts are sorted by length and run through the model in padded
+        batches. The result of each text is the same as the sequences
+        of the `fill-mask` pipeline.
+
+        :param List[str] texts: texts, each with a mask token
+        :param int top_k: number of predictions of each text
+        :param int batch_size: number of texts in a batch
+
+        :return: list of predicted sequences of each text,
+            highest score first
+        :rtype: List[List[str]]
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        results = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            inputs = dict(
+                self.tokenizer(
+                    [texts[i] for i in batch],
+                    padding=True,
+                    return_tensors="np"
+                )
+            )
+            inputs = {k: v.astype(np.int64) for k, v in inputs.items()}
+            logits, positions = self._mask_logits(inputs)
+            top = np.argsort(-logits, axis=1, kind="stable")[:, :top_k]
+            for b, i in enumerate(batch):
+                sequences = []
+                for token_id in top[b]:
+                    tokens = inputs["input_ids"][b].copy()
+                    tokens[positions[b]] = token_id
+                    tokens = tokens[tokens != self.tokenizer.pad_token_id]
+                    sequences.append(
+                        self.tokenizer.decode(
+                            tokens, skip_special_tokens=True
+                        )
+                    )
+                results[i] = sequences
+        return results
+
     def generate(self, sentence: str, num_replace_tokens: int = 3):
-        self.sent2 = []
         self.input_text = sentence
-        sent = [
-            i for i in self.tokenizer.tokenize(self.input_text) if i != '▁'
-        ]
-        if len(sent) < num_replace_tokens:
-            num_replace_tokens = len(sent)
-        masked_text = self.input_text
-        for i in range(num_replace_tokens):
-            replace_token = [
-                sent.pop(random.randrange(len(sent))) for _ in range(1)
-            ][0]
-            masked_text = masked_text+self.MASK_TOKEN
-            self.sent2 += [
-                str(j['sequence']).replace('<s> ', '').replace('</s>', '')
-                for j in self.fill_mask(masked_text)
-                if j['sequence'] not in self.sent2
-            ]
-            masked_text = self.input_text
+        self.sent2 = self.augment_batch([sentence], num_replace_tokens)[0]
         return self.sent2
 
     def augment(
@@ -80,3 +170,49 @@ class Thai2transformersAug:
         self.sent2 = []
         self.sent2 = self.generate(sentence, num_replace_tokens)
         return self.sent2
+
+    def augment_batch(
+        self,
+        sentences: Iterable[str],
+        num_replace_tokens: int = 3,
+        batch_size: int = 32
+    ) -> List[List[str]]:
+        """
+        Text Augment from wangchanberta for many sentences
+
+        Masked texts of all sentences are built first, and predicted
+        together in padded batches (see :meth:`fill_mask_batch`).
+
+        :param Iterable[str] sentences: thai sentences
+        :param int num_replace_tokens: number replace tokens
+        :param int batch_size: number of masked texts in a model batch
+
+        :return: list of text augment of each sentence
+        :rtype: List[List[str]]
+        """
+        sentences = list(sentences)
+        masked = {}  # sentence -> masked text
+        for sentence in dict.fromkeys(sentences):
+            sent = [
+                i for i in self.tokenizer.tokenize(sentence) if i != '▁'
+            ]
+            if min(num_replace_tokens, len(sent)) > 0:
+                masked[sentence] = sentence + self.MASK_TOKEN
+        queries = list(dict.fromkeys(masked.values()))
+        predictions = dict(
+            zip(queries, self.fill_mask_batch(queries, batch_size=batch_size))
+        )
+        results = []
+        for sentence in sentences:
+            if sentence not in masked:
+                results.append([])
+                continue
+            results.append(
+                list(
+                    dict.fromkeys(
+                        str(j).replace('<s> ', '').replace('</s>', '')
+                        for j in predictions[masked[sentence]]
+                    )
+                )
+            )
+        return results
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pythainlp.augment.word2vec.core import Word2VecAug
 from bpemb import BPEmb
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 
 class BPEmbAug:
@@ -61,3 +61,22 @@ class BPEmbAug:
                 self.t += j.replace('▁', '')
             self.temp_new.append(self.t)
         return self.temp_new
+
+    def augment_batch(
+        self, sentences: Iterable[str], n_sent: int = 1, p: float = 0.7
+    ) -> List[List[str]]:
+        """
+        Text Augment using word2vec from BPEmb for many sentences
+
+        :param Iterable[str] sentences: thai sentences
+        :param int n_sent: number sentence
+        :param float p: Probability of word
+
+        :return: list of synonyms of each sentence
+        :rtype: List[List[str]]
+        """
+        sentences = [sentence.replace(" ", "▁") for sentence in sentences]
+        return [
+            ["".join(j.replace('▁', '') for j in i) for i in temp]
+            for temp in self.aug.augment_batch(sentences, n_sent, p=p)
+        ]
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 import gensim.models.keyedvectors as word2vec
 import itertools
+import numpy as np
 
 
 class Word2VecAug:
@@ -23,6 +24,66 @@ class Word2VecAug:
         else:
             self.model = model
         self.dict_wv = list(self.model.key_to_index.keys())
+        # word -> 10 most similar (word, similarity), filled on demand
+        self._similar = {}
+
+    def most_similar_batch(
+        self, words: Iterable[str], topn: int = 10, batch_size: int = 32
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Find the most similar words of many words.
+
+        Similarities between a batch of words and the whole vocabulary
+        are computed in one matrix multiplication. The result for each
+        word is the same as `model.most_similar(word, topn=topn)`.
+        Words not in the vocabulary are skipped.
+
+        :param Iterable[str] words: words
+        :param int topn: number of similar words of each word
+        :param int batch_size: number of words compared with the
+            vocabulary at a time (memory used is
+            vocabulary size x `batch_size` floats)
+        :return: dict of word and its list of (similar word, similarity),
+            most similar first
+        :rtype: Dict[str, List[Tuple[str, float]]]
+        """
+        key_to_index = self.model.key_to_index
+        words = [w for w in dict.fromkeys(words) if w in key_to_index]
+        if not words:
+            return {}
+        self.model.fill_norms()
+        vectors = self.model.vectors
+        norms = self.model.norms
+        index_to_key = self.model.index_to_key
+        k = min(topn + 1, len(vectors))
+        results = {}
+        for start in range(0, len(words), batch_size):
+            batch = words[start:start + batch_size]
+            ids = np.array([key_to_index[w] for w in batch])
+            queries = vectors[ids] / norms[ids, np.newaxis]
+            sims = (vectors @ queries.T) / norms[:, np.newaxis]
+            if k < len(vectors):
+                top = np.argpartition(-sims, k - 1, axis=0)[:k]
+            else:
+                top = np.broadcast_to(
+                    np.arange(len(vectors))[:, np.newaxis], sims.shape
+                )
+            for j, word in enumerate(batch):
+                candidates = top[:, j]
+                candidates = candidates[
+                    np.argsort(-sims[candidates, j], kind="stable")
+                ]
+                results[word] = [
+                    (index_to_key[i], float(sims[i, j]))
+                    for i in candidates
+                    if i != ids[j]
+                ][:topn]
+        return results
+
+    def _fill_similar(self, words: Iterable[str]) -> None:
+        missing = [w for w in words if w not in self._similar]
+        if missing:
+            self._similar.update(self.most_similar_batch(missing))
 
     def modify_sent(self, sent: str, p: float = 0.7) -> List[List[str]]:
         """
@@ -30,12 +91,11 @@ class Word2VecAug:
         :param float p: probability
         :rtype: List[List[str]]
         """
+        self._fill_similar(sent)
         list_sent_new = []
         for i in sent:
-            if i in self.dict_wv:
-                w = [
-                    j for j, v in self.model.most_similar(i) if v >= p
-                ]
+            if i in self._similar:
+                w = [j for j, v in self._similar[i] if v >= p]
                 if w == []:
                     list_sent_new.append([i])
                 else:
@@ -60,7 +120,36 @@ class Word2VecAug:
         """
         self.sentence = self.tokenizer(sentence)
         self.list_synonym = self.modify_sent(self.sentence, p=p)
-        new_sentences = []
-        for x in list(itertools.product(*self.list_synonym))[0:n_sent]:
-            new_sentences.append(x)
-        return new_sentences
+        # only the first n_sent combinations are generated
+        return list(
+            itertools.islice(itertools.product(*self.list_synonym), n_sent)
+        )
+
+    def augment_batch(
+        self,
+        sentences: Iterable[str],
+        n_sent: int = 1,
+        p: float = 0.7
+    ) -> List[List[Tuple[str]]]:
+        """
+        Augment many sentences. Similar words of all words in
+        the sentences are looked up together.
+
+        :param Iterable[str] sentences: text sentences
+        :param int n_sent: max number for synonyms sentence
+        :param float p: probability
+
+        :return: list of synonyms of each sentence
+        :rtype: List[List[Tuple[str]]]
+        """
+        tokenized = [self.tokenizer(sentence) for sentence in sentences]
+        self._fill_similar(itertools.chain.from_iterable(tokenized))
+        return [
+            list(
+                itertools.islice(
+                    itertools.product(*self.modify_sent(tokens, p=p)),
+                    n_sent,
+                )
+            )
+            for tokens in tokenized
+        ]
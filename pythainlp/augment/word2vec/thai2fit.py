@@ -2,7 +2,7 @@
 from pythainlp.augment.word2vec.core import Word2VecAug
 from pythainlp.corpus import get_corpus_path
 from pythainlp.tokenize import THAI2FIT_TOKENIZER
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 
 class Thai2fitAug:
@@ -55,3 +55,21 @@ class Thai2fitAug:
             # output: [('พวกเรา', 'เรียน'), ('ฉัน', 'เรียน')]
         """
         return self.aug.augment(sentence, n_sent, p)
+
+    def augment_batch(
+        self,
+        sentences: Iterable[str],
+        n_sent: int = 1,
+        p: float = 0.7
+    ) -> List[List[Tuple[str]]]:
+        """
+        Text Augment using word2vec from Thai2Fit for many sentences
+
+        :param Iterable[str] sentences: thai sentences
+        :param int n_sent: number sentence
+        :param float p: Probability of word
+
+        :return: list of text augment of each sentence
+        :rtype: List[List[Tuple[str]]]
+        """
+        return self.aug.augment_batch(sentences, n_sent, p)
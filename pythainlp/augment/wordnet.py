@@ -8,10 +8,9 @@ __all__ = [
 ]
 
 from pythainlp.corpus import wordnet
-from collections import OrderedDict
 from pythainlp.tokenize import word_tokenize
-from pythainlp.tag import pos_tag
-from typing import List
+from pythainlp.tag import pos_tag, pos_tag_sents
+from typing import Iterable, List, Tuple
 from nltk.corpus import wordnet as wn
 import itertools
 
@@ -138,9 +137,17 @@ def postype2wordnet(pos: str, corpus: str):
 class WordNetAug:
     """
     Text Augment using wordnet
+
+    Synonyms are looked up in the synonym index of Thai WordNet
+    (see :func:`pythainlp.corpus.wordnet.synonym_index`),
+    which is built once and kept in the PyThaiNLP data directory.
+    With part-of-speech, only synonyms of that part of speech are used
+    (see :func:`postype2wordnet`).
+
+    :param str index_path: path of the synonym index file (optional)
     """
-    def __init__(self):
-        pass
+    def __init__(self, index_path: str = None):
+        self.index_path = index_path
 
     def find_synonyms(
         self,
@@ -152,29 +159,33 @@ class WordNetAug:
         Find synonyms from wordnet
 
         :param str word: word
-        :param str pos: part-of-speech type
+        :param str pos: part-of-speech type (`None` for all part of speech)
         :param str postag_corpus: postag corpus name
         :return: list of synonyms
         :rtype: List[str]
         """
-        self.synonyms = []
-        if pos is None:
-            self.list_synsets = wordnet.synsets(word)
-        else:
-            self.p2w_pos = postype2wordnet(pos, postag_corpus)
-            if self.p2w_pos != '':
-                self.list_synsets = wordnet.synsets(word, pos=self.p2w_pos)
-            else:
-                self.list_synsets = wordnet.synsets(word)
-
-        for self.synset in wordnet.synsets(word):
-            for self.syn in self.synset.lemma_names(lang='tha'):
-                self.synonyms.append(self.syn)
+        wordnet_pos = None
+        if pos is not None:
+            # part of speech without a wordnet type means all of them
+            wordnet_pos = postype2wordnet(pos, postag_corpus) or None
+        return wordnet.synonyms(word, pos=wordnet_pos, path=self.index_path)
 
-        self.synonyms_without_duplicates = list(
-            OrderedDict.fromkeys(self.synonyms)
+    def _synonym_sentences(
+        self,
+        list_pos: List[Tuple[str, str]],
+        max_syn_sent: int,
+        postag_corpus: str,
+    ) -> List[Tuple[str]]:
+        list_synonym = []
+        for word, pos in list_pos:
+            temp = self.find_synonyms(word, pos, postag_corpus)
+            if temp == []:
+                list_synonym.append([word])
+            else:
+                list_synonym.append(temp)
+        return list(
+            itertools.islice(itertools.product(*list_synonym), max_syn_sent)
         )
-        return self.synonyms_without_duplicates
 
     def augment(
         self,
@@ -210,29 +221,43 @@ class WordNetAug:
              ('เรา', 'ชอบ', 'ไปยัง', 'ร.ร.'),
              ('เรา', 'ชอบ', 'ไปยัง', 'รร.')]
         """
-        new_sentences = []
         self.list_words = tokenize(sentence)
-        self.list_synonym = []
-        self.p_all = 1
         if postag:
             self.list_pos = pos_tag(self.list_words, corpus=postag_corpus)
-            for word, pos in self.list_pos:
-                self.temp = self.find_synonyms(word, pos, postag_corpus)
-                if self.temp == []:
-                    self.list_synonym.append([word])
-                else:
-                    self.list_synonym.append(self.temp)
-                    self.p_all *= len(self.temp)
         else:
-            for word in self.list_words:
-                self.temp = self.find_synonyms(word)
-                if self.temp == []:
-                    self.list_synonym.append([word])
-                else:
-                    self.list_synonym.append(self.temp)
-                    self.p_all *= len(self.temp)
-        if max_syn_sent > self.p_all:
-            max_syn_sent = self.p_all
-        for x in list(itertools.product(*self.list_synonym))[0:max_syn_sent]:
-            new_sentences.append(x)
-        return new_sentences
+            self.list_pos = [(word, None) for word in self.list_words]
+        return self._synonym_sentences(
+            self.list_pos, max_syn_sent, postag_corpus
+        )
+
+    def augment_batch(
+        self,
+        sentences: Iterable[str],
+        tokenize: object = word_tokenize,
+        max_syn_sent: int = 6,
+        postag: bool = True,
+        postag_corpus: str = "lst20"
+    ) -> List[List[Tuple[str]]]:
+        """
+        Text Augment using wordnet for many sentences
+
+        :param Iterable[str] sentences: thai sentences
+        :param object tokenize: function for tokenize word
+        :param int max_syn_sent: max number for synonyms sentence
+        :param bool postag: on part-of-speech
+        :param str postag_corpus: postag corpus name
+
+        :return: list of synonyms of each sentence
+        :rtype: List[List[Tuple[str]]]
+        """
+        list_words = [tokenize(sentence) for sentence in sentences]
+        if postag:
+            list_pos = pos_tag_sents(list_words, corpus=postag_corpus)
+        else:
+            list_pos = [
+                [(word, None) for word in words] for words in list_words
+            ]
+        return [
+            self._synonym_sentences(pos, max_syn_sent, postag_corpus)
+            for pos in list_pos
+        ]
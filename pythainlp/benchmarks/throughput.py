@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of batch APIs, compared with calling the single-item API
+once per item.
+"""
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+NER_SENTENCES = [
+    "วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.",
+    "ทดสอบนายวรรณพงษ์ ภัททิยไพบูลย์",
+    "แมวทำอะไรตอนห้าโมงเช้า",
+    "บริษัทซีพีออลล์เปิดสาขาใหม่ที่จังหวัดเชียงใหม่เมื่อวานนี้",
+    "นายกรัฐมนตรีเดินทางไปประชุมที่กรุงโตเกียว ประเทศญี่ปุ่น",
+]
+
+NORMALIZE_TEXTS = [
+    "เเปลก  แต่\u200bจริง นานาาา",
+    "วันนี้อากาศดีีีี่่่  มากกก\n\n\nไปเที่ยวกันไหม",
+    "กา า  า  า ฤๅษี นๅคา นํา",
+    "่้สวัสดีครับ   ยินดีที่ได้รู้จัก",
+    "บริษัทซีพีออลล์เปิดสาขาใหม่ที่จังหวัดเชียงใหม่เมื่อวานนี้",
+]
+
+
+def _timed(func: Callable, *args, **kwargs) -> Tuple[object, float]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _check_same(name: str, expected: list, actual: list) -> None:
+    if expected != actual:
+        raise ValueError(f"{name} gives results different from one by one")
+
+
+def _repeat(samples: List[str], n: int) -> List[str]:
+    return [samples[i % len(samples)] for i in range(n)]
+
+
+def ner_batch(
+    n: int = 500, batch_size: int = 16, engine: str = "lst20_onnx"
+) -> Dict[str, float]:
+    """
+    Measure the CPU throughput of :meth:`pythainlp.tag.NER.tag_batch`
+    against :meth:`pythainlp.tag.NER.tag` called once per sentence.
+
+    :param int n: number of sentences
+    :param int batch_size: number of sentences in one forward pass
+    :param str engine: named-entity engine
+    :return: sentences per second of *tag* and *tag_batch*
+    :rtype: Dict[str, float]
+
+    :Example:
+    ::
+
+        from pythainlp.benchmarks.throughput import ner_batch
+
+        ner_batch(500, batch_size=16)
+        # output: {'tag': ..., 'tag_batch': ...}
+    """
+    from pythainlp.tag import NER
+
+    texts = _repeat(NER_SENTENCES, n)
+    ner = NER(engine)
+    ner.tag(texts[0], pos=False)  # warm up
+
+    single, t_single = _timed(
+        lambda: [ner.tag(text, pos=False) for text in texts]
+    )
+    batched, t_batch = _timed(
+        ner.tag_batch, texts, pos=False, batch_size=batch_size
+    )
+    _check_same("tag_batch", single, batched)
+    return {"tag": n / t_single, "tag_batch": n / t_batch}
+
+
+def normalize_batch(n: int = 100000) -> Dict[str, float]:
+    """
+    Measure the throughput of :func:`pythainlp.util.normalize_batch`
+    against :func:`pythainlp.util.normalize` called once per text.
+
+    The texts repeat, like messages in a chat log, so most of the gain
+    of *normalize_batch* is from normalizing each distinct text once.
+
+    :param int n: number of texts
+    :return: texts per second of *normalize* and *normalize_batch*
+    :rtype: Dict[str, float]
+    """
+    from pythainlp.util import normalize, normalize_batch
+
+    texts = _repeat(NORMALIZE_TEXTS, n)
+    single, t_single = _timed(lambda: [normalize(text) for text in texts])
+    batched, t_batch = _timed(normalize_batch, texts)
+    _check_same("normalize_batch", single, batched)
+    return {"normalize": n / t_single, "normalize_batch": n / t_batch}
+
+
+def soundex_batch(
+    words: Optional[Iterable[str]] = None,
+    engines: Iterable[str] = (
+        "udom83",
+        "lk82",
+        "metasound",
+        "prayut_and_somchaip",
+    ),
+    max_workers: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Measure the throughput of :func:`pythainlp.soundex.soundex_batch`
+    against :func:`pythainlp.soundex.soundex` called once per word.
+
+    *soundex_batch* is run twice for each engine; the second run
+    gets the codes from its cache.
+
+    :param Iterable[str] words: words (default: Thai word list,
+        :func:`pythainlp.corpus.thai_words`)
+    :param Iterable[str] engines: soundex engines
+    :param int max_workers: number of worker processes of *soundex_batch*
+    :return: words per second, keyed by *<engine> soundex*,
+        *<engine> soundex_batch* and *<engine> cached*
+    :rtype: Dict[str, float]
+    """
+    from pythainlp.soundex import soundex, soundex_batch
+
+    if words is None:
+        from pythainlp.corpus import thai_words
+
+        words = thai_words()
+    words = list(words)
+    n = len(words)
+    result = {}
+    for engine in engines:
+        single, t_single = _timed(
+            lambda: [soundex(word, engine=engine) for word in words]
+        )
+        batched, t_batch = _timed(
+            soundex_batch, words, engine=engine, max_workers=max_workers
+        )
+        _, t_cached = _timed(
+            soundex_batch, words, engine=engine, max_workers=max_workers
+        )
+        _check_same("soundex_batch", single, batched)
+        result[f"{engine} soundex"] = n / t_single
+        result[f"{engine} soundex_batch"] = n / t_batch
+        result[f"{engine} cached"] = n / t_cached
+    return result
@@ -2,10 +2,12 @@
 import sys
 from argparse import ArgumentParser
 
-from pythainlp.cli import data, soundex, tag, tokenize, benchmark
+from pythainlp.cli import data, soundex, tag, tokenize, benchmark, warmup
 
 # a command should be a verb when possible
-COMMANDS = sorted(["data", "soundex", "tag", "tokenize", "benchmark"])
+COMMANDS = sorted(
+    ["data", "soundex", "tag", "tokenize", "benchmark", "warmup"]
+)
 
 CLI_NAME = "thainlp"
 
@@ -7,7 +7,7 @@ import os
 
 import yaml
 from pythainlp import cli
-from pythainlp.benchmarks import word_tokenization
+from pythainlp.benchmarks import throughput, word_tokenization
 
 
 def _read_file(path):
@@ -22,17 +22,24 @@ class App:
             prog="benchmark",
             description=(
                 "Benchmark for various tasks;\n"
-                "currently, we have only for word tokenization."
+                "quality of word tokenization and throughput of batch APIs."
             ),
             usage=(
                 "thainlp benchmark [task] [task-options]\n\n"
                 "tasks:\n\n"
-                "word-tokenization      benchmark word tokenization\n\n"
+                "word-tokenization      benchmark word tokenization\n"
+                "ner-batch              throughput of NER.tag_batch\n"
+                "normalize              throughput of normalize_batch\n"
+                "soundex                throughput of soundex_batch\n\n"
                 "--"
             ),
         )
 
-        parser.add_argument("task", type=str, help="[word-tokenization]")
+        parser.add_argument(
+            "task",
+            type=str,
+            help="[word-tokenization|ner-batch|normalize|soundex]",
+        )
 
         args = parser.parse_args(argv[2:3])
         cli.exit_if_empty(args.task, parser)
@@ -41,8 +48,75 @@ class App:
         task_argv = argv[3:]
         if task == "word-tokenization":
             WordTokenizationBenchmark(task, task_argv)
+        elif task == "ner-batch":
+            NERBatchBenchmark(task, task_argv)
+        elif task == "normalize":
+            NormalizeBenchmark(task, task_argv)
+        elif task == "soundex":
+            SoundexBenchmark(task, task_argv)
+
+
+def _print_throughput(result: dict, unit: str) -> None:
+    print("============== Benchmark Result ==============")
+    for name, value in result.items():
+        print(f"{name:>40s} {value:.1f} {unit}/s")
+
+
+class NERBatchBenchmark:
+    def __init__(self, name, argv):
+        parser = argparse.ArgumentParser(**cli.make_usage("benchmark " + name))
+
+        parser.add_argument(
+            "-n", type=int, default=500, help="Number of sentences"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=16,
+            help="Number of sentences in one forward pass",
+        )
+        parser.add_argument(
+            "--engine", default="lst20_onnx", help="Named-entity engine"
+        )
+
+        args = parser.parse_args(argv)
+        _print_throughput(
+            throughput.ner_batch(
+                args.n, batch_size=args.batch_size, engine=args.engine
+            ),
+            "sentences",
+        )
 
 
+
+class NormalizeBenchmark:
+    def __init__(self, name, argv):
+        parser = argparse.ArgumentParser(**cli.make_usage("benchmark " + name))
+
+        parser.add_argument(
+            "-n", type=int, default=100000, help="Number of texts"
+        )
+
+        args = parser.parse_args(argv)
+        _print_throughput(throughput.normalize_batch(args.n), "texts")
+
+
+class SoundexBenchmark:
+    def __init__(self, name, argv):
+        parser = argparse.ArgumentParser(**cli.make_usage("benchmark " + name))
+
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=None,
+            help="Number of worker processes of soundex_batch",
+        )
+
+        args = parser.parse_args(argv)
+        _print_throughput(
+            throughput.soundex_batch(max_workers=args.max_workers), "words"
+        )
+
 class WordTokenizationBenchmark:
     def __init__(self, name, argv):
         parser = argparse.ArgumentParser(**cli.make_usage("benchmark " + name))
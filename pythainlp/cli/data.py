@@ -19,6 +19,9 @@ class App:
                 "info <dataset_name>    show information about the dataset\n"
                 "get <dataset_name>     download the dataset\n"
                 "rm <dataset_name>      remove the dataset\n"
+                "pack <bundle_path> <dataset_name>...\n"
+                "                       pack datasets into a bundle file\n"
+                "unpack <bundle_path>   install datasets from a bundle file\n"
                 "path                   show full path to data directory\n\n"
                 "Example:\n\n"
                 "thainlp data get thai2fit_wv\n\n"
@@ -26,6 +29,9 @@ class App:
                 f"{get_pythainlp_data_path()}\n\n"
                 "To change PyThaiNLP data path, set the operating system's\n"
                 "PYTHAINLP_DATA_DIR environment variable.\n\n"
+                "To download datasets from a mirror (e.g. an unpacked bundle),\n"
+                "set the PYTHAINLP_MIRROR environment variable to its\n"
+                "directory or URL.\n\n"
                 "For more information about corpora that PyThaiNLP use, see:\n"
                 "https://github.com/PyThaiNLP/pythainlp-corpus/\n\n"
                 "--"
@@ -34,7 +40,7 @@ class App:
         parser.add_argument(
             "subcommand",
             type=str,
-            choices=["catalog", "info", "get", "rm", "path"],
+            choices=["catalog", "info", "get", "rm", "pack", "unpack", "path"],
             help="action on dataset/corpus",
         )
         args = parser.parse_args(argv[2:3])
@@ -68,6 +74,49 @@ class App:
         else:
             print("Not found.")
 
+    def pack(self, argv):
+        parser = argparse.ArgumentParser(
+            description="Pack datasets into a bundle file",
+            usage="thainlp data pack <bundle_path> <dataset_name>...",
+        )
+        parser.add_argument(
+            "bundle_path", type=str, help="path of the bundle file",
+        )
+        parser.add_argument(
+            "dataset_name", type=str, nargs="+", help="dataset/corpus's name",
+        )
+        args = parser.parse_args(argv[3:])
+        if corpus.pack_bundle(args.dataset_name, args.bundle_path):
+            print("Packed successfully.")
+        else:
+            print("Not found.")
+
+    def unpack(self, argv):
+        parser = argparse.ArgumentParser(
+            description="Install datasets from a bundle file",
+            usage="thainlp data unpack <bundle_path> [--workers N] [--force]",
+        )
+        parser.add_argument(
+            "bundle_path", type=str, help="path of the bundle file",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="number of datasets installed at the same time",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="install even if the dataset is already in the device",
+        )
+        args = parser.parse_args(argv[3:])
+        results = corpus.unpack_bundle(
+            args.bundle_path, force=args.force, max_workers=args.workers
+        )
+        for name, ok in results.items():
+            print(f"- {name}: {'installed' if ok else 'failed'}")
+
     def info(self, argv):
         parser = argparse.ArgumentParser(
             description="Print information about a dataset",
@@ -0,0 +1,57 @@
+"""
+thainlp warmup command line.
+
+Load models of engines ahead of time and report loading time.
+"""
+import argparse
+
+from pythainlp.tools.preload import (
+    DEFAULT_PRELOAD_COMPONENTS,
+    preload,
+    preload_components,
+)
+
+
+class App:
+    def __init__(self, argv):
+        parser = argparse.ArgumentParser(
+            prog="warmup",
+            description="Load (and download if needed) models of engines.",
+            usage=(
+                "thainlp warmup [-j workers] [component ...]\n\n"
+                "components:\n\n"
+                + "\n".join(preload_components())
+                + "\n\n"
+                "Default components are "
+                f"{', '.join(DEFAULT_PRELOAD_COMPONENTS)}.\n\n"
+                "Example:\n\n"
+                "thainlp warmup newmm thainer\n\n"
+                "--"
+            ),
+        )
+        parser.add_argument(
+            "components",
+            type=str,
+            nargs="*",
+            help="components to be loaded",
+        )
+        parser.add_argument(
+            "-j",
+            "--workers",
+            dest="max_workers",
+            type=int,
+            help="maximum number of threads",
+            default=None,
+        )
+
+        args = parser.parse_args(argv[2:])
+
+        unknown = set(args.components) - set(preload_components())
+        if unknown:
+            parser.error(f"unknown components: {', '.join(sorted(unknown))}")
+
+        timings = preload(
+            args.components or None, max_workers=args.max_workers
+        )
+        for name, seconds in timings.items():
+            print(f"{name}: {seconds:.3f} s")
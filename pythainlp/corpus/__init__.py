@@ -12,6 +12,7 @@ __all__ = [
     "corpus_db_url",
     "countries",
     "download",
+    "download_many",
     "get_corpus",
     "get_corpus_db",
     "get_corpus_db_detail",
@@ -28,6 +29,8 @@ __all__ = [
     "thai_words",
     "path_pythainlp_corpus",
     "get_path_folder_corpus",
+    "pack_bundle",
+    "unpack_bundle",
 ]
 
 import os
@@ -67,7 +70,16 @@ def corpus_path() -> str:
 def corpus_db_url() -> str:
     """
     Get remote URL of corpus catalog.
+
+    If the environment variable :envvar:`PYTHAINLP_MIRROR` is set to
+    a local directory or an URL of a mirror (e.g. an unpacked corpus
+    bundle, see :func:`pack_bundle`), the catalog of the mirror is used.
     """
+    mirror = os.getenv("PYTHAINLP_MIRROR")
+    if mirror:
+        if "://" in mirror:
+            return mirror.rstrip("/") + "/" + _CORPUS_DB_FILENAME
+        return os.path.join(mirror, _CORPUS_DB_FILENAME)
     return _CORPUS_DB_URL
 
 
@@ -80,6 +92,7 @@ def corpus_db_path() -> str:
 
 from pythainlp.corpus.core import (
     download,
+    download_many,
     get_corpus,
     get_corpus_db,
     get_corpus_db_detail,
@@ -100,3 +113,4 @@ from pythainlp.corpus.common import (
     thai_syllables,
     thai_words,
 )
+from pythainlp.corpus.bundle import pack_bundle, unpack_bundle
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Corpus bundles, for installing corpora without internet access.
+
+A bundle is a tar archive of corpus files and their catalog (db.json),
+in the same format as the remote corpus catalog, with download URLs
+relative to the catalog. An unpacked bundle can also be used as a mirror
+(see :func:`pythainlp.corpus.corpus_db_url`).
+"""
+import hashlib
+import io
+import json
+import os
+import tarfile
+import tempfile
+from typing import Dict, Iterable
+
+from pythainlp.corpus import corpus_db_url
+from pythainlp.corpus.core import (
+    _file_md5,
+    download,
+    download_many,
+    get_corpus_db,
+    get_corpus_db_detail,
+)
+from pythainlp.tools import get_full_data_path, get_pythainlp_data_path
+
+_BUNDLE_DB_FILENAME = "db.json"
+
+
+def pack_bundle(names: Iterable[str], path: str, url: str = None) -> bool:
+    """
+    Pack corpora into a bundle file.
+
+    Corpora that are not in the device are downloaded first.
+    MD5 of each corpus file is recorded in the catalog of the bundle,
+    and checked when the bundle is unpacked.
+
+    :param Iterable[str] names: corpus names
+    :param str path: path of the bundle file (tar archive)
+    :param str url: URL of the corpus catalog
+    :return: **True** if all corpora are packed. Otherwise,
+             it returns **False** and no bundle is written.
+    :rtype: bool
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import pack_bundle
+
+        pack_bundle(["thai2fit_wv", "thainer"], "pythainlp-bundle.tar")
+        # output: True
+    """
+    if not url:
+        url = corpus_db_url()
+    corpus_db = get_corpus_db(url)
+    if not corpus_db:
+        print(f"Cannot download corpus catalog from: {url}")
+        return False
+    corpus_db = corpus_db.json()
+
+    bundle_db = {}
+    files = []
+    for name in dict.fromkeys(names):
+        detail = get_corpus_db_detail(name)
+        if not detail and download(name, url=url):
+            detail = get_corpus_db_detail(name)
+        if not detail:
+            print("Corpus not found:", name)
+            return False
+        version = detail["version"]
+        if version not in corpus_db.get(name, {}).get("versions", {}):
+            print(f"Corpus not found in catalog: {name} {version}")
+            return False
+        file_name = detail["filename"]
+        file_md5 = hashlib.md5()
+        _file_md5(get_full_data_path(file_name), file_md5)
+
+        entry = {k: v for k, v in corpus_db[name].items() if k != "versions"}
+        entry["latest_version"] = version
+        entry["versions"] = {
+            version: dict(
+                corpus_db[name]["versions"][version],
+                download_url=file_name,
+                md5=file_md5.hexdigest(),
+            )
+        }
+        bundle_db[name] = entry
+        files.append(file_name)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with tarfile.open(tmp_path, "w") as tar:
+        data = json.dumps(bundle_db, ensure_ascii=False).encode("utf-8")
+        info = tarfile.TarInfo(_BUNDLE_DB_FILENAME)
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+        for file_name in files:
+            tar.add(get_full_data_path(file_name), arcname=file_name)
+    os.replace(tmp_path, path)
+    return True
+
+
+def unpack_bundle(
+    path: str, force: bool = False, max_workers: int = 4
+) -> Dict[str, bool]:
+    """
+    Install corpora from a bundle file made by :func:`pack_bundle`,
+    or from a directory with an unpacked bundle.
+
+    Corpora are installed concurrently (see :func:`download_many`),
+    and the hash of each corpus file is checked.
+
+    :param str path: path of the bundle file or directory
+    :param bool force: install even if the corpus is already
+                       in the device
+    :param int max_workers: maximum number of corpora installed
+                            at the same time
+    :return: dict of corpus name and **True** if the corpus is
+             succesfully installed, **False** otherwise.
+    :rtype: Dict[str, bool]
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import unpack_bundle
+
+        unpack_bundle("pythainlp-bundle.tar")
+        # output: {'thai2fit_wv': True, 'thainer': True}
+    """
+    if os.path.isdir(path):
+        return _install_from_dir(path, force, max_workers)
+
+    # extract next to the data, so installing is a copy on the same disk
+    with tempfile.TemporaryDirectory(dir=get_pythainlp_data_path()) as tmp:
+        with tarfile.open(path) as tar:
+            members = tar.getmembers()
+            for member in members:
+                if (
+                    os.path.isabs(member.name)
+                    or ".." in member.name.split("/")
+                    or not (member.isfile() or member.isdir())
+                ):
+                    raise ValueError(
+                        f"Unsafe path in bundle: {member.name}"
+                    )
+            tar.extractall(path=tmp, members=members)
+        return _install_from_dir(tmp, force, max_workers)
+
+
+def _install_from_dir(
+    path: str, force: bool, max_workers: int
+) -> Dict[str, bool]:
+    catalog_path = os.path.join(path, _BUNDLE_DB_FILENAME)
+    with open(catalog_path, "r", encoding="utf-8-sig") as f:
+        names = list(json.load(f))
+    return download_many(
+        names, force=force, url=catalog_path, max_workers=max_workers
+    )
@@ -5,9 +5,13 @@ Corpus related functions.
 
 import hashlib
 import os
-from typing import Union
-from urllib.request import urlopen
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple, Union
 import json
+import marshal
+from urllib.parse import urljoin
 
 import requests
 from pythainlp.corpus import corpus_db_path, corpus_db_url, corpus_path
@@ -18,19 +22,115 @@ import zipfile
 import shutil
 from pythainlp import __version__
 
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
 
 _CHECK_MODE = os.getenv("PYTHAINLP_READ_MODE")
+_CHUNK_SIZE = 64 * 1024  # 64 KiB
+# (connect, read) timeout of HTTP requests, in seconds
+_HTTP_TIMEOUT = (10, 60)
+# serializes read-modify-write of the local catalog between threads
+_DB_LOCK = threading.Lock()
+# data file -> lock, so a file is not downloaded by two threads at once
+_file_locks = {}
+# path -> ((mtime, size), catalog, corpus name -> keys in "_default")
+_catalog_cache = {}
+# (path, as_is) -> ((mtime, size), lines or frozenset of lines)
+_corpus_cache = {}
+# filename -> (corpus lines, word frequencies, unigram frequencies)
+_word_freqs_cache = {}
+# parsed corpus files are kept in this directory of the data directory,
+# if enabled by this environment variable
+_SNAPSHOT_DIR = "corpus_snapshots"
+_SNAPSHOT_ENV = "PYTHAINLP_CORPUS_SNAPSHOT"
+_SNAPSHOT_VERSION = 1
+
+
+def _cached_catalog(path: str) -> Tuple[dict, Dict[str, List[str]]]:
+    """
+    Read a catalog file, cached until the file is modified.
+
+    The catalog and the index must not be modified by the caller.
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _catalog_cache.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            catalog = json.load(f)
+        index = {}
+        for key, corpus in catalog.get("_default", {}).items():
+            index.setdefault(corpus["name"], []).append(key)
+        cached = (stamp, catalog, index)
+        _catalog_cache[path] = cached
+    return cached[1], cached[2]
+
+
+@contextmanager
+def _file_lock(lock_path: str):
+    """
+    Hold an exclusive OS lock on a lock file, against other processes.
+    The lock file is created if it does not exist, and is kept.
+    """
+    with open(lock_path, "a") as lock_file:
+        if os.name == "nt":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _locked_local_db():
+    """
+    Lock the local catalog for read-modify-write, against other threads
+    and other processes (with a lock file next to the catalog).
+    """
+    with _DB_LOCK, _file_lock(corpus_db_path() + ".lock"):
+        with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
+            yield json.load(f)
+
+
+def _write_local_db(local_db: dict) -> None:
+    """
+    Replace the local catalog. Call within _locked_local_db().
+    """
+    path = corpus_db_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(local_db, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    _catalog_cache.pop(path, None)
 
 
 def get_corpus_db(url: str) -> requests.Response:
     """
-    Get corpus catalog from server.
+    Get corpus catalog from server, or from a local file
+    (a path or a file:// URL).
 
     :param str url: URL corpus catalog
     """
     corpus_db = None
     try:
-        corpus_db = requests.get(url)
+        if not _is_http(url):
+            with open(_local_path(url), "rb") as f:
+                corpus_db = requests.Response()
+                corpus_db.status_code = 200
+                corpus_db.url = url
+                corpus_db._content = f.read()
+            return corpus_db
+        corpus_db = requests.get(url, timeout=_HTTP_TIMEOUT)
     except HTTPError as http_err:
         print(f"HTTP error occurred: {http_err}")
     except Exception as err:
@@ -39,6 +139,27 @@ def get_corpus_db(url: str) -> requests.Response:
     return corpus_db
 
 
+def _is_http(url: str) -> bool:
+    return url.startswith(("http://", "https://"))
+
+
+def _local_path(url: str) -> str:
+    if url.startswith("file://"):
+        return url[len("file://"):]
+    return url
+
+
+def _resolve_url(url: str, catalog_url: str) -> str:
+    """
+    Resolve a download URL relative to the URL of its catalog.
+    """
+    if "://" in url or os.path.isabs(url):
+        return url
+    if _is_http(catalog_url):
+        return urljoin(catalog_url, url)
+    return os.path.join(os.path.dirname(_local_path(catalog_url)), url)
+
+
 def get_corpus_db_detail(name: str, version: str = None) -> dict:
     """
     Get details about a corpus, using information from local catalog.
@@ -47,17 +168,11 @@ def get_corpus_db_detail(name: str, version: str = None) -> dict:
     :return: details about a corpus
     :rtype: dict
     """
-    with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
-        local_db = json.load(f)
-
-    if version is None:
-        for corpus in local_db["_default"].values():
-            if corpus["name"] == name:
-                return corpus
-    else:
-        for corpus in local_db["_default"].values():
-            if corpus["name"] == name and corpus["version"] == version:
-                return corpus
+    local_db, index = _cached_catalog(corpus_db_path())
+    for key in index.get(name, []):
+        corpus = local_db["_default"][key]
+        if version is None or corpus["version"] == version:
+            return dict(corpus)
 
     return dict()
 
@@ -86,6 +201,10 @@ def get_corpus(filename: str, as_is: bool = False) -> Union[frozenset, list]:
     If as_is is True, a list will be return, with no modifications
     in member values and their orders.
 
+    The result is cached until the file is modified. If the environment
+    variable :envvar:`PYTHAINLP_CORPUS_SNAPSHOT` is set to 1, parsed lines
+    are also saved in the data directory (keyed by the hash of the file),
+    so the file is not parsed again by other processes.
 
     :param str filename: filename of the corpus to be read
 
@@ -109,15 +228,112 @@ def get_corpus(filename: str, as_is: bool = False) -> Union[frozenset, list]:
         #     ...})
     """
     path = path_pythainlp_corpus(filename)
-    lines = []
-    with open(path, "r", encoding="utf-8-sig") as fh:
-        lines = fh.read().splitlines()
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _corpus_cache.get((path, as_is))
+    if cached is None or cached[0] != stamp:
+        lines = _read_corpus(path, as_is)
+        cached = (stamp, lines if as_is else frozenset(lines))
+        _corpus_cache[(path, as_is)] = cached
 
     if as_is:
-        return lines
+        return list(cached[1])
+    return cached[1]
+
 
-    lines = [line.strip() for line in lines]
-    return frozenset(filter(None, lines))
+def _word_freqs(
+    filename: str,
+) -> Tuple[Tuple[Tuple[str, int], ...], Dict[str, int]]:
+    """
+    Parse a word frequency corpus file (lines of word and frequency,
+    separated by tab) into word frequencies and unigram frequencies.
+
+    Parsed again only if :func:`get_corpus` reads the file again.
+    The results must not be modified by the caller.
+    """
+    lines = get_corpus(filename)
+    cached = _word_freqs_cache.get(filename)
+    if cached is None or cached[0] is not lines:
+        word_freqs = []
+        unigram = {}
+        for line in lines:
+            word_freq = line.split("\t")
+            if len(word_freq) >= 2:
+                word_freqs.append((word_freq[0], int(word_freq[1])))
+                unigram[word_freq[0]] = int(word_freq[-1])
+        cached = (lines, tuple(word_freqs), unigram)
+        _word_freqs_cache[filename] = cached
+    return cached[1], cached[2]
+
+
+def _read_corpus(path: str, as_is: bool) -> List[str]:
+    """
+    Read lines of a corpus file (stripped, non-empty and unique lines
+    if not as_is).
+
+    If snapshots are enabled, parsed lines are saved in a snapshot file
+    in the data directory, named by the MD5 of the corpus file, and
+    the snapshot is read instead of parsing the file again, also by other
+    processes. Only the snapshot of the latest version of each corpus
+    file is kept. Lines are kept as one UTF-16 text, which is decoded
+    much faster than UTF-8 for Thai.
+    """
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if os.getenv(_SNAPSHOT_ENV) != "1":
+        return _parse_corpus(data, as_is)
+    prefix = os.path.basename(path) + "."
+    suffix = ".{}.{}".format("list" if as_is else "set", _SNAPSHOT_VERSION)
+    snapshot_path = os.path.join(
+        get_full_data_path(_SNAPSHOT_DIR),
+        prefix + hashlib.md5(data).hexdigest() + suffix,
+    )
+    try:
+        with open(snapshot_path, "rb") as fh:
+            count, text = marshal.load(fh)
+        lines = text.decode("utf-16-le").split("\n") if count else []
+        if len(lines) == count:
+            return lines
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    lines = _parse_corpus(data, as_is)
+    if _CHECK_MODE != "1":
+        _write_snapshot(snapshot_path, lines, prefix, suffix)
+    return lines
+
+
+def _parse_corpus(data: bytes, as_is: bool) -> List[str]:
+    # same lines as reading in text mode and splitlines()
+    lines = data.decode("utf-8-sig").splitlines()
+    if not as_is:
+        lines = list(dict.fromkeys(filter(None, map(str.strip, lines))))
+    return lines
+
+
+def _write_snapshot(
+    path: str, lines: List[str], prefix: str, suffix: str
+) -> None:
+    data = marshal.dumps((len(lines), "\n".join(lines).encode("utf-16-le")))
+    folder = os.path.dirname(path)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(folder, exist_ok=True)
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+        # snapshots of older versions of the corpus file
+        for name in os.listdir(folder):
+            old_path = os.path.join(folder, name)
+            if (
+                name.startswith(prefix)
+                and name.endswith(suffix)
+                and old_path != path
+            ):
+                os.remove(old_path)
+    except OSError:  # e.g. read-only data directory, the snapshot is optional
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def get_corpus_default_db(name: str, version: str = None) -> Union[str, None]:
@@ -133,11 +349,10 @@ def get_corpus_default_db(name: str, version: str = None) -> Union[str, None]:
         you can edit in pythainlp/corpus/default_db.json
     """
     default_db_path = path_pythainlp_corpus("default_db.json")
-    with open(default_db_path, encoding="utf-8-sig") as fh:
-        corpus_db = json.load(fh)
+    corpus_db, _ = _cached_catalog(default_db_path)
 
-    if name in list(corpus_db.keys()):
-        if version in list(corpus_db[name]["versions"].keys()):
+    if name in corpus_db:
+        if version in corpus_db[name]["versions"]:
             return path_pythainlp_corpus(
                 corpus_db[name]["versions"][version]["filename"]
             )
@@ -193,7 +408,7 @@ def get_corpus_path(name: str,  version: str = None, force: bool = False) -> Uni
     _CUSTOMIZE = {
         # "the corpus name":"path"
     }
-    if name in list(_CUSTOMIZE.keys()):
+    if name in _CUSTOMIZE:
         return _CUSTOMIZE[name]
 
     default_path = get_corpus_default_db(name=name, version=version)
@@ -222,36 +437,124 @@ def get_corpus_path(name: str,  version: str = None, force: bool = False) -> Uni
     return None
 
 
-def _download(url: str, dst: str) -> int:
+def _download(url: str, dst: str, md5: str = None) -> int:
     """
     Download helper.
 
+    The file is downloaded to a temporary file (dst + ".part"),
+    which is renamed to dst only after the download is complete
+    and its hash matches. If the temporary file is left by
+    an interrupted download, the download resumes from its end
+    (with an HTTP Range request). The url can also be a local file.
+    The download is locked against other threads and other processes
+    (with a lock file next to dst), so they do not write to the same
+    temporary file.
+
     @param: url to download file
     @param: dst place to put the file
+    @param: md5 expected MD5 of the file ("-" or None to skip the check)
     """
-    _CHUNK_SIZE = 64 * 1024  # 64 KiB
+    path = get_full_data_path(dst)
+    with _DB_LOCK:
+        lock = _file_locks.setdefault(path, threading.Lock())
+    with lock, _file_lock(path + ".lock"):
+        return _download_locked(url, path, dst, md5)
 
-    file_size = int(urlopen(url).info().get("Content-Length", -1))
-    r = requests.get(url, stream=True)
-    with open(get_full_data_path(dst), "wb") as f:
+
+def _download_locked(url: str, path: str, dst: str, md5: str) -> int:
+    part_path = path + ".part"
+    file_md5 = hashlib.md5()
+
+    if not _is_http(url):
+        # local file, e.g. in a mirror directory
+        with open(_local_path(url), "rb") as src, open(part_path, "wb") as f:
+            for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
+                f.write(chunk)
+                file_md5.update(chunk)
+    else:
+        file_md5 = _download_http(url, dst, part_path)
+
+    if md5 and md5 != "-" and md5 != file_md5.hexdigest():
+        os.remove(part_path)
+        raise Exception("Hash does not match expected.")
+    os.replace(part_path, path)
+    return os.path.getsize(path)
+
+
+def _download_http(url: str, dst: str, part_path: str):
+    """
+    Download to part_path, resuming from its end if it exists.
+
+    @return: MD5 hash object of the whole file
+    """
+    file_md5 = hashlib.md5()
+    offset = 0
+    if os.path.exists(part_path):
+        offset = _file_md5(part_path, file_md5)
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    r = requests.get(
+        url, stream=True, headers=headers, timeout=_HTTP_TIMEOUT
+    )
+    if offset and r.status_code == 416:
+        r.close()
+        if _content_range_total(r.headers.get("Content-Range")) == offset:
+            # the temporary file is already complete
+            return file_md5
+        # the temporary file is longer than the file, start again
+        os.remove(part_path)
+        return _download_http(url, dst, part_path)
+    r.raise_for_status()
+    if offset and r.status_code != 206:
+        # the server does not support Range, start again
+        offset = 0
+        file_md5 = hashlib.md5()
+
+    file_size = offset + int(r.headers.get("Content-Length", 0))
+    with open(part_path, "ab" if offset else "wb") as f:
         pbar = None
         try:
             from tqdm.auto import tqdm
 
-            pbar = tqdm(total=int(r.headers["Content-Length"]))
+            pbar = tqdm(total=file_size, initial=offset, desc=dst)
         except ImportError:
             pbar = None
 
         for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
             if chunk:
                 f.write(chunk)
+                file_md5.update(chunk)
                 if pbar:
                     pbar.update(len(chunk))
         if pbar:
             pbar.close()
         else:
             print("Done.")
-    return file_size
+    return file_md5
+
+
+def _content_range_total(content_range: str) -> int:
+    """
+    Get the complete length from a Content-Range header,
+    e.g. 1234 from "bytes */1234". It is -1 if unknown.
+    """
+    total = (content_range or "").rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else -1
+
+
+def _file_md5(path: str, file_md5) -> int:
+    """
+    Update hash object with content of a file, read in chunks.
+
+    @param: path file to hash
+    @param: file_md5 hash object
+    @return: size of the file
+    """
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            file_md5.update(chunk)
+            size += len(chunk)
+    return size
 
 
 def _check_hash(dst: str, md5: str) -> None:
@@ -262,12 +565,10 @@ def _check_hash(dst: str, md5: str) -> None:
     @param: md5 place to hash the file (MD5)
     """
     if md5 and md5 != "-":
-        with open(get_full_data_path(dst), "rb") as f:
-            content = f.read()
-            file_md5 = hashlib.md5(content).hexdigest()
-
-            if md5 != file_md5:
-                raise Exception("Hash does not match expected.")
+        file_md5 = hashlib.md5()
+        _file_md5(get_full_data_path(dst), file_md5)
+        if md5 != file_md5.hexdigest():
+            raise Exception("Hash does not match expected.")
 
 
 def _version2int(v: str) -> int:
@@ -376,12 +677,80 @@ def download(
         print(f"Cannot download corpus catalog from: {url}")
         return False
 
+    return _download_corpus(name, corpus_db.json(), force, version, url)
+
+
+def download_many(
+    names: Iterable[str],
+    force: bool = False,
+    url: str = None,
+    max_workers: int = 4,
+) -> Dict[str, bool]:
+    """
+    Download many corpora concurrently.
+
+    The corpus catalog is downloaded once, then each corpus is
+    downloaded as in :func:`download`, with `max_workers` downloads
+    at the same time.
+
+    :param Iterable[str] names: corpus names
+    :param bool force: force download
+    :param str url: URL of the corpus catalog
+    :param int max_workers: maximum number of concurrent downloads
+    :return: dict of corpus name and **True** if the corpus is found
+             and succesfully downloaded, **False** otherwise.
+    :rtype: Dict[str, bool]
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import download_many
+
+        download_many(["thai2fit_wv", "thainer", "pos_lst20_perceptron"])
+        # output:
+        # {'thai2fit_wv': True, 'thainer': True,
+        #  'pos_lst20_perceptron': True}
+    """
+    names = list(dict.fromkeys(names))
+    if _CHECK_MODE == "1":
+        print("PyThaiNLP is read-only mode. It can't download.")
+        return {name: False for name in names}
+    if not url:
+        url = corpus_db_url()
+
+    corpus_db = get_corpus_db(url)
+    if not corpus_db:
+        print(f"Cannot download corpus catalog from: {url}")
+        return {name: False for name in names}
     corpus_db = corpus_db.json()
 
+    def _download_one(name: str) -> bool:
+        try:
+            return _download_corpus(name, corpus_db, force, None, url)
+        except Exception as err:
+            print(f"Cannot download {name}: {err}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_download_one, names))
+    return dict(zip(names, results))
+
+
+def _find_local_corpus(local_db: dict, name: str) -> str:
+    for i, item in local_db["_default"].items():
+        # Do not check version here
+        if item["name"] == name:
+            # Record corpus no. if found in local database
+            return i
+    return ""
+
+
+def _download_corpus(
+    name: str, corpus_db: dict, force: bool, version: str, catalog_url: str
+) -> bool:
     # check if corpus is available
     if name in corpus_db:
-        with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
-            local_db = json.load(f)
+        local_db, index = _cached_catalog(corpus_db_path())
 
         corpus = corpus_db[name]
         print("Corpus:", name)
@@ -401,22 +770,15 @@ def download(
             return False
         corpus_versions = corpus["versions"][version]
         file_name = corpus_versions["filename"]
-        found = ""
-        for i, item in local_db["_default"].items():
-            # Do not check version here
-            if item["name"] == name:
-                # Record corpus no. if found in local database
-                found = i
-                break
+        found = index[name][0] if name in index else ""
 
         # If not found in local, download
         if force or not found:
             print(f"- Downloading: {name} {version}")
             _download(
-                corpus_versions["download_url"], file_name,
-            )
-            _check_hash(
-                file_name, corpus_versions["md5"],
+                _resolve_url(corpus_versions["download_url"], catalog_url),
+                file_name,
+                corpus_versions["md5"],
             )
 
             is_folder = False
@@ -439,30 +801,32 @@ def download(
                 ) as zip:
                     zip.extractall(path=get_full_data_path(foldername))
 
-            if found:
-                local_db["_default"][found]["version"] = version
-                local_db["_default"][found]["filename"] = file_name
-                local_db["_default"][found]["is_folder"] = is_folder
-                local_db["_default"][found]["foldername"] = foldername
-            else:
-                # This awkward behavior is for backward-compatibility with
-                # database files generated previously using TinyDB
-                if local_db["_default"]:
-                    corpus_no = max((
-                        int(no) for no in local_db["_default"]
-                    )) + 1
+            # read again, other downloads may have updated the catalog
+            with _locked_local_db() as local_db:
+                found = _find_local_corpus(local_db, name)
+                if found:
+                    local_db["_default"][found]["version"] = version
+                    local_db["_default"][found]["filename"] = file_name
+                    local_db["_default"][found]["is_folder"] = is_folder
+                    local_db["_default"][found]["foldername"] = foldername
                 else:
-                    corpus_no = 1
-                local_db["_default"][str(corpus_no)] = {
-                    "name": name,
-                    "version": version,
-                    "filename": file_name,
-                    "is_folder": is_folder,
-                    "foldername": foldername
-                }
-
-            with open(corpus_db_path(), "w", encoding="utf-8") as f:
-                json.dump(local_db, f, ensure_ascii=False)
+                    # This awkward behavior is for backward-compatibility
+                    # with database files generated previously using TinyDB
+                    if local_db["_default"]:
+                        corpus_no = max((
+                            int(no) for no in local_db["_default"]
+                        )) + 1
+                    else:
+                        corpus_no = 1
+                    local_db["_default"][str(corpus_no)] = {
+                        "name": name,
+                        "version": version,
+                        "filename": file_name,
+                        "is_folder": is_folder,
+                        "foldername": foldername
+                    }
+
+                _write_local_db(local_db)
         # Check if versions match if the corpus is found in local database
         # but a re-download is not forced
         else:
@@ -511,11 +875,8 @@ def remove(name: str) -> bool:
     if _CHECK_MODE == "1":
         print("PyThaiNLP is read-only mode. It can't remove corpus.")
         return False
-    with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
-        db = json.load(f)
-    data = [
-        corpus for corpus in db["_default"].values() if corpus["name"] == name
-    ]
+    db, index = _cached_catalog(corpus_db_path())
+    data = [db["_default"][key] for key in index.get(name, [])]
 
     if data:
         path = get_corpus_path(name)
@@ -524,11 +885,11 @@ def remove(name: str) -> bool:
             shutil.rmtree(path, ignore_errors=True)
         else:
             os.remove(path)
-        for i, corpus in db["_default"].copy().items():
-            if corpus["name"] == name:
-                del db["_default"][i]
-        with open(corpus_db_path(), "w", encoding="utf-8") as f:
-            json.dump(db, f, ensure_ascii=False)
+        with _locked_local_db() as db:
+            for i, corpus in db["_default"].copy().items():
+                if corpus["name"] == name:
+                    del db["_default"][i]
+            _write_local_db(db)
         return True
 
     return False
@@ -13,15 +13,14 @@ __all__ = [
 from collections import defaultdict
 from typing import List, Tuple
 
-from pythainlp.corpus import get_corpus
 from pythainlp.corpus import get_corpus_path
+from pythainlp.corpus.core import _word_freqs
 
 
 _FILENAME = "tnc_freq.txt"
 _BIGRAM = "tnc_bigram_word_freqs"
 _TRIGRAM = "tnc_trigram_word_freqs"
 
-
 def word_freqs() -> List[Tuple[str, int]]:
     """
     Get word frequency from Thai National Corpus (TNC)
@@ -30,28 +29,14 @@ def word_freqs() -> List[Tuple[str, int]]:
 
     Credit: Korakot Chaovavanich https://bit.ly/3wSkZsF
     """
-    lines = list(get_corpus(_FILENAME))
-    word_freqs = []
-    for line in lines:
-        word_freq = line.split("\t")
-        if len(word_freq) >= 2:
-            word_freqs.append((word_freq[0], int(word_freq[1])))
-
-    return word_freqs
+    return list(_word_freqs(_FILENAME)[0])
 
 
 def unigram_word_freqs() -> defaultdict:
     """
     Get unigram word frequency from Thai National Corpus (TNC)
     """
-    lines = list(get_corpus(_FILENAME))
-    _word_freqs = defaultdict(int)
-    for i in lines:
-        _temp = i.strip().split("	")
-        if len(_temp) >= 2:
-            _word_freqs[_temp[0]] = int(_temp[-1])
-
-    return _word_freqs
+    return defaultdict(int, _word_freqs(_FILENAME)[1])
 
 
 def bigram_word_freqs() -> defaultdict:
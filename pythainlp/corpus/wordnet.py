@@ -8,8 +8,15 @@ except that lang (language) argument will be "tha" (Thai) by default.
 For more on usage, see NLTK Howto:
 https://www.nltk.org/howto/wordnet.html
 """
+import gzip
+import json
+import os
+from typing import Dict, List
+
 import nltk
 
+from pythainlp.tools import get_pythainlp_data_path
+
 try:
     nltk.data.find("corpora/omw")
 except LookupError:
@@ -438,3 +445,131 @@ def custom_lemmas(tab_file, lang: str):
         :param str lang: abbreviation of language (i.e. *eng*, *tha*).
     """
     return wordnet.custom_lemmas(tab_file, lang)
+
+
+# part of speech of lists in the synonym index, "" is for all
+_SYNONYM_INDEX_POS = ("", "n", "v", "a", "r")
+_SYNONYM_INDEX_VERSION = 1
+# path -> loaded synonym index
+_synonym_indexes = {}
+
+
+def _synonym_index_path(lang: str) -> str:
+    return os.path.join(
+        get_pythainlp_data_path(), f"wordnet_synonyms_{lang}.json.gz"
+    )
+
+
+def build_synonym_index(path: str = None, lang: str = "tha") -> str:
+    """
+        This function exports synonyms of all lemmas of the language
+        to a synonym index file, so synonyms can be looked up
+        by :func:`synonyms` without NLTK WordNet.
+
+        Synonyms of a word are lemma names of synsets of the word,
+        without duplicates, for all part of speech and for
+        each of *n*, *v*, *a*, and *r*.
+
+        :param str path: path of the index file. By default, it is
+                         in the PyThaiNLP data directory.
+        :param str lang: abbreviation of language (i.e. *eng*, *tha*).
+                         By default, it is *tha*.
+
+        :return: path of the index file
+        :rtype: str
+    """
+    if path is None:
+        path = _synonym_index_path(lang)
+    index = {}
+    for lemma_name in sorted(wordnet.all_lemma_names(lang=lang)):
+        word = lemma_name.lower()
+        if word in index:
+            continue
+        entry = {}
+        for pos in _SYNONYM_INDEX_POS:
+            names = dict.fromkeys(
+                name
+                for synset in wordnet.synsets(
+                    lemma=word, pos=pos or None, lang=lang
+                )
+                for name in synset.lemma_names(lang=lang)
+            )
+            if names:
+                entry[pos] = list(names)
+        if entry:
+            index[word] = entry
+    data = {
+        "version": _SYNONYM_INDEX_VERSION,
+        "lang": lang,
+        "index": index,
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    _synonym_indexes.pop(path, None)
+    return path
+
+
+def synonym_index(
+    path: str = None, lang: str = "tha"
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+        This function loads a synonym index exported by
+        :func:`build_synonym_index`. If the index file does not exist,
+        it is built first. The index is loaded once per path.
+
+        :param str path: path of the index file. By default, it is
+                         in the PyThaiNLP data directory.
+        :param str lang: abbreviation of language (i.e. *eng*, *tha*).
+                         By default, it is *tha*.
+
+        :return: dict of word, part of speech ("" for all), and synonyms
+        :rtype: dict[str, dict[str, list[str]]]
+    """
+    if path is None:
+        path = _synonym_index_path(lang)
+    if path not in _synonym_indexes:
+        if not os.path.exists(path):
+            build_synonym_index(path, lang=lang)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _SYNONYM_INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported synonym index version: {data.get('version')}"
+            )
+        _synonym_indexes[path] = data["index"]
+    return _synonym_indexes[path]
+
+
+def synonyms(
+    word: str, pos: str = None, lang: str = "tha", path: str = None
+) -> List[str]:
+    """
+        This function returns synonyms of a word from the synonym index
+        (see :func:`synonym_index`). The result is lemma names of synsets
+        of the word as it is written in the index, without duplicates.
+        For *tha*, it is the same as lemma names of :func:`synsets`.
+        For *eng*, :func:`synsets` also finds synsets of the base form
+        of the word (e.g. *dogs*), but this function does not.
+
+        :param str word: word
+        :param str pos: the part of speech constraint (i.e. *n* for Noun,
+                        *v* for Verb, *a* for Adjective, and *r* for Adverb).
+                        By default, *pos* is **None**.
+        :param str lang: abbreviation of language (i.e. *eng*, *tha*).
+                         By default, it is *tha*.
+        :param str path: path of the index file
+
+        :return: list of synonyms
+        :rtype: list[str]
+
+        :Example:
+
+            >>> from pythainlp.corpus.wordnet import synonyms
+            >>>
+            >>> synonyms("โรงเรียน")
+            ['ร.ร.', 'รร.', 'โรงเรียน', 'อาคารเรียน']
+    """
+    entry = synonym_index(path, lang=lang).get(word.lower(), {})
+    return list(entry.get(pos or "", []))
@@ -3,6 +3,7 @@
 PyThaiNLP Parse
 """
 __all__ = [
-    "dependency_parsing"
+    "dependency_parsing",
+    "dependency_parsing_stream",
 ]
-from pythainlp.parse.core import dependency_parsing
+from pythainlp.parse.core import dependency_parsing, dependency_parsing_stream
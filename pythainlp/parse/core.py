@@ -1,21 +1,62 @@
 # -*- coding: utf-8 -*-
-from typing import List, Union
+import threading
+from typing import Iterable, Iterator, List, Union
 
 
-_tagger = None
-_tagger_name = ""
+# model of each engine when model is None, so both share a parser
+_DEFAULT_MODELS = {
+    "esupar": "th",
+    "transformers_ud": "KoichiYasuoka/deberta-base-thai-ud-head",
+    "spacy_thai": None,  # the engine has only one model
+}
+# (engine, model) -> parser, least recently used first
+_taggers = {}
+_taggers_lock = threading.Lock()
+# maximum number of parsers kept in memory
+_TAGGER_CACHE_SIZE = 2
 
-def dependency_parsing(text: str, model: str=None, tag: str="str", engine: str="esupar")->Union[List[List[str]], str]:
+
+def _get_tagger(engine: str, model: str):
+    if engine not in _DEFAULT_MODELS:
+        raise NotImplementedError(
+            "The engine doesn't support."
+        )
+    if model is None or engine == "spacy_thai":
+        model = _DEFAULT_MODELS[engine]
+    key = (engine, model)
+    with _taggers_lock:
+        tagger = _taggers.pop(key, None)
+        if tagger is None:
+            if engine == "esupar":
+                from pythainlp.parse.esupar_engine import Parse
+                tagger = Parse(model=model)
+            elif engine == "transformers_ud":
+                from pythainlp.parse.transformers_ud import Parse
+                tagger = Parse(model=model)
+            else:
+                from pythainlp.parse.spacy_thai_engine import Parse
+                tagger = Parse()
+            while len(_taggers) >= _TAGGER_CACHE_SIZE:
+                del _taggers[next(iter(_taggers))]
+        _taggers[key] = tagger
+        return tagger
+
+
+def dependency_parsing(text: Union[str, List[str]], model: str=None, tag: str="str", engine: str="esupar")->Union[List[List[str]], str, list]:
     """
     Dependency Parsing
 
-    :param str text: text to do dependency parsing
+    Parsers of the two most recently used engines and models are kept,
+    so they are not loaded again.
+
+    :param str text: text to do dependency parsing, \
+        or list of texts
     :param str model: model for using with engine \
         (for esupar and transformers_ud)
     :param str tag: output type (str or list)
     :param str engine: the name dependency parser
-    :return: str (conllu) or List
-    :rtype: Union[List[List[str]], str]
+    :return: str (conllu) or List, or list of them if `text` is a list
+    :rtype: Union[List[List[str]], str, list]
 
     **Options for engine**
         * *esupar* (default) - Tokenizer POS-tagger and Dependency-parser \
@@ -78,20 +119,38 @@ def dependency_parsing(text: str, model: str=None, tag: str="str", engine: str="
         # 2       เป็น             VERB    VSTA    _       0       ROOT    _       SpaceAfter=No
         # 3       คนดี             NOUN    NCMN    _       2       obj     _       SpaceAfter=No
     """
-    global _tagger, _tagger_name
-    if _tagger_name != engine:
-        if engine == "esupar":
-            from pythainlp.parse.esupar_engine import Parse
-            _tagger = Parse(model=model)
-        elif engine == "transformers_ud":
-            from pythainlp.parse.transformers_ud import Parse
-            _tagger = Parse(model=model)
-        elif engine == "spacy_thai":
-            from pythainlp.parse.spacy_thai_engine import Parse
-            _tagger = Parse()
-        else:
-            raise NotImplementedError(
-                "The engine doesn't support."
-            )
-    _tagger_name = engine
+    _tagger = _get_tagger(engine, model)
+    if isinstance(text, list):
+        return [_tagger(t, tag=tag) for t in text]
     return _tagger(text, tag=tag)
+
+
+def dependency_parsing_stream(texts: Iterable[str], model: str=None, engine: str="esupar")->Iterator[str]:
+    """
+    Dependency Parsing of many texts, in CoNLL-U format
+
+    Texts are parsed one by one as the result is iterated, so a large
+    corpus can be written to a file without keeping all results
+    in memory. Each result ends with a blank line.
+
+    :param Iterable[str] texts: texts to do dependency parsing
+    :param str model: model for using with engine \
+        (see :func:`dependency_parsing`)
+    :param str engine: the name dependency parser \
+        (see :func:`dependency_parsing`)
+    :return: iterator of CoNLL-U of each text
+    :rtype: Iterator[str]
+
+    :Example:
+    ::
+
+        from pythainlp.parse import dependency_parsing_stream
+
+        with open("corpus.conllu", "w", encoding="utf-8") as f:
+            f.writelines(
+                dependency_parsing_stream(texts, engine="transformers_ud")
+            )
+    """
+    _tagger = _get_tagger(engine, model)
+    for text in texts:
+        yield _tagger(text, tag="str").rstrip("\n") + "\n\n"
@@ -11,6 +11,7 @@ The source: https://huggingface.co/KoichiYasuoka/deberta-base-thai-ud-head
 GitHub: https://github.com/KoichiYasuoka
 """
 import os
+from itertools import accumulate
 from typing import List, Union
 import numpy
 import torch
@@ -26,9 +27,11 @@ from transformers.utils import cached_file
 
 
 class Parse:
-    def __init__(self, model: str="KoichiYasuoka/deberta-base-thai-ud-head") -> None:
+    def __init__(self, model: str="KoichiYasuoka/deberta-base-thai-ud-head", batch_size: int=32) -> None:
         if model == None:
             model = "KoichiYasuoka/deberta-base-thai-ud-head"
+        # number of masked queries (one per word) run in a forward pass
+        self.batch_size=batch_size
         self.tokenizer=AutoTokenizer.from_pretrained(model)
         self.model=AutoModelForQuestionAnswering.from_pretrained(model)
         x=AutoModelForTokenClassification.from_pretrained
@@ -57,13 +60,16 @@ class Parse:
         for i,t in enumerate(v):
             q=[self.tokenizer.cls_token_id]+t+[self.tokenizer.sep_token_id]
             c.append([q]+v[0:i]+[[self.tokenizer.mask_token_id]]+v[i+1:]+[[q[-1]]])
-        b=[[len(sum(x[0:j+1],[])) for j in range(len(x))] for x in c]
+        b=[list(accumulate(len(y) for y in x)) for x in c]
+        s,e=[],[]
         with torch.no_grad():
-            d=self.model(
-                input_ids=torch.tensor([sum(x,[]) for x in c]),
-                token_type_ids=torch.tensor([[0]*x[0]+[1]*(x[-1]-x[0]) for x in b])
-            )
-        s,e=d.start_logits.tolist(),d.end_logits.tolist()
+            for k in range(0,n,self.batch_size):
+                d=self.model(
+                    input_ids=torch.tensor([sum(x,[]) for x in c[k:k+self.batch_size]]),
+                    token_type_ids=torch.tensor([[0]*x[0]+[1]*(x[-1]-x[0]) for x in b[k:k+self.batch_size]])
+                )
+                s+=d.start_logits.tolist()
+                e+=d.end_logits.tolist()
         for i in range(n):
             for j in range(n):
                 m[i+1,0 if i==j else j+1]=s[i][b[i][j]]+e[i][b[i][j+1]-1]
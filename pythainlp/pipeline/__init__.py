@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+Text preprocessing pipeline.
+"""
+
+__all__ = [
+    "Pipeline",
+    "stage_names",
+]
+
+from pythainlp.pipeline.core import Pipeline, stage_names
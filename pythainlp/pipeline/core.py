@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+Composable text preprocessing pipeline.
+
+A pipeline is a list of stages. Stages before tokenization work on
+a string, stages after tokenization work on a list of tokens.
+Neighbouring stages that are plain character mappings
+(:meth:`str.translate` tables) are fused into one table,
+so they cost one pass over the text.
+"""
+import importlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# kinds of stages
+_TEXT = "text"  # str -> str
+_TOKENIZE = "tokenize"  # str -> List[str]
+_TOKENS = "tokens"  # List[str] -> List[str]
+
+# name: (kind, module, function name, translate table name)
+# Modules are imported when a stage is used, so pipelines with only
+# light stages do not import heavy dependencies (e.g. ulmfit needs torch).
+_STAGES = {
+    "normalize": (_TEXT, "pythainlp.util.normalize", "normalize", None),
+    "remove_dangling": (
+        _TEXT, "pythainlp.util.normalize", "remove_dangling", None
+    ),
+    "remove_dup_spaces": (
+        _TEXT, "pythainlp.util.normalize", "remove_dup_spaces", None
+    ),
+    "remove_repeat_vowels": (
+        _TEXT, "pythainlp.util.normalize", "remove_repeat_vowels", None
+    ),
+    "remove_tonemark": (
+        _TEXT, "pythainlp.util.normalize", "remove_tonemark",
+        "_TONEMARKS_TABLE",
+    ),
+    "remove_zw": (
+        _TEXT, "pythainlp.util.normalize", "remove_zw", "_ZERO_WIDTH_TABLE"
+    ),
+    "reorder_vowels": (
+        _TEXT, "pythainlp.util.normalize", "reorder_vowels", None
+    ),
+    "arabic_digit_to_thai_digit": (
+        _TEXT, "pythainlp.util.digitconv", "arabic_digit_to_thai_digit",
+        "_arabic_thai_translate_table",
+    ),
+    "thai_digit_to_arabic_digit": (
+        _TEXT, "pythainlp.util.digitconv", "thai_digit_to_arabic_digit",
+        "_thai_arabic_translate_table",
+    ),
+    "emoji_to_thai": (
+        _TEXT, "pythainlp.util.emojiconv", "emoji_to_thai", None
+    ),
+    "fix_html": (_TEXT, "pythainlp.ulmfit.preprocess", "fix_html", None),
+    "replace_rep_after": (
+        _TEXT, "pythainlp.ulmfit.preprocess", "replace_rep_after", None
+    ),
+    "replace_rep_nonum": (
+        _TEXT, "pythainlp.ulmfit.preprocess", "replace_rep_nonum", None
+    ),
+    "replace_url": (
+        _TEXT, "pythainlp.ulmfit.preprocess", "replace_url", None
+    ),
+    "rm_brackets": (
+        _TEXT, "pythainlp.ulmfit.preprocess", "rm_brackets", None
+    ),
+    "rm_useless_newlines": (
+        _TEXT, "pythainlp.ulmfit.preprocess", "rm_useless_newlines", None
+    ),
+    "rm_useless_spaces": (
+        _TEXT, "pythainlp.ulmfit.preprocess", "rm_useless_spaces", None
+    ),
+    "spec_add_spaces": (
+        _TEXT, "pythainlp.ulmfit.preprocess", "spec_add_spaces", None
+    ),
+    "word_tokenize": (
+        _TOKENIZE, "pythainlp.tokenize", "word_tokenize", None
+    ),
+    # maiyamok tokenizes a string, or works on a list of tokens
+    "maiyamok": (_TOKENIZE, "pythainlp.util.normalize", "maiyamok", None),
+    "lowercase_all": (
+        _TOKENS, "pythainlp.ulmfit.preprocess", "lowercase_all", None
+    ),
+    "remove_space": (
+        _TOKENS, "pythainlp.ulmfit.preprocess", "remove_space", None
+    ),
+    "replace_wrep_post": (
+        _TOKENS, "pythainlp.ulmfit.preprocess", "replace_wrep_post", None
+    ),
+    "replace_wrep_post_nonum": (
+        _TOKENS, "pythainlp.ulmfit.preprocess", "replace_wrep_post_nonum",
+        None,
+    ),
+    "ungroup_emoji": (
+        _TOKENS, "pythainlp.ulmfit.preprocess", "ungroup_emoji", None
+    ),
+}
+
+DEFAULT_STEPS = ["normalize", "word_tokenize"]
+
+Step = Union[str, Callable, Tuple[str, Dict[str, Any]]]
+
+
+def stage_names() -> List[str]:
+    """
+    Get names of built-in stages that can be used in :class:`Pipeline`.
+
+    :return: list of stage names
+    :rtype: List[str]
+    """
+    return sorted(_STAGES.keys())
+
+
+def _merge_tables(first: dict, second: dict) -> dict:
+    """
+    Make one translate table that does the same as
+    `text.translate(first).translate(second)`.
+    """
+    table = {}
+    for key, value in first.items():
+        if value is None:
+            table[key] = None
+            continue
+        if isinstance(value, int):
+            value = chr(value)
+        table[key] = value.translate(second)
+    for key, value in second.items():
+        if key not in table:
+            table[key] = value
+    return table
+
+
+def _translate(text: str, table: dict) -> str:
+    return text.translate(table)
+
+
+def _run_chunk(pipeline: "Pipeline", texts: List[str]) -> List[Any]:
+    return [pipeline(text) for text in texts]
+
+
+class Pipeline:
+    """
+    Text preprocessing pipeline
+
+    A pipeline runs a list of steps on a text, in order.
+    A step can be:
+
+        * a name of a built-in stage (see :func:`stage_names`), e.g.
+          `"normalize"`, `"remove_tonemark"`, `"word_tokenize"`
+        * a tuple of a stage name and a dictionary of keyword arguments,
+          e.g. `("word_tokenize", {"engine": "longest"})`
+        * any function that takes the output of the previous step
+
+    Steps before `"word_tokenize"` (or `"maiyamok"`) work on a string,
+    steps after it work on a list of tokens. Neighbouring character
+    mapping stages (`remove_zw`, `remove_tonemark`,
+    `thai_digit_to_arabic_digit`, `arabic_digit_to_thai_digit`) are
+    fused into one :meth:`str.translate` call.
+
+    :param list steps: steps of the pipeline
+        (default: `["normalize", "word_tokenize"]`)
+
+    :Example:
+    ::
+
+        from pythainlp.pipeline import Pipeline
+
+        pipeline = Pipeline([
+            "normalize",
+            "remove_tonemark",
+            "thai_digit_to_arabic_digit",
+            ("word_tokenize", {"engine": "newmm"}),
+            "maiyamok",
+        ])
+
+        pipeline("เด็กๆ ๒ คนชอบไปโรงเรียนนนน")
+        # output: ['เด็ก', 'เด็ก', ' ', '2', ' ', 'คน', 'ชอบ', 'ไป',
+        #          'โรงเรียน', 'นนน']
+
+        pipeline("บ้านเเม่มี ๓ ห้อง")
+        # output: ['บาน', 'แม', 'มี', ' ', '3', ' ', 'หอง']
+
+        for tokens in pipeline.pipe(open("corpus.txt"), max_workers=4):
+            ...
+    """
+
+    def __init__(self, steps: Optional[Iterable[Step]] = None) -> None:
+        if steps is None:
+            steps = DEFAULT_STEPS
+        self.steps = list(steps)
+        self._funcs = None
+        # validate now, so a bad step is reported when the pipeline is made
+        self._compile()
+
+    def __repr__(self) -> str:
+        return f"Pipeline({self.steps!r})"
+
+    def __getstate__(self) -> dict:
+        # compiled functions are rebuilt after unpickling
+        return {"steps": self.steps}
+
+    def __setstate__(self, state: dict) -> None:
+        self.steps = state["steps"]
+        self._funcs = None
+
+    def _compile(self) -> List[Callable]:
+        if self._funcs is not None:
+            return self._funcs
+
+        funcs = []
+        table = None  # pending translate table to be fused
+        tokenized = False
+        for step in self.steps:
+            if callable(step):
+                name, kwargs = None, {}
+            elif isinstance(step, str):
+                name, kwargs = step, {}
+            elif isinstance(step, tuple) and len(step) == 2:
+                name, kwargs = step
+            else:
+                raise ValueError(f"Invalid pipeline step: {step!r}")
+
+            if name is None:
+                func, kind, step_table = step, None, None
+            else:
+                if name not in _STAGES:
+                    raise ValueError(
+                        f"Unknown pipeline stage: {name!r}. "
+                        f"Available stages: {', '.join(stage_names())}"
+                    )
+                kind, module, func_name, table_name = _STAGES[name]
+                if kind == _TEXT and tokenized:
+                    raise ValueError(
+                        f"Stage {name!r} works on text, "
+                        "it must come before tokenization"
+                    )
+                if kind == _TOKENS and not tokenized:
+                    raise ValueError(
+                        f"Stage {name!r} works on tokens, "
+                        "it must come after tokenization"
+                    )
+                if kind == _TOKENIZE:
+                    if tokenized and name != "maiyamok":
+                        raise ValueError(
+                            f"Stage {name!r} works on text, "
+                            "text is already tokenized"
+                        )
+                    tokenized = True
+                module = importlib.import_module(module)
+                func = getattr(module, func_name)
+                if kwargs:
+                    func = partial(func, **kwargs)
+                step_table = (
+                    getattr(module, table_name)
+                    if table_name and not kwargs
+                    else None
+                )
+
+            if step_table is not None:
+                table = (
+                    step_table
+                    if table is None
+                    else _merge_tables(table, step_table)
+                )
+                continue
+            if table is not None:
+                funcs.append(partial(_translate, table=table))
+                table = None
+            funcs.append(func)
+        if table is not None:
+            funcs.append(partial(_translate, table=table))
+
+        self._funcs = funcs
+        return funcs
+
+    def __call__(self, text: str) -> Any:
+        """
+        Run the pipeline on a text.
+
+        :param str text: input text
+        :return: output of the last step
+        """
+        for func in self._compile():
+            text = func(text)
+        return text
+
+    def pipe(
+        self,
+        texts: Iterable[str],
+        max_workers: int = 1,
+        chunksize: int = 64,
+    ) -> Iterator[Any]:
+        """
+        Run the pipeline on many texts, lazily.
+
+        Texts are read from `texts` only when their results are needed,
+        so `texts` can be a generator or an open file. Results are
+        yielded in the order of `texts`.
+
+        With `max_workers` > 1, texts are split into chunks of
+        `chunksize` texts and processed in a process pool. At most
+        `2 * max_workers` chunks are in flight at a time.
+        Custom step functions must then be picklable
+        (defined at the top level of a module).
+
+        :param Iterable[str] texts: input texts
+        :param int max_workers: number of worker processes
+            (default: 1, run in the current process)
+        :param int chunksize: number of texts sent to a worker at a time
+        :return: generator of outputs of the last step
+        :rtype: Iterator
+        """
+        if max_workers <= 1:
+            funcs = self._compile()
+            for text in texts:
+                for func in funcs:
+                    text = func(text)
+                yield text
+            return
+
+        texts = iter(texts)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = deque()
+            while True:
+                while len(futures) < 2 * max_workers:
+                    chunk = list(islice(texts, chunksize))
+                    if not chunk:
+                        break
+                    futures.append(executor.submit(_run_chunk, self, chunk))
+                if not futures:
+                    break
+                yield from futures.popleft().result()
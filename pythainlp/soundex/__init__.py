@@ -6,7 +6,9 @@ Has three systems to choose from: Udom83 (default), LK82, and MetaSound
 """
 
 __all__ = [
+    "SoundexIndex",
     "soundex",
+    "soundex_batch",
     "lk82",
     "metasound",
     "udom83",
@@ -20,4 +22,5 @@ from pythainlp.soundex.prayut_and_somchaip import prayut_and_somchaip
 
 DEFAULT_SOUNDEX_ENGINE = "udom83"
 
-from pythainlp.soundex.core import soundex
+from pythainlp.soundex.core import soundex, soundex_batch
+from pythainlp.soundex.index import SoundexIndex
@@ -4,6 +4,10 @@ Thai soundex
 
 Has three systems to choose from: Udom83 (default), LK82, and MetaSound
 """
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Iterable, List, Optional
+
 from pythainlp.soundex.lk82 import lk82
 from pythainlp.soundex.metasound import metasound
 from pythainlp.soundex.udom83 import udom83
@@ -74,3 +78,73 @@ def soundex(text: str, engine: str = DEFAULT_SOUNDEX_ENGINE, length: int = 4) ->
     else:  # default, use "udom83"
         _soundex = udom83(text)
     return _soundex
+
+
+_CACHE_SIZE = 2 ** 17
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_soundex(text: str, engine: str, length: int) -> str:
+    return soundex(text, engine=engine, length=length)
+
+
+def _soundex_chunk(texts: List[str], engine: str, length: int) -> List[str]:
+    return [_cached_soundex(text, engine, length) for text in texts]
+
+
+def soundex_batch(
+    texts: Iterable[str],
+    engine: str = DEFAULT_SOUNDEX_ENGINE,
+    length: int = 4,
+    max_workers: Optional[int] = None,
+    chunksize: int = 10000,
+) -> List[str]:
+    """
+    This function converts many Thai words into phonetic codes.
+
+    Each distinct word is converted only once, and codes are kept
+    in a bounded cache (least recently used codes are dropped first),
+    so repeated words across calls are not converted again.
+
+    :param Iterable[str] texts: words
+    :param str engine: soundex engine (see :func:`soundex`)
+    :param int length: preferred length of the Soundex code (default is 4)\
+        for metasound and prayut_and_somchaip only
+    :param int max_workers: number of worker processes. If `None` or 1,
+        words are converted in the current process.
+    :param int chunksize: number of words sent to a worker at a time
+    :return: Soundex codes, in the order of `texts`
+    :rtype: List[str]
+
+    :Example:
+    ::
+
+        from pythainlp.soundex import soundex_batch
+
+        soundex_batch(["รัก", "ลัก", "รักษ์"], engine="lk82")
+        # output: ['ร1000', 'ร1000', 'ร1000']
+
+        # in 4 processes
+        from pythainlp.corpus import thai_words
+
+        codes = soundex_batch(thai_words(), max_workers=4)
+    """
+    texts = list(texts)
+    unique = list(dict.fromkeys(texts))
+
+    if max_workers is None or max_workers <= 1:
+        codes = _soundex_chunk(unique, engine, length)
+    else:
+        chunks = [
+            unique[i:i + chunksize] for i in range(0, len(unique), chunksize)
+        ]
+        codes = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_codes in executor.map(
+                partial(_soundex_chunk, engine=engine, length=length),
+                chunks,
+            ):
+                codes.extend(chunk_codes)
+
+    codes = dict(zip(unique, codes))
+    return [codes[text] for text in texts]
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Phonetic similarity search index
+"""
+import gzip
+import json
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pythainlp.soundex import DEFAULT_SOUNDEX_ENGINE
+from pythainlp.soundex.core import _cached_soundex, soundex_batch
+
+_ENGINES = ("udom83", "lk82", "metasound", "prayut_and_somchaip")
+_FORMAT_VERSION = 1
+
+
+def _edit_distance(s1: str, s2: str) -> int:
+    """
+    Levenshtein distance between two strings.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (c1 != c2),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+class SoundexIndex:
+    """
+    Phonetic similarity search index
+
+    Soundex codes of a word list are computed once, under one or more
+    soundex engines, and kept in an inverted index (code -> words).
+    Words that sound like a query word are then found with a dictionary
+    lookup, instead of computing soundex of every candidate word.
+
+    :param Iterable[str] words: words to be indexed (optional)
+    :param List[str] engines: soundex engines
+        (default: [DEFAULT_SOUNDEX_ENGINE]).
+        See :func:`pythainlp.soundex.soundex` for available engines.
+    :param int length: preferred length of the Soundex code (default is 4)\
+        for metasound and prayut_and_somchaip only
+    :param int max_workers: number of worker processes used
+        to compute soundex codes of `words` (see :func:`soundex_batch`)
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import thai_family_names
+        from pythainlp.soundex import SoundexIndex
+
+        index = SoundexIndex(
+            thai_family_names(), engines=["udom83", "lk82", "metasound"]
+        )
+
+        index.lookup("ศรีสุก")
+        # output: ['ศรีสุข', 'สารีสุข', 'สิริสุข']
+
+        index.match("ศรีสุก", limit=3)
+        # output: [('ศรีสุข', 1), ('สารีสุข', 3), ('ศรีศักดา', 4)]
+
+        index.save("family_names.idx.gz")
+        index = SoundexIndex.load("family_names.idx.gz")
+    """
+
+    def __init__(
+        self,
+        words: Optional[Iterable[str]] = None,
+        engines: Optional[List[str]] = None,
+        length: int = 4,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if engines is None:
+            engines = [DEFAULT_SOUNDEX_ENGINE]
+        if not engines:
+            raise ValueError("At least one soundex engine is required.")
+        for engine in engines:
+            if engine not in _ENGINES:
+                raise ValueError(
+                    f"Unknown soundex engine: {engine!r}. "
+                    f"Available engines: {', '.join(_ENGINES)}"
+                )
+        self.engines = list(engines)
+        self.length = length
+        self.words = []
+        self._word_ids = {}
+        self._codes = {engine: [] for engine in self.engines}
+        self._index = {engine: {} for engine in self.engines}
+        if words is not None:
+            self.add(words, max_workers=max_workers)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._word_ids
+
+    def add(
+        self, words: Iterable[str], max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Add words to the index. Words already in the index are skipped.
+
+        :param Iterable[str] words: words to be indexed
+        :param int max_workers: number of worker processes used
+            to compute soundex codes (see :func:`soundex_batch`)
+        """
+        new_words = [
+            word
+            for word in dict.fromkeys(words)
+            if word and word not in self._word_ids
+        ]
+        for engine in self.engines:
+            codes = soundex_batch(
+                new_words,
+                engine=engine,
+                length=self.length,
+                max_workers=max_workers,
+            )
+            self._add_codes(engine, len(self.words), codes)
+        for word in new_words:
+            self._word_ids[word] = len(self.words)
+            self.words.append(word)
+
+    def _add_codes(self, engine: str, start: int, codes: List[str]) -> None:
+        index = self._index[engine]
+        for word_id, code in enumerate(codes, start):
+            index.setdefault(code, []).append(word_id)
+        self._codes[engine].extend(codes)
+
+    def lookup(self, word: str, engine: Optional[str] = None) -> List[str]:
+        """
+        Find indexed words with the same soundex code as `word`.
+
+        :param str word: query word
+        :param str engine: soundex engine (default: first engine
+            of the index)
+        :return: words with the same code, in the order they were added
+        :rtype: List[str]
+        """
+        if engine is None:
+            engine = self.engines[0]
+        if engine not in self._index:
+            raise ValueError(f"Soundex engine {engine!r} is not indexed.")
+        code = _cached_soundex(word, engine, self.length)
+        if not code:
+            return []
+        return [self.words[i] for i in self._index[engine].get(code, [])]
+
+    def match(
+        self,
+        word: str,
+        limit: Optional[int] = 10,
+        max_distance: Optional[int] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Find indexed words that sound like `word`, ranked by similarity.
+
+        Candidates are words with the same soundex code as `word`
+        under at least one engine. They are ranked by the number of
+        engines whose codes are equal (more is better), then by
+        the edit distance to `word` (less is better).
+
+        :param str word: query word
+        :param int limit: maximum number of results (`None` for no limit)
+        :param int max_distance: maximum edit distance to `word`
+            (default: no limit)
+        :return: list of (word, edit distance)
+        :rtype: List[Tuple[str, int]]
+        """
+        n_matches = Counter()
+        for engine in self.engines:
+            code = _cached_soundex(word, engine, self.length)
+            if code:
+                n_matches.update(self._index[engine].get(code, []))
+
+        results = []
+        for word_id, n in n_matches.items():
+            candidate = self.words[word_id]
+            distance = _edit_distance(word, candidate)
+            if max_distance is None or distance <= max_distance:
+                results.append((-n, distance, candidate))
+        results.sort()
+        if limit is not None:
+            results = results[:limit]
+        return [(candidate, distance) for _, distance, candidate in results]
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a gzip-compressed JSON file.
+
+        Words and their codes are stored, so loading the index
+        does not compute any soundex code.
+
+        :param str path: path of the index file
+        """
+        data = {
+            "version": _FORMAT_VERSION,
+            "engines": self.engines,
+            "length": self.length,
+            "words": self.words,
+            "codes": self._codes,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "SoundexIndex":
+        """
+        Load an index saved by :meth:`save`.
+
+        :param str path: path of the index file
+        :return: soundex index
+        :rtype: SoundexIndex
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported soundex index version: {data.get('version')}"
+            )
+        index = cls(engines=data["engines"], length=data["length"])
+        codes: Dict[str, List[str]] = data["codes"]
+        for engine in index.engines:
+            index._add_codes(engine, 0, codes[engine])
+        index.words = data["words"]
+        index._word_ids = {word: i for i, word in enumerate(index.words)}
+        return index
@@ -60,7 +60,8 @@ def lk82(text: str) -> str:
         return ""
 
     text = remove_tonemark(text)  # 4. remove tone marks
-    text = _RE_KARANT.sub("", text)  # 4. remove "karat" characters
+    if "\u0e4c" in text:
+        text = _RE_KARANT.sub("", text)  # 4. remove "karat" characters
     text = _RE_SIGN.sub("", text)  # 5. remove Mai tai khu,
 
     if not text:
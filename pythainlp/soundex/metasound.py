@@ -8,6 +8,7 @@ a Statistical Ontology for Analysing Names Given in Accordance
 with Thai Astrology.
 https://pdfs.semanticscholar.org/3983/963e87ddc6dfdbb291099aa3927a0e3e4ea6.pdf
 """
+import re
 
 _CONS_THANTHAKHAT = "กขฃคฅฆงจฉชซฌญฎฏฐฑฒณดตถทธนบปผฝพฟภมยรลวศษสหฬอฮ์"
 _THANTHAKHAT = "์"  # \u0e4c
@@ -20,6 +21,25 @@ _C6 = "ม"  # M -> 6
 _C7 = "ย"  # Y -> 7
 _C8 = "ว"  # W -> 8
 
+_RE_NOT_CONS_THANTHAKHAT = re.compile(f"[^{_CONS_THANTHAKHAT}]")
+# karan (thanthakhat and a consonant before it)
+_RE_KARAN = re.compile(f".?{_THANTHAKHAT}")
+
+# code of a letter after the first one, other letters (and spaces
+# replacing karan) are coded as 0
+_CODES = {
+    ch: str(code)
+    for code, letters in enumerate([_C1, _C2, _C3, _C4, _C5, _C6, _C7, _C8], 1)
+    for ch in letters
+}
+_TRANS = str.maketrans(
+    {ch: _CODES.get(ch, "0") for ch in _CONS_THANTHAKHAT + " "}
+)
+
+
+def _blank(matchobj):  # to be used with _RE_KARAN
+    return " " * len(matchobj.group(0))
+
 
 def metasound(text: str, length: int = 4) -> str:
     """
@@ -61,45 +81,13 @@ def metasound(text: str, length: int = 4) -> str:
         return ""
 
     # keep only consonants and thanthakhat
-    chars = []
-    for ch in text:
-        if ch in _CONS_THANTHAKHAT:
-            chars.append(ch)
+    text = _RE_NOT_CONS_THANTHAKHAT.sub("", text)
 
     # remove karan (thanthakhat and a consonant before it)
-    i = 0
-    while i < len(chars):
-        if chars[i] == _THANTHAKHAT:
-            if i > 0:
-                chars[i - 1] = " "
-            chars[i] = " "
-        i += 1
+    text = _RE_KARAN.sub(_blank, text)
 
     # retain first consonant, encode the rest
-    chars = chars[:length]
-    i = 1
-    while i < len(chars):
-        if chars[i] in _C1:
-            chars[i] = "1"
-        elif chars[i] in _C2:
-            chars[i] = "2"
-        elif chars[i] in _C3:
-            chars[i] = "3"
-        elif chars[i] in _C4:
-            chars[i] = "4"
-        elif chars[i] in _C5:
-            chars[i] = "5"
-        elif chars[i] in _C6:
-            chars[i] = "6"
-        elif chars[i] in _C7:
-            chars[i] = "7"
-        elif chars[i] in _C8:
-            chars[i] = "8"
-        else:
-            chars[i] = "0"
-        i += 1
-
-    while len(chars) < length:
-        chars.append("0")
-
-    return "".join(chars)
+    text = text[:length]
+    text = text[:1] + text[1:].translate(_TRANS)
+
+    return text.ljust(length, "0")
@@ -6,7 +6,10 @@ using Soundex Technique
 References:
 Prayut Suwanvisat, Somchai Prasitjutrakul.Thai-English Cross-Language Transliterated Word Retrieval using Soundex Technique. In 1998 [cited 2022 Sep 8]. Available from: https://www.cp.eng.chula.ac.th/~somchai/spj/papers/ThaiText/ncsec98-clir.pdf
 """
+import re
+
 from pythainlp import thai_characters
+
 _C0 = "AEIOUHWYอ"
 _C1 = "BFPVบฝฟปผพภว"
 _C2 = "CGJKQSXZขฃคฅฆฉขฌกจซศษส"
@@ -20,6 +23,40 @@ _C1_1 = "Wว"
 _C9 = "Yยญ"
 _C52 = "ง"
 
+_LETTERS = thai_characters + "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_RE_NOT_LETTERS = re.compile(f"[^{re.escape(_LETTERS)}]")
+
+
+def _code(ch: str, first: bool) -> str:
+    if first and ch in _C0:
+        return "0"
+    for code, letters in (
+        ("1", _C1),
+        ("2", _C2),
+        ("3", _C3),
+        ("4", _C4),
+        ("5", _C5),
+        ("6", _C6),
+        ("52", _C52),
+    ):
+        if ch in letters:
+            return code
+    if not first:
+        for code, letters in (
+            ("7", _C7),
+            ("8", _C8),
+            ("1", _C1_1),
+            ("9", _C9),
+        ):
+            if ch in letters:
+                return code
+    return None
+
+
+# codes of the first letter and of the other letters
+_TRANS_FIRST = str.maketrans({ch: _code(ch, True) for ch in _LETTERS})
+_TRANS = str.maketrans({ch: _code(ch, False) for ch in _LETTERS})
+
 
 def prayut_and_somchaip(text: str, length: int = 4) -> str:
     """
@@ -45,43 +82,7 @@ def prayut_and_somchaip(text: str, length: int = 4) -> str:
     """
     if not text or not isinstance(text, str):
         return ""
-    text = text.upper()
     # keep only consonants (English-Thai)
-    chars = []
-    for ch in text:
-        if ch in thai_characters+"ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            chars.append(ch)
-
-    i = 0
-    while i < len(chars):
-        if i == 0 and chars[i] in _C0:
-            chars[i] = "0"
-        elif chars[i] in _C1:
-            chars[i] = "1"
-        elif chars[i] in _C2:
-            chars[i] = "2"
-        elif chars[i] in _C3:
-            chars[i] = "3"
-        elif chars[i] in _C4:
-            chars[i] = "4"
-        elif chars[i] in _C5:
-            chars[i] = "5"
-        elif chars[i] in _C6:
-            chars[i] = "6"
-        elif chars[i] in _C52:
-            chars[i] = "52"
-        elif chars[i] in _C7 and i != 0:
-            chars[i] = "7"
-        elif chars[i] in _C8 and i != 0:
-            chars[i] = "8"
-        elif chars[i] in _C1_1 and i != 0:
-            chars[i] = "1"
-        elif chars[i] in _C9 and i != 0:
-            chars[i] = "9"
-        else:
-            chars[i] = None
-        i += 1
-    chars = list(
-        ''.join([i for i in chars if i is not None])
-    )
-    return "".join(chars[-length:])
+    text = _RE_NOT_LETTERS.sub("", text.upper())
+    text = text[:1].translate(_TRANS_FIRST) + text[1:].translate(_TRANS)
+    return text[-length:]
@@ -70,16 +70,21 @@ def udom83(text: str) -> str:
     if not text or not isinstance(text, str):
         return ""
 
-    text = _RE_1.sub("ัน\\1", text)
-    text = _RE_2.sub("ั\\1", text)
-    text = _RE_3.sub("ัน\\1", text)
-    text = _RE_4.sub("ัน", text)
-    text = _RE_5.sub("\\1", text)
-    text = _RE_6.sub("\\1ย", text)
-    text = _RE_7.sub("ม\\1", text)
-    text = _RE_8.sub("ม", text)
-    text = _RE_9.sub("ม", text)
-    text = _RE_10.sub("", text)
+    # most rules only apply to words with รร, ไ/ใ, ำ, or ์
+    if "รร" in text:
+        text = _RE_1.sub("ัน\\1", text)
+        text = _RE_2.sub("ั\\1", text)
+        text = _RE_3.sub("ัน\\1", text)
+        text = _RE_4.sub("ัน", text)
+    if "ไ" in text or "ใ" in text:
+        text = _RE_5.sub("\\1", text)
+        text = _RE_6.sub("\\1ย", text)
+    if "\u0e33" in text:
+        text = _RE_7.sub("ม\\1", text)
+        text = _RE_8.sub("ม", text)
+        text = _RE_9.sub("ม", text)
+    if _THANTHAKHAT in text:
+        text = _RE_10.sub("", text)
     text = _RE_11.sub("", text)
 
     if not text:
@@ -5,9 +5,10 @@ Text summarization
 
 __all__ = [
     "summarize",
+    "summarize_batch",
 ]
 
 DEFAULT_SUMMARIZE_ENGINE = "frequency"
 CPE_KMUTT_THAI_SENTENCE_SUM = "mt5-cpe-kmutt-thai-sentence-sum"
 
-from pythainlp.summarize.core import summarize
+from pythainlp.summarize.core import summarize, summarize_batch
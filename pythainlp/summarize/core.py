@@ -3,19 +3,52 @@
 Text summarization
 """
 
-
-from typing import List
+import threading
+from typing import List, Optional
 
 from pythainlp.summarize import DEFAULT_SUMMARIZE_ENGINE, CPE_KMUTT_THAI_SENTENCE_SUM
 from pythainlp.summarize.freq import FrequencySummarizer
 from pythainlp.tokenize import sent_tokenize
 
+# mT5Summarizer instances, keyed on model and generation settings,
+# least recently used first
+_MT5_SUMMARIZERS = {}
+_MT5_SUMMARIZERS_LOCK = threading.Lock()
+# maximum number of mT5 models kept in memory
+_MT5_CACHE_SIZE = 2
+
+
+def _mt5_summarizer(engine: str, quantize: bool = False):
+    """
+    Get a cached :class:`mT5Summarizer` for the engine,
+    so the model is loaded from disk only once.
+    """
+    if engine == CPE_KMUTT_THAI_SENTENCE_SUM:
+        kwargs = {
+            "pretrained_mt5_model_name": CPE_KMUTT_THAI_SENTENCE_SUM,
+            "min_length": 5,
+        }
+    else:
+        kwargs = {"model_size": engine.replace("mt5-", "")}
+    kwargs["quantize"] = quantize
+    key = tuple(sorted(kwargs.items()))
+    with _MT5_SUMMARIZERS_LOCK:
+        summarizer = _MT5_SUMMARIZERS.pop(key, None)
+        if summarizer is None:
+            from .mt5 import mT5Summarizer
+            summarizer = mT5Summarizer(**kwargs)
+            while len(_MT5_SUMMARIZERS) >= _MT5_CACHE_SIZE:
+                del _MT5_SUMMARIZERS[next(iter(_MT5_SUMMARIZERS))]
+        _MT5_SUMMARIZERS[key] = summarizer
+        return summarizer
+
 
 def summarize(
     text: str,
     n: int = 1,
     engine: str = DEFAULT_SUMMARIZE_ENGINE,
     tokenizer: str = "newmm",
+    quantize: bool = False,
 ) -> List[str]:
     """
         This function summarizes text based on frequency of words.
@@ -32,16 +65,24 @@ def summarize(
 
         :param str text: text to be summarized
         :param int n: number of sentences to be included in the summary
-                      By default, n is *1* (effective for frequency engine only)
+                      By default, n is *1* (effective for frequency, tfidf,
+                      and textrank engines only)
         :param str engine: text summarization engine (By default: *frequency*).
         :param str tokenizer: word tokenizer engine name (refer to
                               :func:`pythainlp.tokenize.word_tokenize`).
                               By default, tokenizer is *newmm*
-                              (effective for frequency engine only)
+                              (effective for frequency, tfidf,
+                              and textrank engines only)
+        :param bool quantize: apply dynamic int8 quantization to linear
+                              layers of the model, for faster inference
+                              on CPU (effective for mT5 engines only)
 
         :return: list of selected sentences
         **Options for engine**
             * *frequency* (default) - frequency of words
+            * *tfidf* - sum of TF-IDF weights of words in a sentence
+            * *textrank* - TextRank, PageRank of sentences in a graph
+              of sentence similarity
             * *mt5* - mT5-small model
             * *mt5-small* - mT5-small model
             * *mt5-base* - mT5-base model
@@ -94,14 +135,90 @@ def summarize(
 
     if engine == DEFAULT_SUMMARIZE_ENGINE:
         sents = FrequencySummarizer().summarize(text, n, tokenizer)
+    elif engine in ("tfidf", "textrank"):
+        from pythainlp.summarize.extractive import ExtractiveSummarizer
+
+        sents = ExtractiveSummarizer(engine).summarize(text, n, tokenizer)
     elif engine == CPE_KMUTT_THAI_SENTENCE_SUM:
-        from .mt5 import mT5Summarizer
-        sents = mT5Summarizer(pretrained_mt5_model_name=CPE_KMUTT_THAI_SENTENCE_SUM, min_length=5).summarize(text)
+        sents = _mt5_summarizer(engine, quantize).summarize(text)
     elif engine.startswith('mt5-') or engine == "mt5":
-        size = engine.replace('mt5-', '')
-        from .mt5 import mT5Summarizer
-        sents = mT5Summarizer(model_size=size).summarize(text)
+        sents = _mt5_summarizer(engine, quantize).summarize(text)
     else:  # if engine not found, return first n sentences
         sents = sent_tokenize(text, engine="whitespace+newline")[:n]
 
     return sents
+
+
+def summarize_batch(
+    texts: List[str],
+    n: int = 1,
+    engine: str = DEFAULT_SUMMARIZE_ENGINE,
+    tokenizer: str = "newmm",
+    batch_size: int = 8,
+    max_workers: Optional[int] = None,
+    quantize: bool = False,
+) -> List[List[str]]:
+    """
+    This function summarizes many texts.
+
+    For mT5 engines, texts are padded and generated in batches
+    of `batch_size` texts. For *tfidf* and *textrank* engines,
+    sentences of all texts are scored together, and texts can be
+    tokenized in `max_workers` processes. Other engines summarize
+    texts one by one.
+    See :func:`pythainlp.summarize.summarize` for other parameters.
+
+    :param List[str] texts: list of texts to be summarized
+    :param int n: number of sentences to be included in the summary
+    :param str engine: text summarization engine (By default: *frequency*).
+    :param str tokenizer: word tokenizer engine name
+    :param int batch_size: number of texts in one batch
+        (mT5 and textrank engines only)
+    :param int max_workers: number of worker processes for tokenization
+        (tfidf and textrank engines only)
+    :param bool quantize: apply dynamic int8 quantization to linear
+        layers of the model (mT5 engines only)
+
+    :return: list of summaries (list of selected sentences),
+             in the order of `texts`
+    :rtype: List[List[str]]
+
+    :Example:
+    ::
+
+        from pythainlp.summarize import summarize_batch
+
+        summarize_batch([text1, text2], engine="mt5-small")
+
+        summarize_batch(news, n=3, engine="textrank", max_workers=4)
+    """
+    if engine in ("tfidf", "textrank"):
+        from pythainlp.summarize.extractive import ExtractiveSummarizer
+
+        return ExtractiveSummarizer(engine).summarize_batch(
+            texts,
+            n=n,
+            tokenizer=tokenizer,
+            max_workers=max_workers,
+            batch_size=batch_size,
+        )
+    if engine == CPE_KMUTT_THAI_SENTENCE_SUM or (
+        engine.startswith('mt5-') or engine == "mt5"
+    ):
+        outputs = [[] for _ in texts]
+        idx = [
+            i for i, text in enumerate(texts)
+            if text and isinstance(text, str)
+        ]
+        if idx:
+            summaries = _mt5_summarizer(engine, quantize).summarize_batch(
+                [texts[i] for i in idx], batch_size=batch_size
+            )
+            for i, sents in zip(idx, summaries):
+                outputs[i] = sents
+        return outputs
+
+    return [
+        summarize(text, n=n, engine=engine, tokenizer=tokenizer)
+        for text in texts
+    ]
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Extractive summarization by TF-IDF and TextRank
+
+Sentences of a whole batch of documents are put in one sparse
+sentence-term matrix (coordinate format, in NumPy arrays),
+so sentence scores of all documents are computed together.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from string import punctuation
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from pythainlp.corpus import thai_stopwords
+from pythainlp.tokenize import sent_tokenize, word_tokenize
+
+_STOPWORDS = set(punctuation).union(thai_stopwords())
+
+
+def _tokenize(text: str, tokenizer: str) -> Tuple[List[str], List[List[str]]]:
+    if not text or not isinstance(text, str):
+        return [], []
+    sents = sent_tokenize(text, engine="whitespace+newline")
+    words = [
+        [
+            w
+            for w in word_tokenize(sent, engine=tokenizer)
+            if w not in _STOPWORDS and not w.isspace()
+        ]
+        for sent in sents
+    ]
+    return sents, words
+
+
+class ExtractiveSummarizer:
+    """
+    Extractive summarizer for many documents
+
+    Each sentence is scored, and the sentences with the highest scores
+    are selected as a summary.
+
+    :param str method: *tfidf* (default) or *textrank*
+
+        * *tfidf* - sum of TF-IDF weights of words in a sentence.
+          Term frequency is counted in the document, and inverse
+          document frequency is computed over sentences of the document
+          (each sentence is a "document"), so the summary of a text
+          does not depend on other texts in the batch.
+        * *textrank* - TextRank (Mihalcea & Tarau, 2004), PageRank of
+          sentences in a graph weighted by cosine similarity of their
+          TF-IDF vectors, computed by power iteration.
+    :param float damping: damping factor of TextRank
+    :param int max_iter: maximum number of TextRank iterations
+    :param float tol: TextRank stops when scores change less than this
+
+    :Example:
+    ::
+
+        from pythainlp.summarize.extractive import ExtractiveSummarizer
+
+        summarizer = ExtractiveSummarizer("textrank")
+        summarizer.summarize_batch(news, n=3, max_workers=4)
+    """
+
+    def __init__(
+        self,
+        method: str = "tfidf",
+        damping: float = 0.85,
+        max_iter: int = 100,
+        tol: float = 1e-6,
+    ) -> None:
+        if method not in ("tfidf", "textrank"):
+            raise ValueError(f"Unknown summarization method: {method!r}")
+        self.method = method
+        self.damping = damping
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def summarize(
+        self, text: str, n: int = 1, tokenizer: str = "newmm"
+    ) -> List[str]:
+        """
+        Summarize a text.
+
+        :param str text: text to be summarized
+        :param int n: number of sentences to be included in the summary
+        :param str tokenizer: word tokenizer engine name
+        :return: list of selected sentences, highest score first
+        :rtype: List[str]
+        """
+        return self.summarize_batch([text], n=n, tokenizer=tokenizer)[0]
+
+    def summarize_batch(
+        self,
+        texts: List[str],
+        n: int = 1,
+        tokenizer: str = "newmm",
+        max_workers: Optional[int] = None,
+        batch_size: int = 64,
+    ) -> List[List[str]]:
+        """
+        Summarize many texts.
+
+        :param List[str] texts: texts to be summarized
+        :param int n: number of sentences to be included in each summary
+        :param str tokenizer: word tokenizer engine name
+        :param int max_workers: number of worker processes for
+            tokenization. If `None` or 1, texts are tokenized
+            in the current process.
+        :param int batch_size: number of documents whose TextRank graphs
+            are iterated together (*textrank* only)
+        :return: list of summaries, in the order of `texts`
+        :rtype: List[List[str]]
+        """
+        tokenize = partial(_tokenize, tokenizer=tokenizer)
+        if max_workers is None or max_workers <= 1:
+            docs = [tokenize(text) for text in texts]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                docs = list(executor.map(tokenize, texts, chunksize=8))
+
+        # sentence-term matrix of the batch, in coordinate format:
+        # one entry per (sentence, word) pair, duplicates are summed later
+        vocab = {}
+        sent_doc = []  # document of each sentence
+        rows = []
+        cols = []
+        for doc_id, (_, words) in enumerate(docs):
+            for sent in words:
+                sent_id = len(sent_doc)
+                sent_doc.append(doc_id)
+                for w in sent:
+                    rows.append(sent_id)
+                    cols.append(vocab.setdefault(w, len(vocab)))
+        sent_doc = np.array(sent_doc, dtype=np.int64)
+        n_sents = len(sent_doc)
+        if not rows:
+            return [sents[:n] for sents, _ in docs]
+        rows = np.array(rows, dtype=np.int64)
+        cols = np.array(cols, dtype=np.int64)
+        n_terms = len(vocab)
+
+        # term frequency of each (sentence, term)
+        keys, tf = np.unique(rows * n_terms + cols, return_counts=True)
+        s_rows, s_cols = np.divmod(keys, n_terms)
+        s_docs = sent_doc[s_rows]
+
+        # term frequency of each (document, term), scaled by max in document
+        d_keys, d_inv = np.unique(
+            s_docs * n_terms + s_cols, return_inverse=True
+        )
+        d_tf = np.bincount(d_inv, weights=tf)
+        d_docs = d_keys // n_terms
+        max_tf = np.zeros(len(docs))
+        np.maximum.at(max_tf, d_docs, d_tf)
+
+        # smoothed idf of each (document, term): number of sentences
+        # in the document, and number of them that contain the term
+        doc_sents = np.bincount(sent_doc, minlength=len(docs))
+        sent_freq = np.bincount(d_inv)
+        idf = np.log((1 + doc_sents[d_docs]) / (1 + sent_freq)) + 1
+
+        weight = (d_tf / max_tf[d_docs]) * idf
+        if self.method == "tfidf":
+            scores = np.bincount(
+                s_rows, weights=weight[d_inv], minlength=n_sents
+            )
+        else:
+            scores = self._textrank(
+                len(docs), sent_doc, s_rows, s_cols, tf * idf[d_inv],
+                batch_size,
+            )
+
+        summaries = []
+        start = 0
+        for sents, words in docs:
+            doc_scores = scores[start:start + len(words)]
+            start += len(words)
+            order = np.argsort(-doc_scores, kind="stable")[:n]
+            summaries.append([sents[i] for i in order])
+        return summaries
+
+    def _textrank(
+        self,
+        n_docs: int,
+        sent_doc: np.ndarray,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        values: np.ndarray,
+        batch_size: int,
+    ) -> np.ndarray:
+        n_sents = len(sent_doc)
+        scores = np.zeros(n_sents)
+        # sentence range of each document
+        doc_start = np.searchsorted(sent_doc, np.arange(n_docs + 1))
+        doc_len = np.diff(doc_start)
+        # sort documents by number of sentences, so padding is small
+        doc_ids = [i for i in np.argsort(doc_len, kind="stable") if doc_len[i]]
+        entry_start = np.searchsorted(rows, doc_start)
+
+        for b in range(0, len(doc_ids), batch_size):
+            batch = doc_ids[b:b + batch_size]
+            m = int(doc_len[batch].max())
+            graph = np.zeros((len(batch), m, m))
+            mask = np.zeros((len(batch), m))
+            for k, d in enumerate(batch):
+                lo, hi = entry_start[d], entry_start[d + 1]
+                r = rows[lo:hi] - doc_start[d]
+                terms, c = np.unique(cols[lo:hi], return_inverse=True)
+                x = np.zeros((doc_len[d], len(terms)))
+                x[r, c] = values[lo:hi]
+                norm = np.linalg.norm(x, axis=1, keepdims=True)
+                x = np.divide(x, norm, out=np.zeros_like(x), where=norm > 0)
+                sim = x @ x.T
+                np.fill_diagonal(sim, 0.0)
+                graph[k, :doc_len[d], :doc_len[d]] = sim
+                mask[k, :doc_len[d]] = 1.0
+
+            # row-normalized transition matrices
+            out = graph.sum(axis=2, keepdims=True)
+            graph = np.divide(
+                graph, out, out=np.zeros_like(graph), where=out > 0
+            )
+            size = mask.sum(axis=1, keepdims=True)
+            rank = mask / size
+            for _ in range(self.max_iter):
+                new_rank = (1 - self.damping) * mask / size + (
+                    self.damping * np.einsum("bij,bi->bj", graph, rank)
+                )
+                delta = np.abs(new_rank - rank).max()
+                rank = new_rank
+                if delta < self.tol:
+                    break
+
+            for k, d in enumerate(batch):
+                scores[doc_start[d]:doc_start[d + 1]] = rank[k, :doc_len[d]]
+        return scores
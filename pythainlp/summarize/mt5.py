@@ -2,6 +2,7 @@
 """
 Summarization by mT5 model
 """
+import torch
 from transformers import T5Tokenizer, MT5ForConditionalGeneration
 from typing import List
 
@@ -17,7 +18,21 @@ class mT5Summarizer:
             min_length: int = 30,
             max_length: int = 100,
             skip_special_tokens: bool = True,
-            pretrained_mt5_model_name: str = None):
+            pretrained_mt5_model_name: str = None,
+            quantize: bool = False):
+        """
+        :param str model_size: size of mT5 model (small, base, large, xl, xxl)
+        :param int num_beams: number of beams for beam search
+        :param int no_repeat_ngram_size: size of n-grams that can occur
+            only once in the summary
+        :param int min_length: minimum length of the summary
+        :param int max_length: maximum length of the summary
+        :param bool skip_special_tokens: remove special tokens from output
+        :param str pretrained_mt5_model_name: name of pretrained mT5 model,
+            used instead of `model_size`
+        :param bool quantize: apply dynamic int8 quantization to linear
+            layers of the model, for faster inference on CPU
+        """
         model_name = ""
         if pretrained_mt5_model_name is None:
             if model_size not in ["small", "base", "large", "xl", "xxl"]:
@@ -35,6 +50,11 @@ class mT5Summarizer:
         self.model = MT5ForConditionalGeneration.from_pretrained(
             model_name
         )
+        self.model.eval()
+        if quantize:
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
         self.tokenizer = T5Tokenizer.from_pretrained(
             model_name
         )
@@ -44,26 +64,77 @@ class mT5Summarizer:
         self.max_length = max_length
         self.skip_special_tokens = skip_special_tokens
 
-    def summarize(self, text: str) -> List[str]:
+    def _prepare(self, text: str) -> str:
         preprocess_text = text.strip().replace("\n", "")
         if self.model_name == f'thanathorn/{CPE_KMUTT_THAI_SENTENCE_SUM}':
-            t5_prepared_Text = "simplify: "+preprocess_text
-        else:
-            t5_prepared_Text = "summarize: "+preprocess_text
+            return "simplify: "+preprocess_text
+        return "summarize: "+preprocess_text
+
+    def summarize(self, text: str) -> List[str]:
         tokenized_text = self.tokenizer.encode(
-            t5_prepared_Text,
+            self._prepare(text),
             return_tensors="pt"
         )
-        summary_ids = self.model.generate(
-            tokenized_text,
-            num_beams=self.num_beams,
-            no_repeat_ngram_size=self.no_repeat_ngram_size,
-            min_length=self.min_length,
-            max_length=self.max_length,
-            early_stopping=True
-        )
+        with _inference_mode():
+            summary_ids = self.model.generate(
+                tokenized_text,
+                num_beams=self.num_beams,
+                no_repeat_ngram_size=self.no_repeat_ngram_size,
+                min_length=self.min_length,
+                max_length=self.max_length,
+                early_stopping=True
+            )
         output = self.tokenizer.decode(
             summary_ids[0],
             skip_special_tokens=self.skip_special_tokens
         )
         return [output]
+
+    def summarize_batch(
+        self, texts: List[str], batch_size: int = 8
+    ) -> List[List[str]]:
+        """
+        Summarize many texts.
+
+        Texts are sorted by length, padded, and generated
+        in batches of `batch_size` texts in one `generate` call.
+
+        :param List[str] texts: list of texts to be summarized
+        :param int batch_size: number of texts in one `generate` call
+        :return: list of summaries, in the order of `texts`
+        :rtype: List[List[str]]
+        """
+        prepared = [self._prepare(text) for text in texts]
+        order = sorted(range(len(texts)), key=lambda i: len(prepared[i]))
+        outputs = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            idx = order[start:start + batch_size]
+            inputs = self.tokenizer(
+                [prepared[i] for i in idx],
+                padding=True,
+                return_tensors="pt"
+            )
+            with _inference_mode():
+                summary_ids = self.model.generate(
+                    input_ids=inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    num_beams=self.num_beams,
+                    no_repeat_ngram_size=self.no_repeat_ngram_size,
+                    min_length=self.min_length,
+                    max_length=self.max_length,
+                    early_stopping=True
+                )
+            decoded = self.tokenizer.batch_decode(
+                summary_ids,
+                skip_special_tokens=self.skip_special_tokens
+            )
+            for i, output in zip(idx, decoded):
+                outputs[i] = [output]
+        return outputs
+
+
+def _inference_mode():
+    # torch.inference_mode is available from PyTorch 1.9
+    if hasattr(torch, "inference_mode"):
+        return torch.inference_mode()
+    return torch.no_grad()
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import threading
 from typing import Dict, List, Tuple, Union
 from pycrfsuite import Tagger as CRFTagger
 from pythainlp.corpus import path_pythainlp_corpus, thai_stopwords
@@ -58,10 +59,12 @@ class CRFchunk:
 
     def load_model(self, corpus: str):
         self.tagger = CRFTagger()
+        self._lock = threading.Lock()
         if corpus == "orchidpp":
             self.path = path_pythainlp_corpus("crfchunk_orchidpp.model")
         self.tagger.open(self.path)
 
     def parse(self, token_pos: List[Tuple[str, str]]) -> List[str]:
-        self.xseq = extract_features(token_pos)
-        return self.tagger.tag(self.xseq)
+        xseq = extract_features(token_pos)
+        with self._lock:
+            return self.tagger.tag(xseq)
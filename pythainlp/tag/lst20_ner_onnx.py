@@ -22,12 +22,12 @@ class LST20_NER_ONNX(WngchanBerta_ONNX):
         new_list = []
         if list_text[0][0] == "▁":
             list_text = list_text[1:]
-        for i, j in list_text:
+        for i, *j in list_text:
             if i.startswith("▁") and i != '▁':
                 i = i.replace("▁", "", 1)
             elif i == '▁':
                 i = " "
-            new_list.append((i, j))
+            new_list.append((i, *j))
         return new_list
 
     def _config(self, list_ner):
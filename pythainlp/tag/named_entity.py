@@ -73,7 +73,7 @@ class NER:
 
         :param str text: text in Thai to be tagged
         :param bool pos: output with part-of-speech tag.\
-            (wangchanberta is not support)
+            (wangchanberta and lst20_onnx are not support)
         :param bool tag: output like html tag.
         :return: a list of tuple associated with tokenized word, NER tag,
                  POS tag (if the parameter `pos` is specified as `True`),
@@ -98,16 +98,56 @@ class NER:
             >>> ner.tag("ทดสอบนายวรรณพงษ์ ภัททิยไพบูลย์", tag=True)
             'ทดสอบ<PERSON>นายวรรณพงษ์ ภัททิยไพบูลย์</PERSON>'
         """
-        if pos and self.name_engine == "wangchanberta":
-            warnings.warn(
-                """wangchanberta is not support part-of-speech tag.
-                It have not part-of-speech tag in output."""
-            )
+        if pos and self.name_engine in ("wangchanberta", "lst20_onnx"):
+            self._warn_no_pos()
         if self.name_engine == "wangchanberta" or self.name_engine == "lst20_onnx":
             return self.engine.get_ner(text, tag=tag)
         else:
             return self.engine.get_ner(text, tag=tag, pos=pos)
 
+    def tag_batch(
+        self,
+        texts: List[str],
+        pos: bool = True,
+        tag: bool = False,
+        batch_size: int = 8,
+    ) -> List[Union[List[Tuple[str, str]], List[Tuple[str, str, str]], str]]:
+        """
+        This function tags named-entitiy from many texts.
+
+        For *wangchanberta* and *lst20_onnx* engines, texts are padded
+        and run through the model in batches of `batch_size` texts.
+        Other engines tag texts one by one.
+
+        :param List[str] texts: list of texts in Thai to be tagged
+        :param bool pos: output with part-of-speech tag.\
+            (wangchanberta and lst20_onnx are not support)
+        :param bool tag: output like html tag.
+        :param int batch_size: number of texts in one forward pass
+        :return: list of outputs of :meth:`tag`, in the order of `texts`
+        :rtype: List[Union[List[Tuple[str, str]], \
+            List[Tuple[str, str, str]], str]]
+        :Example:
+
+            >>> from pythainlp.tag import NER
+            >>>
+            >>> ner = NER("lst20_onnx")
+            >>> ner.tag_batch(["แมวทำอะไรตอนห้าโมงเช้า", "ทดสอบระบบ"])
+        """
+        if pos and self.name_engine in ("wangchanberta", "lst20_onnx"):
+            self._warn_no_pos()
+        if self.name_engine == "wangchanberta" or self.name_engine == "lst20_onnx":
+            return self.engine.get_ner_batch(
+                texts, tag=tag, batch_size=batch_size
+            )
+        return [self.tag(text, pos=pos, tag=tag) for text in texts]
+
+    def _warn_no_pos(self) -> None:
+        warnings.warn(
+            f"""{self.name_engine} is not support part-of-speech tag.
+            It have not part-of-speech tag in output."""
+        )
+
 
 class NNER:
     """
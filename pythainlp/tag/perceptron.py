@@ -3,6 +3,7 @@
 Perceptron part-of-speech tagger
 """
 import os
+import threading
 from typing import List, Tuple
 import warnings
 
@@ -21,18 +22,25 @@ _ORCHID_TAGGER = None
 _PUD_TAGGER = None
 _LST20_TAGGER = None
 
+# guard one-time initialization of taggers shared between threads
+_TAGGER_LOCK = threading.Lock()
+
 
 def _orchid_tagger():
     global _ORCHID_TAGGER
     if not _ORCHID_TAGGER:
-        _ORCHID_TAGGER = PerceptronTagger(path=_ORCHID_PATH)
+        with _TAGGER_LOCK:
+            if not _ORCHID_TAGGER:
+                _ORCHID_TAGGER = PerceptronTagger(path=_ORCHID_PATH)
     return _ORCHID_TAGGER
 
 
 def _pud_tagger():
     global _PUD_TAGGER
     if not _PUD_TAGGER:
-        _PUD_TAGGER = PerceptronTagger(path=_PUD_PATH)
+        with _TAGGER_LOCK:
+            if not _PUD_TAGGER:
+                _PUD_TAGGER = PerceptronTagger(path=_PUD_PATH)
     return _PUD_TAGGER
 
 
@@ -44,8 +52,10 @@ def _lst20_tagger():
     https://www.facebook.com/dancearmy/posts/10157641945708284
     """)
     if not _LST20_TAGGER:
-        path = get_corpus_path(_LST20_TAGGER_NAME, version="0.2.4")
-        _LST20_TAGGER = PerceptronTagger(path=path)
+        with _TAGGER_LOCK:
+            if not _LST20_TAGGER:
+                path = get_corpus_path(_LST20_TAGGER_NAME, version="0.2.4")
+                _LST20_TAGGER = PerceptronTagger(path=path)
     return _LST20_TAGGER
 
 
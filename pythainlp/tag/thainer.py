@@ -5,6 +5,7 @@ Named-entity recognizer
 
 __all__ = ["ThaiNameTagger"]
 
+import threading
 from typing import Dict, List, Tuple, Union
 
 from pycrfsuite import Tagger as CRFTagger
@@ -99,6 +100,8 @@ class ThaiNameTagger:
                             The defualt value is `1.5`
         """
         self.crf = CRFTagger()
+        # pycrfsuite's Tagger keeps its working state internally
+        self._crf_lock = threading.Lock()
 
         if version == "1.4":
             self.crf.open(get_corpus_path("thainer-1.4", version="1.4"))
@@ -169,7 +172,8 @@ class ThaiNameTagger:
             corpus=self.pos_tag_name
         )
         x_test = ThaiNameTagger.__extract_features(pos_tags)
-        y = self.crf.tag(x_test)
+        with self._crf_lock:
+            y = self.crf.tag(x_test)
 
         sent_ner = [(pos_tags[i][0], data) for i, data in enumerate(y)]
 
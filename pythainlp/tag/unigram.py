@@ -4,6 +4,7 @@ Unigram Part-Of-Speech tagger
 """
 import json
 import os
+import threading
 from typing import List, Tuple
 import warnings
 
@@ -23,20 +24,27 @@ _ORCHID_TAGGER = None
 _PUD_TAGGER = None
 _LST20_TAGGER = None
 
+# guard one-time initialization of taggers shared between threads
+_TAGGER_LOCK = threading.Lock()
+
 
 def _orchid_tagger():
     global _ORCHID_TAGGER
     if not _ORCHID_TAGGER:
-        with open(_ORCHID_PATH, encoding="utf-8-sig") as fh:
-            _ORCHID_TAGGER = json.load(fh)
+        with _TAGGER_LOCK:
+            if not _ORCHID_TAGGER:
+                with open(_ORCHID_PATH, encoding="utf-8-sig") as fh:
+                    _ORCHID_TAGGER = json.load(fh)
     return _ORCHID_TAGGER
 
 
 def _pud_tagger():
     global _PUD_TAGGER
     if not _PUD_TAGGER:
-        with open(_PUD_PATH, encoding="utf-8-sig") as fh:
-            _PUD_TAGGER = json.load(fh)
+        with _TAGGER_LOCK:
+            if not _PUD_TAGGER:
+                with open(_PUD_PATH, encoding="utf-8-sig") as fh:
+                    _PUD_TAGGER = json.load(fh)
     return _PUD_TAGGER
 
 
@@ -48,9 +56,11 @@ def _lst20_tagger():
     https://www.facebook.com/dancearmy/posts/10157641945708284
     """)
     if not _LST20_TAGGER:
-        path = get_corpus_path(_LST20_TAGGER_NAME)
-        with open(path, encoding="utf-8-sig") as fh:
-            _LST20_TAGGER = json.load(fh)
+        with _TAGGER_LOCK:
+            if not _LST20_TAGGER:
+                path = get_corpus_path(_LST20_TAGGER_NAME)
+                with open(path, encoding="utf-8-sig") as fh:
+                    _LST20_TAGGER = json.load(fh)
     return _LST20_TAGGER
 
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import List, Tuple, Union
 import json
 import sentencepiece as spm
 import numpy as np
@@ -43,15 +43,31 @@ class WngchanBerta_ONNX:
         ) as fh:
             self._json = json.load(fh)
             self.id2tag = self._json['id2label']
+        # label id -> tag, for mapping argmax of logits in one step
+        self._id2tag = np.array(
+            [self.id2tag[str(i)] for i in range(len(self.id2tag))],
+            dtype=object
+        )
+
+    def _pieces(self, sent: str) -> List[str]:
+        # subwords as in the text, also for pieces unknown to the model
+        return self.sp.encode(sent, out_type=str)
+
+    def _tokenize(self, sent: str) -> Tuple[List[str], List[int]]:
+        # one SentencePiece pass gives both the subwords and the input ids,
+        # pieces unknown to the model map to <unk> as with sp.encode(sent)
+        pieces = self._pieces(sent)
+        ids = [5] + [self.sp.piece_to_id(p) + 4 for p in pieces] + [6]
+        return pieces, ids
+
+    def _inputs(self, ids: List[int]) -> dict:
+        return {
+            "input_ids": np.array([ids], dtype=np.int64),
+            "attention_mask": np.array([[1] * len(ids)], dtype=np.int64),
+        }
 
     def build_tokenizer(self, sent):
-        _t = [5]+[i+4 for i in self.sp.encode(sent)]+[6]
-        model_inputs = {}
-        model_inputs["input_ids"] = np.array([_t], dtype=np.int64)
-        model_inputs["attention_mask"] = np.array(
-            [[1]*len(_t)], dtype=np.int64
-        )
-        return model_inputs
+        return self._inputs(self._tokenize(sent)[1])
 
     def postprocess(self, logits_data):
         logits_t = logits_data[0]
@@ -63,30 +79,109 @@ class WngchanBerta_ONNX:
     def clean_output(self, list_text):
         return list_text
 
-    def totag(self, post, sent):
-        tag = []
-        _s = self.sp.EncodeAsPieces(sent)
-        for i in range(len(_s)):
-            tag.append(
-                (
-                    _s[i],
-                    self.id2tag[
-                        str(list(post[i+1]).index(max(list(post[i+1]))))
-                    ]
-                )
-            )
-        return tag
+    def totag(
+        self, logits, pieces: Union[List[str], str], scores: bool = False
+    ):
+        """
+        Map logits (or probabilities) of one sentence to tags.
+
+        :param numpy.ndarray logits: logits of the sentence,
+            shape (sequence length, number of labels),
+            including <s> and </s>
+        :param pieces: subwords of the sentence, or the sentence
+        :param bool scores: also return probability of each tag
+        :return: list of (subword, tag) or (subword, tag, score)
+        """
+        if isinstance(pieces, str):
+            pieces = self._pieces(pieces)
+        logits = logits[1:len(pieces) + 1]
+        tags = self._id2tag[logits.argmax(axis=-1)]
+        if not scores:
+            return list(zip(pieces, tags))
+        # probability of the argmax label, without a full softmax
+        probs = 1.0 / np.exp(
+            logits - logits.max(axis=-1, keepdims=True)
+        ).sum(axis=-1)
+        return list(zip(pieces, tags, probs.tolist()))
 
     def _config(self, list_ner):
         return list_ner
 
-    def get_ner(self, text: str, tag: bool = False):
-        self._s = self.build_tokenizer(text)
+    def get_ner(self, text: str, tag: bool = False, scores: bool = False):
+        """
+        Tag named-entities of a text.
+
+        :param str text: text
+        :param bool tag: output like html tag.
+        :param bool scores: also return probability of each tag
+            (not used if `tag` is `True`)
+        :return: list of (word, tag) or (word, tag, score),
+            or a string if `tag` is `True`
+        """
+        pieces, ids = self._tokenize(text)
         logits = self.session.run(
             output_names=[self.outputs_name],
-            input_feed=self._s
+            input_feed=self._inputs(ids)
         )[0]
-        _tag = self.clean_output(self.totag(self.postprocess(logits), text))
+        _tag = self.clean_output(
+            self.totag(logits[0], pieces, scores=scores and not tag)
+        )
+        return self._build_output(_tag, tag)
+
+    def get_ner_batch(
+        self,
+        texts: List[str],
+        tag: bool = False,
+        batch_size: int = 8,
+        scores: bool = False,
+    ) -> list:
+        """
+        Tag named-entities of many texts.
+
+        Texts are sorted by length and grouped into padded batches
+        of up to `batch_size` texts, so each batch runs
+        in one :meth:`InferenceSession.run` call.
+
+        :param List[str] texts: list of texts
+        :param bool tag: output like html tag.
+        :param int batch_size: number of texts in one forward pass
+        :param bool scores: also return probability of each tag
+            (not used if `tag` is `True`)
+        :return: list of outputs of :meth:`get_ner`, in the order of `texts`
+        :rtype: list
+        """
+        tokenized = [self._tokenize(text) for text in texts]
+        encoded = [ids for _, ids in tokenized]
+        order = sorted(range(len(texts)), key=lambda i: len(encoded[i]))
+        pad_id = self._json.get("pad_token_id", 1)
+        results = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            idx = order[start:start + batch_size]
+            max_len = max(len(encoded[i]) for i in idx)
+            input_ids = np.full((len(idx), max_len), pad_id, dtype=np.int64)
+            attention_mask = np.zeros((len(idx), max_len), dtype=np.int64)
+            for row, i in enumerate(idx):
+                input_ids[row, :len(encoded[i])] = encoded[i]
+                attention_mask[row, :len(encoded[i])] = 1
+            logits = self.session.run(
+                output_names=[self.outputs_name],
+                input_feed={
+                    "input_ids": input_ids,
+                    "attention_mask": attention_mask,
+                }
+            )[0]
+            for row, i in enumerate(idx):
+                _tag = self.clean_output(
+                    self.totag(
+                        logits[row],
+                        tokenized[i][0],
+                        scores=scores and not tag
+                    )
+                )
+                results[i] = self._build_output(_tag, tag)
+        return results
+
+    def _build_output(self, _tag, tag: bool):
         if tag:
             _tag = self._config(_tag)
             temp = ""
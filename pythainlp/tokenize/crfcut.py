@@ -15,6 +15,7 @@ POS features are not used due to unreliable POS tagging available
 """
 
 import os
+import threading
 from typing import List
 
 import pycrfsuite
@@ -180,6 +181,7 @@ def extract_features(
 _CRFCUT_DATA_FILENAME = "sentenceseg_crfcut.model"
 _tagger = pycrfsuite.Tagger()
 _tagger.open(os.path.join(corpus_path(), _CRFCUT_DATA_FILENAME))
+_tagger_lock = threading.Lock()
 
 
 def segment(text: str) -> List[str]:
@@ -194,7 +196,8 @@ def segment(text: str) -> List[str]:
     else:
         toks = text
     feat = extract_features(toks)
-    labs = _tagger.tag(feat)
+    with _tagger_lock:
+        labs = _tagger.tag(feat)
     labs[-1] = "E"  # make sure it cuts the last sentence
 
     sentences = []
@@ -5,6 +5,8 @@ __all__ = [
     "get_pythainlp_data_path",
     "get_pythainlp_path",
     "misspell",
+    "preload",
+    "preload_components",
 ]
 
 from pythainlp.tools.path import (
@@ -15,3 +17,4 @@ from pythainlp.tools.path import (
 )
 
 from pythainlp.tools.misspell import misspell
+from pythainlp.tools.preload import preload, preload_components
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Preload (warm up) model-backed engines.
+
+Many engines in PyThaiNLP load their models lazily on first use,
+or at import time of their modules. This makes the first request
+after a deploy slow. :func:`preload` loads a chosen set of engines
+ahead of time, concurrently, and reports how long each one took.
+"""
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Keep references to loaded objects, so they stay alive in this process
+# (and in processes forked from it).
+_PRELOADED = {}
+
+
+def _load_newmm():
+    from pythainlp.tokenize import word_tokenize
+
+    word_tokenize("ทดสอบ", engine="newmm")
+
+
+def _load_crfcut():
+    from pythainlp.tokenize import crfcut
+
+    crfcut.segment("ทดสอบ")
+
+
+def _load_perceptron():
+    from pythainlp.tag import perceptron
+
+    perceptron._pud_tagger()
+
+
+def _load_unigram():
+    from pythainlp.tag import unigram
+
+    unigram._pud_tagger()
+
+
+def _load_thainer():
+    from pythainlp.tag.thainer import ThaiNameTagger
+
+    tagger = ThaiNameTagger()
+    tagger.get_ner("ทดสอบ")
+    _PRELOADED["thainer"] = tagger
+
+
+def _load_thai2rom():
+    from pythainlp.transliterate import thai2rom
+
+    thai2rom.romanize("ทดสอบ")
+
+
+def _load_w2p():
+    from pythainlp.transliterate import w2p
+
+    w2p.pronunciate("ทดสอบ")
+
+
+_LOADERS: Dict[str, Callable[[], None]] = {
+    "newmm": _load_newmm,
+    "crfcut": _load_crfcut,
+    "perceptron": _load_perceptron,
+    "unigram": _load_unigram,
+    "thainer": _load_thainer,
+    "thai2rom": _load_thai2rom,
+    "w2p": _load_w2p,
+}
+
+DEFAULT_PRELOAD_COMPONENTS = ["newmm", "crfcut", "perceptron"]
+
+
+def preload_components() -> List[str]:
+    """
+    Get names of components that can be preloaded.
+
+    :return: list of component names
+    :rtype: List[str]
+    """
+    return sorted(_LOADERS.keys())
+
+
+def preload(
+    components: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+    freeze: bool = False,
+) -> Dict[str, float]:
+    """
+    Load models of the given components ahead of time.
+
+    Components are loaded concurrently in a thread pool. Each component
+    is loaded by running a small warm-up call, so lazy initializations
+    on the first real request are also done.
+
+    To share the loaded models between worker processes
+    (e.g. a pre-fork server like gunicorn with `preload_app`),
+    call this function in the parent process before forking
+    and set `freeze` to `True`. This moves all objects allocated
+    so far into a permanent generation of the garbage collector,
+    so the collector in child processes will not touch (and copy)
+    memory pages holding the models.
+
+    :param Iterable[str] components: names of components to be loaded,
+        see :func:`preload_components` for the list.
+        (default: `newmm`, `crfcut`, and `perceptron`)
+    :param int max_workers: maximum number of threads
+    :param bool freeze: freeze garbage collector after loading
+    :return: a dictionary of component name and loading time in seconds
+    :rtype: Dict[str, float]
+
+    :Options for components:
+        * *newmm* - dictionary trie of the default word tokenizer
+        * *crfcut* - CRF sentence segmenter
+        * *perceptron* - perceptron part-of-speech tagger (pud corpus)
+        * *unigram* - unigram part-of-speech tagger (pud corpus)
+        * *thainer* - Thai NER (CRF) named-entity recognizer
+        * *thai2rom* - romanization engine (require PyTorch)
+        * *w2p* - Thai Word-to-Phoneme engine (require NumPy)
+
+    :Example:
+    ::
+
+        from pythainlp import preload
+
+        preload(["newmm", "thainer"])
+        # output: {'newmm': 0.31, 'thainer': 1.73}
+    """
+    if components is None:
+        components = DEFAULT_PRELOAD_COMPONENTS
+    components = list(dict.fromkeys(components))
+
+    for name in components:
+        if name not in _LOADERS:
+            raise ValueError(
+                f"""Component '{name}' is not supported.
+                Supported components: {preload_components()}"""
+            )
+
+    def _timed_load(name: str) -> float:
+        start = time.perf_counter()
+        _LOADERS[name]()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        timings = dict(zip(components, executor.map(_timed_load, components)))
+
+    if freeze and hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+
+    return timings
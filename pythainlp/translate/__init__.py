@@ -6,9 +6,11 @@ Language translation.
 __all__ = [
     "ThZhTranslator",
     "ZhThTranslator",
-    "Translate"
+    "Translate",
+    "TranslationCache",
 ]
 
+from pythainlp.translate.cache import TranslationCache
 from pythainlp.translate.core import Translate
 
 from pythainlp.translate.zh_th import (
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Cache of translation results.
+"""
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CacheKey = Tuple[str, str, str]
+
+# pending access times of disk hits are written after this many reads
+_ATIME_FLUSH_SIZE = 1000
+
+
+def normalize_source(text: str) -> str:
+    """
+    Normalize source text for use in a cache key.
+
+    The text is normalized to Unicode NFC form, and leading/trailing
+    whitespaces are removed.
+
+    :param str text: source text
+    :return: normalized text
+    :rtype: str
+    """
+    return unicodedata.normalize("NFC", text).strip()
+
+
+class TranslationCache:
+    """
+    Cache of translation results
+
+    Results are kept in an in-memory LRU (least recently used) cache.
+    If `path` is given, results are also stored in an SQLite database
+    file, so they survive restarts and can be shared between processes.
+
+    A cache key is a tuple of (backend, model version, source text).
+    Any object with the same `get` and `put` methods (and optionally
+    `get_many`) can be used as a cache for
+    :class:`pythainlp.translate.Translate`.
+
+    Reading from the database file does not write to it at once;
+    access times of results read from the file are written with
+    the next :meth:`put`, :meth:`flush`, or :meth:`close`.
+
+    :param int maxsize: maximum number of results kept in memory
+    :param str path: path of SQLite database file (optional)
+    :param int max_disk_size: maximum number of results kept in
+        the database file. Least recently used results are removed first.
+        (default: no limit)
+
+    :Example:
+    ::
+
+        from pythainlp.translate import Translate, TranslationCache
+
+        cache = TranslationCache(maxsize=10000, path="translation.db")
+        th2en = Translate("th", "en", cache=cache)
+
+        th2en.translate("ฉันรักแมว")  # translated by the model
+        th2en.translate("ฉันรักแมว")  # from cache
+
+        cache.stats()
+        # output: {'hits': 1, 'misses': 1, 'hit_rate': 0.5, ...}
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        path: Optional[str] = None,
+        max_disk_size: Optional[int] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.path = path
+        self.max_disk_size = max_disk_size
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._atimes = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            dirname = os.path.dirname(os.path.abspath(path))
+            os.makedirs(dirname, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translation ("
+                "backend TEXT, version TEXT, source TEXT, target TEXT, "
+                "atime REAL, PRIMARY KEY (backend, version, source))"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS translation_atime "
+                "ON translation (atime)"
+            )
+            self._db.commit()
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """
+        Get a cached translation.
+
+        :param tuple key: (backend, model version, source text)
+        :return: translated text, or `None` if not found
+        """
+        with self._lock:
+            return self._get(key)
+
+    def get_many(self, keys: Iterable[CacheKey]) -> List[Optional[str]]:
+        """
+        Get cached translations of many keys, holding the lock once.
+
+        :param Iterable[tuple] keys: (backend, model version, source text)
+        :return: translated texts, `None` for keys not found
+        :rtype: List[Optional[str]]
+        """
+        with self._lock:
+            return [self._get(key) for key in keys]
+
+    def _get(self, key: CacheKey) -> Optional[str]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+        value = None
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT target FROM translation "
+                "WHERE backend = ? AND version = ? AND source = ?",
+                key,
+            ).fetchone()
+            if row is not None:
+                value = row[0]
+                self._atimes[tuple(key)] = time.time()
+                if len(self._atimes) >= _ATIME_FLUSH_SIZE:
+                    self._flush_atimes()
+                    self._db.commit()
+                self._put_memory(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _flush_atimes(self) -> None:
+        # the caller commits
+        if self._atimes:
+            self._db.executemany(
+                "UPDATE translation SET atime = ? "
+                "WHERE backend = ? AND version = ? AND source = ?",
+                [(atime,) + key for key, atime in self._atimes.items()],
+            )
+            self._atimes.clear()
+
+    def flush(self) -> None:
+        """
+        Write pending access times to the database file.
+        """
+        with self._lock:
+            if self._db is not None and self._atimes:
+                self._flush_atimes()
+                self._db.commit()
+
+    def put(self, key: CacheKey, value: str) -> None:
+        """
+        Store a translation.
+
+        :param tuple key: (backend, model version, source text)
+        :param str value: translated text
+        """
+        with self._lock:
+            self._put_memory(key, value)
+            if self._db is not None:
+                self._flush_atimes()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translation "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    tuple(key) + (value, time.time()),
+                )
+                if self.max_disk_size is not None:
+                    self._db.execute(
+                        "DELETE FROM translation WHERE rowid IN ("
+                        "SELECT rowid FROM translation ORDER BY atime DESC "
+                        "LIMIT -1 OFFSET ?)",
+                        (self.max_disk_size,),
+                    )
+                self._db.commit()
+
+    def _put_memory(self, key: CacheKey, value: str) -> None:
+        if self.maxsize <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all cached translations and reset statistics.
+        """
+        with self._lock:
+            self._memory.clear()
+            self._atimes.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM translation")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        :return: dictionary of number of hits, misses, hit rate,
+            number of results in memory, and on disk
+        :rtype: Dict[str, float]
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            disk_size = 0
+            if self._db is not None:
+                disk_size = self._db.execute(
+                    "SELECT COUNT(*) FROM translation"
+                ).fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "memory_size": len(self._memory),
+                "disk_size": disk_size,
+            }
+
+    def close(self) -> None:
+        """
+        Close the database file.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._flush_atimes()
+                self._db.commit()
+                self._db.close()
+                self._db = None
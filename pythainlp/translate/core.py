@@ -1,4 +1,38 @@
 # -*- coding: utf-8 -*-
+import re
+from typing import Callable, List, Union
+
+from pythainlp.translate.cache import TranslationCache, normalize_source
+
+_SENT_END = re.compile(r"(?<=[.!?。！？])\s+|(?<=[。！？])")
+
+
+def _translate_in_batches(
+    texts: List[str],
+    translate: Callable[[List[str]], List[str]],
+    batch_size: int,
+) -> List[str]:
+    """
+    Sort texts by length, translate them in batches
+    of similar length (less padding), and restore the input order.
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    outputs = [None] * len(texts)
+    for start in range(0, len(order), batch_size):
+        idx = order[start:start + batch_size]
+        for i, translated in zip(idx, translate([texts[i] for i in idx])):
+            outputs[i] = translated
+    return outputs
+
+
+def _split_sentences(text: str, lang: str) -> List[str]:
+    if lang == "th":
+        from pythainlp.tokenize import sent_tokenize
+
+        sents = sent_tokenize(text)
+    else:
+        sents = _SENT_END.split(text)
+    return [sent.strip() for sent in sents if sent.strip()]
 
 
 class Translate:
@@ -8,6 +42,8 @@ class Translate:
     :param str src_lang: source language
     :param str target_lang: target language
     :param bool use_gpu: load model to gpu (Default is False)
+    :param cache: cache of translation results. `True` for an in-memory
+        :class:`TranslationCache`, or a cache object (Default is None)
 
     **Options for source & target language**
         * *th* - *en* - Thai to English
@@ -29,11 +65,14 @@ class Translate:
     def __init__(self,
                  src_lang: str,
                  target_lang: str,
-                 use_gpu: bool = False) -> None:
+                 use_gpu: bool = False,
+                 cache: Union[bool, TranslationCache, None] = None) -> None:
         """
         :param str src_lang: source language
         :param str target_lang: target language
         :param bool use_gpu: load model to gpu (Default is False)
+        :param cache: cache of translation results. `True` for an in-memory
+            :class:`TranslationCache`, or a cache object (Default is None)
 
         **Options for source & target language**
             * *th* - *en* - Thai to English
@@ -53,6 +92,9 @@ class Translate:
             # output: I love cat.
         """
         self.model = None
+        self.src_lang = src_lang
+        self.target_lang = target_lang
+        self.cache = TranslationCache() if cache is True else cache or None
         self.load_model(src_lang, target_lang, use_gpu)
 
     def load_model(self, src_lang: str, target_lang: str, use_gpu: bool):
@@ -73,6 +115,44 @@ class Translate:
             self.model = ThFrTranslator(use_gpu)
         else:
             raise ValueError("Not support language!")
+        self._cache_backend = f"{src_lang}-{target_lang}"
+        self._cache_version = getattr(
+            self.model, "model_version", type(self.model).__name__
+        )
+
+    def _cache_key(self, text: str):
+        return (
+            self._cache_backend, self._cache_version, normalize_source(text)
+        )
+
+    def _translate_batch(self, texts: List[str], batch_size: int) -> List[str]:
+        if self.cache is None:
+            return self.model.translate_batch(texts, batch_size=batch_size)
+
+        keys = [self._cache_key(text) for text in texts]
+        if hasattr(self.cache, "get_many"):
+            outputs = self.cache.get_many(keys)
+        else:
+            outputs = [self.cache.get(key) for key in keys]
+        # translate each distinct missing text (after normalization) once
+        missing = {}
+        for text, key, output in zip(texts, keys, outputs):
+            if output is None and key not in missing:
+                missing[key] = text
+        if missing:
+            translated = dict(zip(
+                missing,
+                self.model.translate_batch(
+                    list(missing.values()), batch_size=batch_size
+                )
+            ))
+            for key, output in translated.items():
+                self.cache.put(key, output)
+            outputs = [
+                translated[key] if output is None else output
+                for key, output in zip(keys, outputs)
+            ]
+        return outputs
 
     def translate(self, text) -> str:
         """
@@ -82,4 +162,63 @@ class Translate:
         :return: translated text in target language
         :rtype: str
         """
-        return self.model.translate(text)
+        if self.cache is None:
+            return self.model.translate(text)
+
+        key = self._cache_key(text)
+        translated = self.cache.get(key)
+        if translated is None:
+            translated = self.model.translate(text)
+            self.cache.put(key, translated)
+        return translated
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 8,
+        split_sentences: bool = False,
+    ) -> List[str]:
+        """
+        Translate many texts
+
+        Texts are sorted by length and translated in batches.
+        If the translator has a cache, only texts (or sentences)
+        not found in the cache are translated.
+
+        :param List[str] texts: input texts in source language
+        :param int batch_size: number of texts (or sentences)
+            in one batch
+        :param bool split_sentences: split long texts into sentences,
+            translate all sentences in batches, then join them back
+        :return: translated texts in target language,
+            in the order of `texts`
+        :rtype: List[str]
+
+        :Example:
+
+        Translate texts from Thai to English::
+
+            from pythainlp.translate import Translate
+            th2en = Translate('th', 'en')
+
+            th2en.translate_batch(["ฉันรักแมว", "แมวกินปลา"])
+            # output: ['I love cat.', 'Cats eat fish.']
+        """
+        if not split_sentences:
+            return self._translate_batch(texts, batch_size)
+
+        sents = []
+        n_sents = []
+        for text in texts:
+            text_sents = _split_sentences(text, self.src_lang)
+            sents.extend(text_sents)
+            n_sents.append(len(text_sents))
+        translated = self._translate_batch(sents, batch_size)
+
+        sep = "" if self.target_lang == "zh" else " "
+        outputs = []
+        start = 0
+        for n in n_sents:
+            outputs.append(sep.join(translated[start:start + n]))
+            start += n
+        return outputs
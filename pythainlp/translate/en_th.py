@@ -9,9 +9,11 @@ Website: https://airesearch.in.th/releases/machine-translation-models/
 import os
 import tarfile
 from collections import defaultdict
+from typing import List
 
 from pythainlp.corpus import download, get_corpus_path
 from pythainlp.tools import get_full_data_path, get_pythainlp_data_path
+from pythainlp.translate.core import _translate_in_batches
 
 from fairseq.models.transformer import TransformerModel
 from sacremoses import MosesTokenizer
@@ -57,6 +59,7 @@ class EnThTranslator:
         self._tokenizer = MosesTokenizer("en")
 
         self._model_name = _EN_TH_MODEL_NAME
+        self.model_version = _EN_TH_FILE_NAME
 
         _download_install(self._model_name)
         self._model = TransformerModel.from_pretrained(
@@ -99,6 +102,26 @@ class EnThTranslator:
         translated = self._model.translate(tokens)
         return translated.replace(" ", "").replace("▁", " ").strip()
 
+    def translate_batch(
+        self, texts: List[str], batch_size: int = 8
+    ) -> List[str]:
+        """
+        Translate many texts from English to Thai
+
+        :param List[str] texts: input texts in source language
+        :param int batch_size: number of texts in one batch
+        :return: translated texts in target language
+        :rtype: List[str]
+        """
+        def _translate(batch: List[str]) -> List[str]:
+            tokens = [" ".join(self._tokenizer.tokenize(t)) for t in batch]
+            return [
+                translated.replace(" ", "").replace("▁", " ").strip()
+                for translated in self._model.translate(tokens)
+            ]
+
+        return _translate_in_batches(texts, _translate, batch_size)
+
 
 class ThEnTranslator:
     """
@@ -112,6 +135,7 @@ class ThEnTranslator:
     """
     def __init__(self, use_gpu: bool = False):
         self._model_name = _TH_EN_MODEL_NAME
+        self.model_version = _TH_EN_FILE_NAME
 
         _download_install(self._model_name)
         self._model = TransformerModel.from_pretrained(
@@ -158,3 +182,18 @@ class ThEnTranslator:
 
         """
         return self._model.translate(text)
+
+    def translate_batch(
+        self, texts: List[str], batch_size: int = 8
+    ) -> List[str]:
+        """
+        Translate many texts from Thai to English
+
+        :param List[str] texts: input texts in source language
+        :param int batch_size: number of texts in one batch
+        :return: translated texts in target language
+        :rtype: List[str]
+        """
+        return _translate_in_batches(
+            texts, self._model.translate, batch_size
+        )
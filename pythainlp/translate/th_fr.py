@@ -10,8 +10,13 @@ BLEU 20.4
 
 - Huggingface https://huggingface.co/Helsinki-NLP/opus-mt-th-fr
 """
+from typing import List
+
+import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
+from pythainlp.translate.core import _translate_in_batches
+
 
 class ThFrTranslator:
     """
@@ -30,6 +35,7 @@ class ThFrTranslator:
     def __init__(self,
                  use_gpu: bool = False,
                  pretrained: str = "Helsinki-NLP/opus-mt-th-fr") -> None:
+        self.model_version = pretrained
         self.tokenizer_thzh = AutoTokenizer.from_pretrained(pretrained)
         self.model_thzh = AutoModelForSeq2SeqLM.from_pretrained(pretrained)
         if use_gpu:
@@ -62,3 +68,26 @@ class ThFrTranslator:
                 t, skip_special_tokens=True
             ) for t in self.translated
         ][0]
+
+    def translate_batch(
+        self, texts: List[str], batch_size: int = 8
+    ) -> List[str]:
+        """
+        Translate many texts from Thai to French
+
+        :param List[str] texts: input texts in source language
+        :param int batch_size: number of texts in one batch
+        :return: translated texts in target language
+        :rtype: List[str]
+        """
+        def _translate(batch: List[str]) -> List[str]:
+            inputs = self.tokenizer_thzh(
+                batch, return_tensors="pt", padding=True
+            ).to(self.model_thzh.device)
+            with torch.no_grad():
+                translated = self.model_thzh.generate(**inputs)
+            return self.tokenizer_thzh.batch_decode(
+                translated, skip_special_tokens=True
+            )
+
+        return _translate_in_batches(texts, _translate, batch_size)
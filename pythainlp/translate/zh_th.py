@@ -7,8 +7,13 @@ from AI builder
 - GitHub: https://github.com/LalitaDeelert/lalita-mt-zhth
 - Facebook post https://web.facebook.com/aibuildersx/posts/166736255494822
 """
+from typing import List
+
+import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
+from pythainlp.translate.core import _translate_in_batches
+
 
 class ThZhTranslator:
     """
@@ -24,6 +29,7 @@ class ThZhTranslator:
     def __init__(self,
                  use_gpu: bool = False,
                  pretrained: str = "Lalita/marianmt-th-zh_cn") -> None:
+        self.model_version = pretrained
         self.tokenizer_thzh = AutoTokenizer.from_pretrained(pretrained)
         self.model_thzh = AutoModelForSeq2SeqLM.from_pretrained(pretrained)
         if use_gpu:
@@ -57,6 +63,29 @@ class ThZhTranslator:
             ) for t in self.translated
         ][0]
 
+    def translate_batch(
+        self, texts: List[str], batch_size: int = 8
+    ) -> List[str]:
+        """
+        Translate many texts from Thai to Chinese
+
+        :param List[str] texts: input texts in source language
+        :param int batch_size: number of texts in one batch
+        :return: translated texts in target language
+        :rtype: List[str]
+        """
+        def _translate(batch: List[str]) -> List[str]:
+            inputs = self.tokenizer_thzh(
+                batch, return_tensors="pt", padding=True
+            ).to(self.model_thzh.device)
+            with torch.no_grad():
+                translated = self.model_thzh.generate(**inputs)
+            return self.tokenizer_thzh.batch_decode(
+                translated, skip_special_tokens=True
+            )
+
+        return _translate_in_batches(texts, _translate, batch_size)
+
 
 class ZhThTranslator:
     """
@@ -72,6 +101,7 @@ class ZhThTranslator:
     def __init__(self,
                  use_gpu: bool = False,
                  pretrained: str = "Lalita/marianmt-zh_cn-th") -> None:
+        self.model_version = pretrained
         self.tokenizer_zhth = AutoTokenizer.from_pretrained(pretrained)
         self.model_zhth = AutoModelForSeq2SeqLM.from_pretrained(pretrained)
         if use_gpu:
@@ -104,3 +134,26 @@ class ZhThTranslator:
                 t, skip_special_tokens=True
             ) for t in self.translated
         ][0]
+
+    def translate_batch(
+        self, texts: List[str], batch_size: int = 8
+    ) -> List[str]:
+        """
+        Translate many texts from Chinese to Thai
+
+        :param List[str] texts: input texts in source language
+        :param int batch_size: number of texts in one batch
+        :return: translated texts in target language
+        :rtype: List[str]
+        """
+        def _translate(batch: List[str]) -> List[str]:
+            inputs = self.tokenizer_zhth(
+                batch, return_tensors="pt", padding=True
+            ).to(self.model_zhth.device)
+            with torch.no_grad():
+                translated = self.model_zhth.generate(**inputs)
+            return self.tokenizer_zhth.batch_decode(
+                translated, skip_special_tokens=True
+            )
+
+        return _translate_in_batches(texts, _translate, batch_size)
@@ -4,6 +4,8 @@ Romanization of Thai words based on machine-learnt engine ("thai2rom")
 """
 
 import random
+import threading
+from typing import Iterable, List
 
 import numpy as np
 import torch
@@ -14,6 +16,8 @@ from pythainlp.corpus import get_corpus_path
 device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
 
 _MODEL_NAME = "thai2rom-pytorch-attn"
+# maximum number of romanized texts kept by a transliterator
+_CACHE_SIZE = 2 ** 16
 
 
 class ThaiTransliterator:
@@ -57,6 +61,11 @@ class ThaiTransliterator:
         self._network.load_state_dict(loader["model_state_dict"])
         self._network.eval()
 
+        # text -> romanized text, oldest first,
+        # written under _cache_lock, read without it
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
     def _prepare_sequence_in(self, text: str):
         """
         Prepare input sequence for PyTorch
@@ -77,27 +86,78 @@ class ThaiTransliterator:
         :return: English (more or less) text that spells out how the Thai text
                  should be pronounced.
         """
-        input_tensor = self._prepare_sequence_in(text).view(1, -1)
-        input_length = [len(text) + 1]
+        return self.romanize_batch([text])[0]
+
+    def romanize_batch(
+        self, texts: Iterable[str], batch_size: int = 64
+    ) -> List[str]:
+        """
+        Romanize many texts.
+
+        Texts are sorted by length and padded into batches. The encoder
+        runs once for each batch, and all texts in a batch are decoded
+        together, step by step, until every text reaches its end token.
+        Results are cached, so repeated texts are romanized only once.
+
+        :param Iterable[str] texts: Thai texts to be romanized
+        :param int batch_size: number of texts romanized together
+        :return: romanized texts, in the order of `texts`
+        :rtype: List[str]
 
-        target_tensor_logits = self._network(
-            input_tensor, input_length, None, 0
+        :Example:
+        ::
+
+            from pythainlp.transliterate.thai2rom import ThaiTransliterator
+
+            ThaiTransliterator().romanize_batch(["แมว", "สุนัข", "แมว"])
+            # output: ['maeo', 'sunak', 'maeo']
+        """
+        texts = list(texts)
+        romanized = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache.get(text)
+            if cached is not None:
+                romanized[text] = cached
+            else:
+                missing.append(text)
+        # longest first, as the encoder packs sequences in this order
+        missing.sort(key=len, reverse=True)
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            romanized.update(zip(batch, self._romanize_padded(batch)))
+
+        with self._cache_lock:
+            for text in missing:
+                if len(self._cache) >= _CACHE_SIZE:
+                    del self._cache[next(iter(self._cache))]
+                self._cache[text] = romanized[text]
+        return [romanized[text] for text in texts]
+
+    def _romanize_padded(self, texts: List[str]) -> List[str]:
+        # texts are sorted by length, longest first
+        lengths = [len(text) + 1 for text in texts]
+        input_tensor = torch.zeros(
+            len(texts), lengths[0], dtype=torch.long, device=device
         )
+        for i, text in enumerate(texts):
+            input_tensor[i, :lengths[i]] = self._prepare_sequence_in(text)
 
-        # Seq2seq model returns <END> as the first token,
-        # As a result, target_tensor_logits.size() is torch.Size([0])
-        if target_tensor_logits.size(0) == 0:
-            target = ["<PAD>"]
-        else:
-            target_tensor = (
-                torch.argmax(target_tensor_logits.squeeze(1), 1)
-                .cpu()
-                .detach()
-                .numpy()
+        with torch.inference_mode():
+            tokens, target_lengths = self._network.greedy_decode(
+                input_tensor, lengths
             )
-            target = [self._ix_to_target_char[t] for t in target_tensor]
 
-        return "".join(target)
+        results = []
+        for seq, n in zip(tokens.T.tolist(), target_lengths.tolist()):
+            # Seq2seq model returns <END> as the first token
+            if n == 0:
+                results.append("<PAD>")
+            else:
+                results.append(
+                    "".join(self._ix_to_target_char[t] for t in seq[:n])
+                )
+        return results
 
 
 class Encoder(nn.Module):
@@ -353,9 +413,69 @@ class Seq2Seq(nn.Module):
 
         return outputs
 
+    def greedy_decode(self, source_seq, source_seq_len):
+        """
+        Decode a batch of padded sequences, sorted by length (longest first).
+
+        All sequences are decoded in lock-step, with the most probable token
+        of each step, until all of them have produced the end token.
+
+        :return: tokens (max_length, batch_size), and number of tokens
+                 of each sequence before its end token
+        """
+        batch_size = source_seq.size(0)
+        max_len = self.max_length
+
+        encoder_outputs, encoder_hidden = self.encoder(
+            source_seq, source_seq_len
+        )
+        decoder_hidden = torch.cat(
+            [encoder_hidden[0][0], encoder_hidden[0][1]], dim=1
+        ).unsqueeze(dim=0)
+        decoder_input = torch.full(
+            (batch_size, 1),
+            self.target_start_token,
+            dtype=torch.long,
+            device=device,
+        )
+        max_source_len = encoder_outputs.size(1)
+        mask = self.create_mask(source_seq[:, 0:max_source_len])
+
+        tokens = torch.zeros(max_len, batch_size, dtype=torch.long)
+        lengths = torch.full((batch_size,), max_len, dtype=torch.long)
+        finished = torch.zeros(batch_size, dtype=torch.bool)
+        for di in range(max_len):
+            decoder_output, decoder_hidden, _ = self.decoder(
+                decoder_input, decoder_hidden, encoder_outputs, mask
+            )
+            decoder_input = decoder_output.topk(1)[1]
+            topi = decoder_input.view(-1).cpu()
+            tokens[di] = topi
+
+            ended = (topi == self.target_end_token) & ~finished
+            lengths[ended] = di
+            finished |= ended
+            if finished.all():
+                break
+
+        return tokens, lengths
+
 
 _THAI_TO_ROM = ThaiTransliterator()
 
 
 def romanize(text: str) -> str:
     return _THAI_TO_ROM.romanize(text)
+
+
+def romanize_batch(texts: Iterable[str], batch_size: int = 64) -> List[str]:
+    """
+    Romanize many texts with thai2rom
+    (see :meth:`ThaiTransliterator.romanize_batch`).
+
+    :param Iterable[str] texts: Thai texts to be romanized
+    :param int batch_size: number of texts romanized together
+    :return: romanized texts, in the order of `texts`
+    :rtype: List[str]
+    """
+    return _THAI_TO_ROM.romanize_batch(texts, batch_size=batch_size)
@@ -4,7 +4,8 @@ Thai Word-to-Phoneme (Thai W2P)
 GitHub : https://github.com/wannaphong/Thai_W2P
 """
 
-from typing import Union
+import threading
+from typing import Iterable, List, Union
 
 import numpy as np
 from pythainlp.corpus import download, get_corpus_path
@@ -19,6 +20,8 @@ _PHONEMES = list(
 )
 
 _MODEL_NAME = "thai_w2p"
+# maximum number of pronunciations kept by a Thai_W2P
+_CACHE_SIZE = 2 ** 16
 
 
 class _Hparams:
@@ -57,78 +60,67 @@ class Thai_W2P(object):
             download(_MODEL_NAME, version="0.2")
             self.checkpoint = get_corpus_path(_MODEL_NAME)
         self._load_variables()
+        # word -> pronunciation, oldest first,
+        # written under _cache_lock, read without it
+        self._cache = {}
+        self._cache_lock = threading.Lock()
 
     def _load_variables(self):
         self.variables = np.load(self.checkpoint, allow_pickle=True)
+        variables = self.variables.item()
         # (29, 64). (len(graphemes), emb)
-        self.enc_emb = self.variables.item().get("encoder.emb.weight")
+        self.enc_emb = variables.get("encoder.emb.weight")
         # (3*128, 64)
-        self.enc_w_ih = self.variables.item().get("encoder.rnn.weight_ih_l0")
+        self.enc_w_ih = variables.get("encoder.rnn.weight_ih_l0")
         # (3*128, 128)
-        self.enc_w_hh = self.variables.item().get("encoder.rnn.weight_hh_l0")
+        self.enc_w_hh = variables.get("encoder.rnn.weight_hh_l0")
         # (3*128,)
-        self.enc_b_ih = self.variables.item().get("encoder.rnn.bias_ih_l0")
+        self.enc_b_ih = variables.get("encoder.rnn.bias_ih_l0")
         # (3*128,)
-        self.enc_b_hh = self.variables.item().get("encoder.rnn.bias_hh_l0")
+        self.enc_b_hh = variables.get("encoder.rnn.bias_hh_l0")
 
         # (74, 64). (len(phonemes), emb)
-        self.dec_emb = self.variables.item().get("decoder.emb.weight")
+        self.dec_emb = variables.get("decoder.emb.weight")
         # (3*128, 64)
-        self.dec_w_ih = self.variables.item().get("decoder.rnn.weight_ih_l0")
+        self.dec_w_ih = variables.get("decoder.rnn.weight_ih_l0")
         # (3*128, 128)
-        self.dec_w_hh = self.variables.item().get("decoder.rnn.weight_hh_l0")
+        self.dec_w_hh = variables.get("decoder.rnn.weight_hh_l0")
         # (3*128,)
-        self.dec_b_ih = self.variables.item().get("decoder.rnn.bias_ih_l0")
+        self.dec_b_ih = variables.get("decoder.rnn.bias_ih_l0")
         # (3*128,)
-        self.dec_b_hh = self.variables.item().get("decoder.rnn.bias_hh_l0")
+        self.dec_b_hh = variables.get("decoder.rnn.bias_hh_l0")
         # (74, 128)
-        self.fc_w = self.variables.item().get("decoder.fc.weight")
+        self.fc_w = variables.get("decoder.fc.weight")
         # (74,)
-        self.fc_b = self.variables.item().get("decoder.fc.bias")
+        self.fc_b = variables.get("decoder.fc.bias")
+
+        # inputs of the GRUs are embeddings, so input projections of
+        # all (r, z, n) gates are computed once for each symbol
+        # (len(graphemes), 3*128) and (len(phonemes), 3*128)
+        self._enc_x = self.enc_emb @ self.enc_w_ih.T + self.enc_b_ih
+        self._dec_x = self.dec_emb @ self.dec_w_ih.T + self.dec_b_ih
+        # (128, 3*128)
+        self._enc_w_hh_t = np.ascontiguousarray(self.enc_w_hh.T)
+        self._dec_w_hh_t = np.ascontiguousarray(self.dec_w_hh.T)
+        # (128, 74)
+        self._fc_w_t = np.ascontiguousarray(self.fc_w.T)
 
     def _sigmoid(self, x):
         return 1 / (1 + np.exp(-x))
 
-    def _grucell(self, x, h, w_ih, w_hh, b_ih, b_hh):
-        rzn_ih = np.matmul(x, w_ih.T) + b_ih
-        rzn_hh = np.matmul(h, w_hh.T) + b_hh
+    def _grucell(self, x_proj, h, w_hh_t, b_hh):
+        # x_proj: input projection of the (r, z, n) gates, (b, 3*h)
+        rzn_hh = h @ w_hh_t + b_hh
+        size = h.shape[-1]
 
-        rz_ih, n_ih = (
-            rzn_ih[:, : rzn_ih.shape[-1] * 2 // 3],
-            rzn_ih[:, rzn_ih.shape[-1] * 2 // 3:],
-        )
-        rz_hh, n_hh = (
-            rzn_hh[:, : rzn_hh.shape[-1] * 2 // 3],
-            rzn_hh[:, rzn_hh.shape[-1] * 2 // 3:],
-        )
+        rz = self._sigmoid(x_proj[:, : size * 2] + rzn_hh[:, : size * 2])
+        r, z = rz[:, :size], rz[:, size:]
 
-        rz = self._sigmoid(rz_ih + rz_hh)
-        r, z = np.split(rz, 2, -1)
-
-        n = np.tanh(n_ih + r * n_hh)
+        n = np.tanh(x_proj[:, size * 2:] + r * rzn_hh[:, size * 2:])
         h = (1 - z) * n + z * h
 
         return h
 
-    def _gru(self, x, steps, w_ih, w_hh, b_ih, b_hh, h0=None) -> np.ndarray:
-        if h0 is None:
-            h0 = np.zeros((x.shape[0], w_hh.shape[1]), np.float32)
-        h = h0  # initial hidden state
-
-        outputs = np.zeros((x.shape[0], steps, w_hh.shape[1]), np.float32)
-        for t in range(steps):
-            h = self._grucell(x[:, t, :], h, w_ih, w_hh, b_ih, b_hh)  # (b, h)
-            outputs[:, t, ::] = h
-
-        return outputs
-
-    def _encode(self, word: str) -> np.ndarray:
-        chars = list(word) + ["</s>"]
-        x = [self.g2idx.get(char, self.g2idx["<unk>"]) for char in chars]
-        x = np.take(self.enc_emb, np.expand_dims(x, 0), axis=0)
-
-        return x
-
     def _short_word(self, word: str) -> Union[str, None]:
         self.word = word
         if self.word.endswith("."):
@@ -137,59 +129,112 @@ class Thai_W2P(object):
             return self.word
         return None
 
-    def _predict(self, word: str) -> str:
-        short_word = self._short_word(word)
-        if short_word is not None:
-            return short_word
-
-        # encoder
-        enc = self._encode(word)
-        enc = self._gru(
-            enc,
-            len(word) + 1,
-            self.enc_w_ih,
-            self.enc_w_hh,
-            self.enc_b_ih,
-            self.enc_b_hh,
-            h0=np.zeros((1, self.enc_w_hh.shape[-1]), np.float32),
-        )
-        last_hidden = enc[:, -1, :]
-
-        # decoder
-        dec = np.take(self.dec_emb, [2], axis=0)  # 2: <s>
-        h = last_hidden
-
-        preds = []
-        for _ in range(20):
+    def _predict_batch(self, words: List[str]) -> List[str]:
+        # words are sorted by length, longest first
+        lengths = [len(word) + 1 for word in words]
+        unk = self.g2idx["<unk>"]
+        x = np.zeros((len(words), lengths[0]), np.int64)
+        for i, word in enumerate(words):
+            x[i, : lengths[i]] = [self.g2idx.get(ch, unk) for ch in word] + [
+                self.g2idx["</s>"]
+            ]
+
+        # encoder, words still being read at step t are the first ones
+        h = np.zeros((len(words), self._enc_w_hh_t.shape[0]), np.float32)
+        active = len(words)
+        for t in range(lengths[0]):
+            while lengths[active - 1] <= t:
+                active -= 1
+            h[:active] = self._grucell(
+                self._enc_x[x[:active, t]],
+                h[:active],
+                self._enc_w_hh_t,
+                self.enc_b_hh,
+            )
+
+        # greedy decoder, all words in lock-step
+        dec = np.full(len(words), 2)  # 2: <s>
+        preds = np.zeros((len(words), 20), np.int64)
+        n_preds = np.full(len(words), 20)
+        finished = np.zeros(len(words), bool)
+        for t in range(20):
             h = self._grucell(
-                dec,
-                h,
-                self.dec_w_ih,
-                self.dec_w_hh,
-                self.dec_b_ih,
-                self.dec_b_hh,
+                self._dec_x[dec], h, self._dec_w_hh_t, self.dec_b_hh
             )  # (b, h)
-            logits = np.matmul(h, self.fc_w.T) + self.fc_b
-            pred = logits.argmax()
-            if pred == 3:
+            logits = h @ self._fc_w_t + self.fc_b
+            dec = logits.argmax(-1)
+            preds[:, t] = dec
+            ended = (dec == 3) & ~finished  # 3: </s>
+            n_preds[ended] = t
+            finished |= ended
+            if finished.all():
                 break
-            preds.append(pred)
-            dec = np.take(self.dec_emb, [pred], axis=0)
-
-        preds = [self.idx2p.get(idx, "<unk>") for idx in preds]
 
-        return preds
+        return [
+            "".join(self.idx2p.get(idx, "<unk>") for idx in pred[:n])
+            for pred, n in zip(preds.tolist(), n_preds.tolist())
+        ]
+
+    def pronunciate_batch(
+        self, words: Iterable[str], batch_size: int = hp.batch_size
+    ) -> List[str]:
+        """
+        Convert many Thai words to their pronunciations in Thai letters.
+
+        Words are sorted by length and run through the encoder and
+        decoder together in batches, as matrix multiplications.
+        Pronunciations are cached, so repeated words are converted once.
+
+        :param Iterable[str] words: Thai words
+        :param int batch_size: number of words converted together
+        :return: pronunciations, in the order of `words`
+        :rtype: List[str]
+        """
+        words = list(words)
+        prons = {}
+        missing = []
+        for word in dict.fromkeys(words):
+            cached = self._cache.get(word)
+            if cached is not None:
+                prons[word] = cached
+            elif not any(letter in word for letter in self.graphemes):
+                prons[word] = word
+            else:
+                short_word = self._short_word(word)
+                if short_word is not None:
+                    prons[word] = short_word
+                else:  # predict for oov
+                    missing.append(word)
+
+        missing.sort(key=len, reverse=True)
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            prons.update(zip(batch, self._predict_batch(batch)))
+
+        with self._cache_lock:
+            for word in missing:
+                if len(self._cache) >= _CACHE_SIZE:
+                    del self._cache[next(iter(self._cache))]
+                self._cache[word] = prons[word]
+        return [prons[word] for word in words]
 
     def __call__(self, word: str) -> str:
-        if not any(letter in word for letter in self.graphemes):
-            pron = [word]
-        else:  # predict for oov
-            pron = self._predict(word)
+        return self.pronunciate_batch([word])[0]
 
-        return "".join(pron)
 
+# constructed on first use, so the model is loaded (or downloaded)
+# only when it is needed
+_THAI_W2P = None
+_W2P_LOCK = threading.Lock()
 
-_THAI_W2P = Thai_W2P()
+
+def _get_w2p() -> Thai_W2P:
+    global _THAI_W2P
+    if _THAI_W2P is None:
+        with _W2P_LOCK:
+            if _THAI_W2P is None:
+                _THAI_W2P = Thai_W2P()
+    return _THAI_W2P
 
 
 def pronunciate(text: str) -> str:
@@ -203,5 +248,28 @@ def pronunciate(text: str) -> str:
     :return: A string of Thai letters indicating
              how the input text should be pronounced.
     """
-    global _THAI_W2P
-    return _THAI_W2P(text)
+    return _get_w2p()(text)
+
+
+def pronunciate_batch(
+    texts: Iterable[str], batch_size: int = hp.batch_size
+) -> List[str]:
+    """
+    Convert many Thai words to their pronunciations in Thai letters
+    (see :meth:`Thai_W2P.pronunciate_batch`).
+
+    :param Iterable[str] texts: Thai words, one word each
+    :param int batch_size: number of words converted together
+
+    :return: pronunciations, in the order of `texts`
+    :rtype: List[str]
+
+    :Example:
+    ::
+
+        from pythainlp.transliterate.w2p import pronunciate_batch
+
+        pronunciate_batch(["สามารถ", "ภาพยนตร์", "สามารถ"])
+        # output: ['สา-มาด', 'พาบ-พะ-ยน', 'สา-มาด']
+    """
+    return _get_w2p().pronunciate_batch(texts, batch_size=batch_size)
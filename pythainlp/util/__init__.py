@@ -4,6 +4,7 @@ Utility functions, like date conversion and digit conversion
 """
 
 __all__ = [
+    "KeywordCounter",
     "Trie",
     "arabic_digit_to_thai_digit",
     "bahttext",
@@ -19,6 +20,7 @@ __all__ = [
     "isthai",
     "isthaichar",
     "normalize",
+    "normalize_batch",
     "now_reign_year",
     "num_to_thaiword",
     "rank",
@@ -68,9 +70,10 @@ from pythainlp.util.keyboard import (
 )
 from pythainlp.util.emojiconv import emoji_to_thai
 from pythainlp.util.keyboard import eng_to_thai, thai_to_eng
-from pythainlp.util.keywords import find_keyword, rank
+from pythainlp.util.keywords import KeywordCounter, find_keyword, rank
 from pythainlp.util.normalize import (
     normalize,
+    normalize_batch,
     maiyamok,
     remove_dangling,
     remove_dup_spaces,
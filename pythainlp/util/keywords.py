@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import heapq
+import math
+from array import array
 from collections import Counter
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from pythainlp.corpus import thai_stopwords
 
@@ -99,3 +103,247 @@ def find_keyword(word_list: List[str], min_len: int = 3) -> Dict[str, int]:
     word_list = rank(word_list, exclude_stopwords=True)
 
     return {k: v for k, v in word_list.items() if v >= min_len}
+
+
+def _hashes(word: str, depth: int, width: int) -> List[int]:
+    # stable across processes (unlike hash()), so sketches can be merged
+    digest = hashlib.blake2b(word.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % width for i in range(depth)]
+
+
+class KeywordCounter:
+    """
+    Count keywords over a stream of documents.
+
+    Documents (lists or iterators of words) are added one by one with
+    :meth:`update`. The counter keeps word counts and document
+    frequencies, so top keywords by count or by TF-IDF can be read
+    at any time. Counters built in parallel workers can be combined
+    with :meth:`merge`.
+
+    By default, counts are exact and memory grows with the vocabulary.
+    If `capacity` is given, memory is bounded:
+
+        * word counts are kept for at most about `2 * capacity` words,
+          with the Space-Saving algorithm. Counts of frequent words are
+          estimates that can be too high by at most :attr:`error`.
+        * document frequencies are kept in a Count-Min sketch of
+          `df_depth` rows of `df_width` counters. Estimates can be
+          too high, never too low.
+
+    :param bool exclude_stopwords: do not count Thai stopwords
+    :param int capacity: number of words to keep counts for
+        (default: None, keep exact counts of all words)
+    :param int df_width: width of Count-Min sketch (used with `capacity`)
+    :param int df_depth: depth of Count-Min sketch (used with `capacity`)
+
+    :Example:
+    ::
+
+        from pythainlp.util import KeywordCounter
+
+        counter = KeywordCounter(exclude_stopwords=True, capacity=10000)
+        for post in posts:
+            counter.update(word_tokenize(post))
+
+        counter.top_k(3)
+        # output: [('แมว', 120), ('หมา', 98), ('ปลา', 40)]
+
+        counter.top_k(3, by="tfidf")
+
+        # combine counters from parallel workers
+        total = KeywordCounter(exclude_stopwords=True, capacity=10000)
+        for part in partial_counters:
+            total.merge(part)
+    """
+
+    def __init__(
+        self,
+        exclude_stopwords: bool = False,
+        capacity: Optional[int] = None,
+        df_width: int = 2 ** 16,
+        df_depth: int = 4,
+    ) -> None:
+        self.exclude_stopwords = exclude_stopwords
+        self.capacity = capacity
+        self.df_width = df_width
+        self.df_depth = df_depth
+        self.n_words = 0
+        self.n_documents = 0
+        self.error = 0  # largest count of words dropped by Space-Saving
+        self._counts = Counter()
+        if capacity is None:
+            self._df = Counter()
+        else:
+            self._df = [
+                array("q", bytes(8 * df_width)) for _ in range(df_depth)
+            ]
+
+    def update(self, words: Iterable[str]) -> None:
+        """
+        Add words of one document.
+
+        :param Iterable[str] words: words of a document
+        """
+        if self.exclude_stopwords:
+            counts = Counter(w for w in words if w not in _STOPWORDS)
+        else:
+            counts = Counter(words)
+        self.n_documents += 1
+        self.n_words += sum(counts.values())
+        self._add_counts(counts)
+        if self.capacity is None:
+            self._df.update(counts.keys())
+        else:
+            for word in counts:
+                for row, i in zip(
+                    self._df, _hashes(word, self.df_depth, self.df_width)
+                ):
+                    row[i] += 1
+
+    def update_many(self, documents: Iterable[Iterable[str]]) -> None:
+        """
+        Add many documents.
+
+        :param Iterable[Iterable[str]] documents: documents,
+            each is an iterable of words
+        """
+        for words in documents:
+            self.update(words)
+
+    def _add_counts(self, counts: Dict[str, int]) -> None:
+        if self.capacity is None:
+            self._counts.update(counts)
+            return
+        for word, count in counts.items():
+            if word in self._counts:
+                self._counts[word] += count
+            else:
+                # a new word may have been dropped before
+                self._counts[word] = self.error + count
+        if len(self._counts) > 2 * self.capacity:
+            self._compact()
+
+    def _compact(self) -> None:
+        # keep the `capacity` most frequent words (amortized Space-Saving)
+        kept = heapq.nlargest(
+            self.capacity, self._counts.items(), key=lambda x: x[1]
+        )
+        kept_words = {word for word, _ in kept}
+        for word, count in self._counts.items():
+            if word not in kept_words and count > self.error:
+                self.error = count
+        self._counts = Counter(dict(kept))
+
+    def count(self, word: str) -> int:
+        """
+        Get (estimated) count of a word.
+
+        :param str word: word
+        :return: number of times the word was seen
+        :rtype: int
+        """
+        return self._counts.get(word, 0)
+
+    def document_frequency(self, word: str) -> int:
+        """
+        Get (estimated) number of documents that contain a word.
+
+        :param str word: word
+        :return: number of documents
+        :rtype: int
+        """
+        if self.capacity is None:
+            return self._df.get(word, 0)
+        return min(
+            row[i]
+            for row, i in zip(
+                self._df, _hashes(word, self.df_depth, self.df_width)
+            )
+        )
+
+    def tfidf(self, word: str) -> float:
+        """
+        Get TF-IDF score of a word over all documents seen.
+
+        The score is `count * (log((1 + N) / (1 + df)) + 1)`, where `N` is
+        the number of documents and `df` is the document frequency.
+
+        :param str word: word
+        :return: TF-IDF score
+        :rtype: float
+        """
+        idf = math.log(
+            (1 + self.n_documents) / (1 + self.document_frequency(word))
+        ) + 1
+        return self.count(word) * idf
+
+    def top_k(
+        self, k: Optional[int] = 10, by: str = "count"
+    ) -> List[Tuple[str, float]]:
+        """
+        Get top keywords.
+
+        :param int k: number of keywords (`None` for all counted words)
+        :param str by: *count* (default) or *tfidf*
+        :return: list of (word, score), highest score first
+        :rtype: List[Tuple[str, float]]
+        """
+        if by == "count":
+            scores = self._counts.items()
+        elif by == "tfidf":
+            scores = ((word, self.tfidf(word)) for word in self._counts)
+        else:
+            raise ValueError(f"Unknown ranking: {by!r}")
+        if k is None:
+            return sorted(scores, key=lambda x: x[1], reverse=True)
+        return heapq.nlargest(k, scores, key=lambda x: x[1])
+
+    def merge(self, other: "KeywordCounter") -> "KeywordCounter":
+        """
+        Add counts of another counter (e.g. from a parallel worker)
+        to this counter.
+
+        Both counters must have the same `capacity`, `df_width`
+        and `df_depth`.
+
+        :param KeywordCounter other: counter to be merged
+        :return: this counter
+        :rtype: KeywordCounter
+        """
+        if (self.capacity, self.df_width, self.df_depth) != (
+            other.capacity, other.df_width, other.df_depth
+        ):
+            raise ValueError(
+                "Counters with different capacity or sketch size "
+                "cannot be merged."
+            )
+        self.n_words += other.n_words
+        self.n_documents += other.n_documents
+        if self.capacity is None:
+            self._counts.update(other._counts)
+            self._df.update(other._df)
+            return self
+
+        # a word missing from one summary may have a count up to
+        # its error there
+        # keep the order of first appearance, so ties are deterministic
+        counts = Counter()
+        for word in self._counts:
+            counts[word] = self._counts[word] + other._counts.get(
+                word, other.error
+            )
+        for word in other._counts:
+            if word not in counts:
+                counts[word] = self.error + other._counts[word]
+        self._counts = counts
+        self.error += other.error
+        for row, other_row in zip(self._df, other._df):
+            for i, value in enumerate(other_row):
+                if value:
+                    row[i] += value
+        if len(self._counts) > 2 * self.capacity:
+            self._compact()
+        return self
@@ -3,7 +3,7 @@
 Text normalization
 """
 import re
-from typing import List, Union
+from typing import Iterable, List, Union
 import warnings
 
 from pythainlp import thai_above_vowels as above_v
@@ -18,6 +18,9 @@ _DANGLING_CHARS = f"{above_v}{below_v}{tonemarks}\u0e3a\u0e4c\u0e4d\u0e4e"
 _RE_REMOVE_DANGLINGS = re.compile(f"^[{_DANGLING_CHARS}]+")
 
 _ZERO_WIDTH_CHARS = "\u200b\u200c"  # ZWSP, ZWNJ
+_ZERO_WIDTH_TABLE = str.maketrans("", "", _ZERO_WIDTH_CHARS)
+
+_TONEMARKS_TABLE = str.maketrans("", "", tonemarks)
 
 _REORDER_PAIRS = [
     ("\u0e40\u0e40", "\u0e41"),  # Sara E + Sara E -> Sara Ae
@@ -35,18 +38,29 @@ _REORDER_PAIRS = [
     ),  # FOLLOW VOWEL + TONEMARK+ -> TONEMARK + FOLLOW VOWEL
     ("([^\u0e24\u0e26])\u0e45", "\\1\u0e32"),  # Lakkhangyao -> Sara Aa
 ]
+_RE_REORDER_PAIRS = [
+    (re.compile(pattern), repl) for pattern, repl in _REORDER_PAIRS
+]
 
 # VOWELS + Phinthu, Thanthakhat, Nikhahit, Yamakkan
 _NOREPEAT_CHARS = (
     f"{follow_v}{lead_v}{above_v}{below_v}\u0e3a\u0e4c\u0e4d\u0e4e"
 )
-_NOREPEAT_PAIRS = list(
-    zip([f"({ch}[ ]*)+{ch}" for ch in _NOREPEAT_CHARS], _NOREPEAT_CHARS)
+
+# A character in _NOREPEAT_CHARS repeating (possibly with spaces in between),
+# or a run of tone marks. Matches of different characters can never overlap,
+# so all of them can be replaced in one pass, keeping the last character.
+_RE_NOREPEAT_TONEMARKS = re.compile(
+    f"([{_NOREPEAT_CHARS}])(?:[ ]*\\1)+|[{tonemarks}]{{2,}}"
 )
 
-_RE_TONEMARKS = re.compile(f"[{tonemarks}]+")
+# Spaces around newlines become one newline, other runs of spaces
+# become one space.
+_RE_DUP_SPACES = re.compile("[ \n]*\n[ \n]*| {2,}")
 
-_RE_REMOVE_NEWLINES = re.compile("[ \n]*\n[ \n]*")
+
+def _dup_space(matchobj):  # to be used with _RE_DUP_SPACES
+    return "\n" if "\n" in matchobj.group(0) else " "
 
 
 def _last_char(matchobj):  # to be used with _RE_NOREPEAT_TONEMARKS
@@ -100,11 +114,7 @@ def remove_dup_spaces(text: str) -> str:
         remove_dup_spaces('ก    ข    ค')
         # output: 'ก ข ค'
     """
-    while "  " in text:
-        text = text.replace("  ", " ")
-    text = _RE_REMOVE_NEWLINES.sub("\n", text)
-    text = text.strip()
-    return text
+    return _RE_DUP_SPACES.sub(_dup_space, text).strip()
 
 
 def remove_tonemark(text: str) -> str:
@@ -134,10 +144,7 @@ def remove_tonemark(text: str) -> str:
         remove_tonemark('สองพันหนึ่งร้อยสี่สิบเจ็ดล้านสี่แสนแปดหมื่นสามพันหกร้อยสี่สิบเจ็ด')
         # output: สองพันหนึงรอยสีสิบเจ็ดลานสีแสนแปดหมืนสามพันหกรอยสีสิบเจ็ด
     """
-    for ch in tonemarks:
-        while ch in text:
-            text = text.replace(ch, "")
-    return text
+    return text.translate(_TONEMARKS_TABLE)
 
 
 def remove_zw(text: str) -> str:
@@ -156,11 +163,7 @@ def remove_zw(text: str) -> str:
     :return: text without zero-width characters
     :rtype: str
     """
-    for ch in _ZERO_WIDTH_CHARS:
-        while ch in text:
-            text = text.replace(ch, "")
-
-    return text
+    return text.translate(_ZERO_WIDTH_TABLE)
 
 
 def reorder_vowels(text: str) -> str:
@@ -179,8 +182,8 @@ def reorder_vowels(text: str) -> str:
     :return: text with vowels and tone marks in the standard logical order
     :rtype: str
     """
-    for pair in _REORDER_PAIRS:
-        text = re.sub(pair[0], pair[1], text)
+    for pattern, repl in _RE_REORDER_PAIRS:
+        text = pattern.sub(repl, text)
 
     return text
 
@@ -197,13 +200,10 @@ def remove_repeat_vowels(text: str) -> str:
     :rtype: str
     """
     text = reorder_vowels(text)
-    for pair in _NOREPEAT_PAIRS:
-        text = re.sub(pair[0], pair[1], text)
 
-    # remove repeating tone marks, use last tone mark
-    text = _RE_TONEMARKS.sub(_last_char, text)
-
-    return text
+    # remove repeating vowels and signs, and repeating tone marks
+    # (use last tone mark), in one pass
+    return _RE_NOREPEAT_TONEMARKS.sub(_last_char, text)
 
 
 def normalize(text: str) -> str:
@@ -248,6 +248,30 @@ def normalize(text: str) -> str:
     return text
 
 
+def normalize_batch(texts: Iterable[str]) -> List[str]:
+    """
+    Normalize many texts with the same rules as :func:`normalize`.
+
+    Each distinct text is normalized only once, which helps when
+    the same messages appear many times in the input.
+
+    :param Iterable[str] texts: input texts
+    :return: normalized texts, in the order of `texts`
+    :rtype: List[str]
+
+    :Example:
+    ::
+
+        from pythainlp.util import normalize_batch
+
+        normalize_batch(['เเปลก', 'นานาาา', 'เเปลก'])
+        # output: ['แปลก', 'นานา', 'แปลก']
+    """
+    texts = list(texts)
+    normalized = {text: normalize(text) for text in dict.fromkeys(texts)}
+    return [normalized[text] for text in texts]
+
+
 def maiyamok(sent: Union[str, List[str]]) -> List[str]:
     """
     Thai MaiYaMok
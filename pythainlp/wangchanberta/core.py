@@ -67,49 +67,74 @@ class ThaiNameTagger:
         :rtype: Union[list[tuple[str, str]]], str
         """
         text = re.sub(" ", "<_>", text)
-        self.json_ner = self.classify_tokens(text)
-        self.output = ""
+        json_ner = self.classify_tokens(text)
+        return self._build_output(json_ner, tag)
+
+    def get_ner_batch(
+        self, texts: List[str], tag: bool = False, batch_size: int = 8
+    ) -> List[Union[List[Tuple[str, str]], str]]:
+        """
+        This function tags named-entitiy from many texts in IOB format.
+        Texts are padded and run through the model in batches.
+
+        :param List[str] texts: list of texts in Thai to be tagged
+        :param bool tag: output like html tag.
+        :param int batch_size: number of texts in one forward pass
+        :return: list of outputs of :meth:`get_ner`, in the order of `texts`
+        :rtype: List[Union[list[tuple[str, str]]], str]]
+        """
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self.get_ner(texts[0], tag=tag)]
+        texts = [re.sub(" ", "<_>", text) for text in texts]
+        outputs = self.classify_tokens(texts, batch_size=batch_size)
+        return [self._build_output(json_ner, tag) for json_ner in outputs]
+
+    def _build_output(
+        self, json_ner: List[dict], tag: bool
+    ) -> Union[List[Tuple[str, str]], str]:
         if self.grouped_entities and self.dataset_name == "thainer":
-            self.sent_ner = [
+            sent_ner = [
                 (
                     i['word'].replace("<_>", " ").replace('▁', ''),
                     self._IOB(i['entity_group'])
-                ) for i in self.json_ner
+                ) for i in json_ner
             ]
         elif self.dataset_name == "thainer":
-            self.sent_ner = [
+            sent_ner = [
                 (
                     i['word'].replace("<_>", " ").replace('▁', ''), i['entity']
-                ) for i in self.json_ner if i['word'] != '▁'
+                ) for i in json_ner if i['word'] != '▁'
             ]
         elif self.grouped_entities and self.dataset_name == "lst20":
-            self.sent_ner = [
+            sent_ner = [
                 (
                     i['word'].replace("<_>", " ").replace('▁', ''),
                     i['entity_group'].replace('_', '-').replace('E-', 'I-')
-                ) for i in self.json_ner
+                ) for i in json_ner
             ]
         else:
-            self.sent_ner = [
+            sent_ner = [
                 (
                     i['word'].replace("<_>", " ").replace('▁', ''),
                     i['entity'].replace('_', '-').replace('E-', 'I-')
-                ) for i in self.json_ner
+                ) for i in json_ner
             ]
-        if self.sent_ner[0][0] == '' and len(self.sent_ner) > 1:
-            self.sent_ner = self.sent_ner[1:]
-        for idx, (word, ner) in enumerate(self.sent_ner):
+        if sent_ner[0][0] == '' and len(sent_ner) > 1:
+            sent_ner = sent_ner[1:]
+        for idx, (word, ner) in enumerate(sent_ner):
             if idx > 0 and ner.startswith("B-"):
                 if (
                     self._clear_tag(ner) == self._clear_tag(
-                        self.sent_ner[idx-1][1]
+                        sent_ner[idx-1][1]
                     )
                 ):
-                    self.sent_ner[idx] = (word, ner.replace('B-', 'I-'))
+                    sent_ner[idx] = (word, ner.replace('B-', 'I-'))
         if tag:
             temp = ""
             sent = ""
-            for idx, (word, ner) in enumerate(self.sent_ner):
+            for idx, (word, ner) in enumerate(sent_ner):
                 if ner.startswith("B-") and temp != "":
                     sent += "</" + temp + ">"
                     temp = ner[2:]
@@ -122,12 +147,12 @@ class ThaiNameTagger:
                     temp = ""
                 sent += word
 
-                if idx == len(self.sent_ner) - 1 and temp != "":
+                if idx == len(sent_ner) - 1 and temp != "":
                     sent += "</" + temp + ">"
 
             return sent
         else:
-            return self.sent_ner
+            return sent_ner
 
 
 def segment(text: str) -> List[str]:
@@ -52,23 +52,22 @@ class PosTagTransformers:
             self.corpus = corpus
             self.load()
         text = re.sub(" ", "<_>", text)
-        self.json_pos = self.classify_tokens(text)
-        self.output = ""
+        json_pos = self.classify_tokens(text)
         if grouped_word:
-            self.sent_pos = [
+            sent_pos = [
                 (
                     i['word'].replace("<_>", " "), i['entity_group']
-                ) for i in self.json_pos
+                ) for i in json_pos
             ]
         else:
-            self.sent_pos = [
+            sent_pos = [
                 (
                     i['word'].replace("<_>", " ").replace('▁', ''),
                     i['entity']
                 )
-                for i in self.json_pos if i['word'] != '▁'
+                for i in json_pos if i['word'] != '▁'
             ]
-        return self.sent_pos
+        return sent_pos
 
 
 _corpus = "lst20"
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pythainlp import aio
+from pythainlp.tokenize import word_tokenize
+from pythainlp.util import normalize
+
+
+class _FakeNER:
+    def __init__(self):
+        self.batches = []
+
+    def tag(self, text, pos=True, tag=False):
+        return [(text, "O")]
+
+    def tag_batch(self, texts, pos=True, tag=False, batch_size=8):
+        self.batches.append((len(texts), batch_size))
+        return [self.tag(text, pos=pos, tag=tag) for text in texts]
+
+
+class TestAioPackage(unittest.TestCase):
+    def test_wrappers(self):
+        text = "ฉันรักภาษาไทยเพราะฉันเป็นคนไทย"
+
+        async def main():
+            return await asyncio.gather(
+                aio.word_tokenize(text),
+                aio.word_tokenize(text, engine="longest"),
+                aio.romanize("แมว"),
+            )
+
+        result = asyncio.run(main())
+        self.assertEqual(result[0], word_tokenize(text))
+        self.assertEqual(result[1], word_tokenize(text, engine="longest"))
+        self.assertIsInstance(result[2], str)
+
+    def test_executor(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        aio.set_executor(executor)
+        try:
+            self.assertIs(aio.get_executor(), executor)
+            self.assertEqual(asyncio.run(aio.run(sum, [1, 2, 3])), 6)
+        finally:
+            aio.set_executor(None)
+            executor.shutdown()
+        self.assertIsNone(aio.get_executor())
+
+    def test_micro_batcher(self):
+        batch_sizes = []
+
+        def batch_func(items):
+            batch_sizes.append(len(items))
+            return [x * 2 for x in items]
+
+        async def main():
+            batcher = aio.MicroBatcher(
+                batch_func, max_batch_size=8, max_wait=0.05, max_queue_size=4
+            )
+            results = await asyncio.gather(
+                *[batcher.submit(i) for i in range(20)]
+            )
+            await batcher.close()
+            return results
+
+        self.assertEqual(asyncio.run(main()), [i * 2 for i in range(20)])
+        self.assertEqual(sum(batch_sizes), 20)
+        self.assertTrue(all(n <= 8 for n in batch_sizes))
+        self.assertLess(len(batch_sizes), 20)
+
+        def bad_batch_func(items):
+            raise RuntimeError("error")
+
+        async def main_error():
+            batcher = aio.MicroBatcher(bad_batch_func)
+            try:
+                return await batcher.submit(1)
+            finally:
+                await batcher.close()
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(main_error())
+
+        with self.assertRaises(ValueError):
+            aio.MicroBatcher(batch_func, max_batch_size=0)
+
+    def test_method_wrappers(self):
+        class FakeTranslate:
+            def translate(self, text):
+                return text.upper()
+
+        async def main():
+            return await asyncio.gather(
+                aio.ner_tag(_FakeNER(), "แมว", tag=True),
+                aio.translate(FakeTranslate(), "cat"),
+            )
+
+        self.assertEqual(asyncio.run(main()), [[("แมว", "O")], "CAT"])
+
+    def test_batchers(self):
+        ner = _FakeNER()
+        texts = ["เเปลก", "นานาาา", "แมว"] * 4
+
+        async def main():
+            ner_batcher = aio.ner_batcher(ner, max_batch_size=4, max_wait=0.05)
+            normalizer = aio.normalize_batcher()
+            results = await asyncio.gather(
+                *[ner_batcher.submit(text) for text in texts],
+                *[normalizer.submit(text) for text in texts],
+            )
+            await ner_batcher.close()
+            await normalizer.close()
+            return results
+
+        results = asyncio.run(main())
+        self.assertEqual(
+            results[: len(texts)], [[(text, "O")] for text in texts]
+        )
+        self.assertEqual(
+            results[len(texts):], [normalize(text) for text in texts]
+        )
+        self.assertEqual(sum(n for n, _ in ner.batches), len(texts))
+        self.assertTrue(all(n <= 4 and b == 4 for n, b in ner.batches))
+
+    def test_micro_batcher_restart(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            batcher = aio.MicroBatcher(lambda items: [x * 2 for x in items])
+            # a stopped worker, with an item left in its queue
+            batcher._queue = asyncio.Queue()
+            batcher._loop = loop
+            left = loop.create_future()
+            batcher._queue.put_nowait((1, left))
+            batcher._worker = loop.create_future()
+            batcher._worker.set_result(None)
+
+            result = await batcher.submit(2)
+            left_result = await asyncio.wait_for(left, 1)
+            await batcher.close()
+            return result, left_result
+
+        self.assertEqual(asyncio.run(main()), (4, 2))
+
+    def test_micro_batcher_close_during_collect(self):
+        async def main():
+            batcher = aio.MicroBatcher(
+                lambda items: items, max_batch_size=8, max_wait=10
+            )
+            tasks = [
+                asyncio.ensure_future(batcher.submit(i)) for i in range(2)
+            ]
+            # both items are taken off the queue, the batch is not full
+            while batcher._queue is None or not batcher._queue.empty():
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.01)
+            await batcher.close()
+            return await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True), 1
+            )
+
+        results = asyncio.run(main())
+        self.assertTrue(
+            all(isinstance(r, asyncio.CancelledError) for r in results)
+        )
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import gzip
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 from pythainlp.augment import WordNetAug
 from pythainlp.augment.wordnet import postype2wordnet
 from pythainlp.augment.lm import Thai2transformersAug
@@ -23,18 +28,80 @@ class TestTextaugmentPackage(unittest.TestCase):
         self.assertIsNotNone(wordnetaug.augment(self.text))
         self.assertIsNotNone(wordnetaug.find_synonyms("ผม", pos=None))
         self.assertIsNotNone(wordnetaug.augment(self.text, postag=False))
+        self.assertEqual(
+            wordnetaug.augment_batch([self.text, self.text2]),
+            [wordnetaug.augment(self.text), wordnetaug.augment(self.text2)],
+        )
         self.assertIsNone(postype2wordnet('n', 'abc'))
         self.assertIsNotNone(postype2wordnet('NOUN', 'orchid'))
 
+    def test_WordNetAug_pos(self):
+        index = {
+            "ไป": {"": ["ไป", "ไปยัง", "เดินทาง"], "v": ["ไป", "เดินทาง"]},
+            "แมว": {"": ["แมว", "วิฬาร์"], "n": ["แมว", "วิฬาร์"]},
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "synonyms.json.gz")
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                json.dump({"version": 1, "index": index}, f)
+            aug = WordNetAug(index_path=path)
+            self.assertEqual(
+                aug.find_synonyms("ไป"), ["ไป", "ไปยัง", "เดินทาง"]
+            )
+            self.assertEqual(aug.find_synonyms("ไป", "VV"), ["ไป", "เดินทาง"])
+            self.assertEqual(aug.find_synonyms("ไป", "NN"), [])
+            # no wordnet type for the tag: all part of speech
+            self.assertEqual(len(aug.find_synonyms("ไป", "PS")), 3)
+            self.assertFalse(hasattr(aug, "synonyms_without_duplicates"))
+
+            tokenize = str.split
+            with mock.patch(
+                "pythainlp.augment.wordnet.pos_tag_sents",
+                return_value=[[("แมว", "NN"), ("ไป", "VV")]],
+            ) as tagger:
+                self.assertEqual(
+                    aug.augment_batch(["แมว ไป"], tokenize=tokenize),
+                    [[
+                        ("แมว", "ไป"),
+                        ("แมว", "เดินทาง"),
+                        ("วิฬาร์", "ไป"),
+                        ("วิฬาร์", "เดินทาง"),
+                    ]],
+                )
+            tagger.assert_called_once()
+            with mock.patch(
+                "pythainlp.augment.wordnet.pos_tag_sents"
+            ) as tagger:
+                self.assertEqual(
+                    len(
+                        aug.augment_batch(
+                            ["แมว ไป"], tokenize=tokenize, postag=False
+                        )[0]
+                    ),
+                    6,
+                )
+            tagger.assert_not_called()
+
     def test_Thai2fitAug(self):
         _aug = Thai2fitAug()
         self.assertIsNotNone(_aug.tokenizer(self.text))
         self.assertIsNotNone(_aug.augment(self.text, n_sent=3, p=0.5))
+        self.assertEqual(
+            _aug.augment_batch([self.text, self.text2], n_sent=3, p=0.5),
+            [
+                _aug.augment(self.text, n_sent=3, p=0.5),
+                _aug.augment(self.text2, n_sent=3, p=0.5),
+            ],
+        )
 
     def test_BPEmbAug(self):
         _aug = BPEmbAug()
         self.assertIsNotNone(_aug.tokenizer(self.text))
         self.assertIsNotNone(_aug.augment(self.text, n_sent=3, p=0.5))
+        self.assertEqual(
+            _aug.augment_batch([self.text], n_sent=3, p=0.5),
+            [_aug.augment(self.text, n_sent=3, p=0.5)],
+        )
 
     def test_LTW2VAug(self):
         _aug = LTW2VAug()
@@ -44,3 +111,13 @@ class TestTextaugmentPackage(unittest.TestCase):
     def test_Thai2transformersAug(self):
         _aug = Thai2transformersAug()
         self.assertIsNotNone(_aug.augment(self.text2, num_replace_tokens=1))
+        self.assertEqual(
+            _aug.augment_batch(
+                [self.text2, "", self.text2], num_replace_tokens=1
+            ),
+            [
+                _aug.augment(self.text2, num_replace_tokens=1),
+                [],
+                _aug.augment(self.text2, num_replace_tokens=1),
+            ],
+        )
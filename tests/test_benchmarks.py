@@ -1,8 +1,9 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 import yaml
-from pythainlp.benchmarks import word_tokenization
+from pythainlp.benchmarks import throughput, word_tokenization
 
 with open("./tests/data/sentences.yml", "r", encoding="utf8") as stream:
     TEST_DATA = yaml.safe_load(stream)
@@ -85,3 +86,39 @@ class TestBenchmarksPackage(unittest.TestCase):
 
         actual = word_tokenization._flatten_result(result)
         self.assertEqual(actual, {"key1:v1": 6, "key2:v2": 7})
+
+    def test_ner_batch_throughput(self):
+        class FakeNER:
+            def __init__(self, engine):
+                pass
+
+            def tag(self, text, pos=True):
+                return [(text, "O")]
+
+            def tag_batch(self, texts, pos=True, batch_size=8):
+                return [[(text, "O")] for text in texts]
+
+        with mock.patch("pythainlp.tag.NER", FakeNER):
+            result = throughput.ner_batch(20, batch_size=4)
+        self.assertEqual(set(result), {"tag", "tag_batch"})
+        self.assertTrue(all(v > 0 for v in result.values()))
+
+        FakeNER.tag_batch = lambda self, texts, pos=True, batch_size=8: [
+            [] for _ in texts
+        ]
+        with mock.patch("pythainlp.tag.NER", FakeNER):
+            with self.assertRaises(ValueError):
+                throughput.ner_batch(20, batch_size=4)
+
+    def test_normalize_batch_throughput(self):
+        result = throughput.normalize_batch(100)
+        self.assertEqual(set(result), {"normalize", "normalize_batch"})
+        self.assertTrue(all(v > 0 for v in result.values()))
+
+    def test_soundex_batch_throughput(self):
+        result = throughput.soundex_batch(
+            ["รัก", "ลัก", "รักษ์", "รัก"], engines=["udom83", "lk82"]
+        )
+        self.assertEqual(len(result), 6)
+        self.assertIn("lk82 cached", result)
+        self.assertTrue(all(v > 0 for v in result.values()))
@@ -77,6 +77,17 @@ class TestMainPackage(unittest.TestCase):
 
         self.assertIsNotNone(cli.soundex.App(["thainlp", "soundex", "ทดสอบ"]))
 
+    def test_cli_warmup(self):
+        self.assertIsInstance(getattr(cli, "warmup"), ModuleType)
+
+        with self.assertRaises(SystemExit) as ex:
+            cli.warmup.App(["thainlp", "warmup", "NOT_EXIST"])
+        self.assertEqual(ex.exception.code, 2)
+
+        self.assertIsNotNone(
+            cli.warmup.App(["thainlp", "warmup", "newmm", "unigram"])
+        )
+
     def test_cli_tag(self):
         self.assertIsInstance(getattr(cli, "tag"), ModuleType)
 
@@ -1,17 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+import json
+import tarfile
+import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
 
 from nltk.corpus import wordnet as wn
 from pythainlp.corpus import (
     conceptnet,
     countries,
     download,
+    download_many,
+    get_corpus,
     get_corpus_db,
     get_corpus_db_detail,
     get_corpus_default_db,
     get_corpus_path,
     oscar,
+    pack_bundle,
     provinces,
     remove,
     thai_family_names,
@@ -23,8 +33,10 @@ from pythainlp.corpus import (
     thai_words,
     tnc,
     ttc,
+    unpack_bundle,
     wordnet,
 )
+from pythainlp.corpus import core as corpus_core
 from pythainlp.corpus.util import revise_newmm_default_wordset
 from requests import Response
 import nltk
@@ -156,6 +168,27 @@ class TestCorpusPackage(unittest.TestCase):
         cat_key = wordnet.synsets("แมว")[0].lemmas()[0].key()
         self.assertIsNotNone(wordnet.lemma_from_key(cat_key))
 
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = wordnet.build_synonym_index(
+                os.path.join(tmp, "synonyms.json.gz")
+            )
+            self.assertIn("นก", wordnet.synonym_index(index_path))
+            for word, pos in [
+                ("นก", None),
+                ("แรง", "n"),
+                ("ไม่มีคำนี้", None),
+            ]:
+                self.assertEqual(
+                    wordnet.synonyms(word, pos=pos, path=index_path),
+                    list(
+                        dict.fromkeys(
+                            name
+                            for synset in wordnet.synsets(word, pos=pos)
+                            for name in synset.lemma_names("tha")
+                        )
+                    ),
+                )
+
     def test_revise_wordset(self):
         training_data = [
             ["ถวิล อุดล", " ", "เป็น", "นักการเมือง", "หนึ่ง", "ใน"],
@@ -170,3 +203,300 @@ class TestCorpusPackage(unittest.TestCase):
         _p = get_corpus_path("test_zip")
         self.assertEqual(os.path.isdir(_p), True)
         self.assertEqual(remove("test_zip"), True)
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    """Serve files from a dict, with HTTP Range support."""
+
+    files = {}
+    ranges = []
+
+    def do_GET(self):
+        data = self.files.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+        start = 0
+        range_header = self.headers.get("Range")
+        self.ranges.append(range_header)
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCorpusDownload(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FileHandler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.data_dir.name, "db.json")
+        with open(self.db_path, "w", encoding="utf-8") as f:
+            f.write('{"_default": {}}')
+        self.patches = [
+            mock.patch.dict(
+                os.environ, {"PYTHAINLP_DATA_DIR": self.data_dir.name}
+            ),
+            mock.patch.object(
+                corpus_core, "corpus_db_path", lambda: self.db_path
+            ),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.content = os.urandom(300 * 1024)
+        self.md5 = hashlib.md5(self.content).hexdigest()
+        _FileHandler.files = {"/a.bin": self.content, "/b.bin": b"b" * 1000}
+        _FileHandler.ranges = []
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.data_dir.cleanup()
+
+    def _path(self, filename):
+        return os.path.join(self.data_dir.name, filename)
+
+    def test_download_file(self):
+        corpus_core._download(f"{self.url}/a.bin", "a.bin", self.md5)
+        with open(self._path("a.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertFalse(os.path.exists(self._path("a.bin.part")))
+
+    def test_download_resume(self):
+        with open(self._path("a.bin.part"), "wb") as f:
+            f.write(self.content[:100000])
+        corpus_core._download(f"{self.url}/a.bin", "a.bin", self.md5)
+        self.assertEqual(_FileHandler.ranges, ["bytes=100000-"])
+        with open(self._path("a.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+        # a complete temporary file is not downloaded again
+        _FileHandler.ranges = []
+        with open(self._path("a.bin.part"), "wb") as f:
+            f.write(self.content)
+        corpus_core._download(f"{self.url}/a.bin", "a.bin", self.md5)
+        self.assertEqual(_FileHandler.ranges, [f"bytes={len(self.content)}-"])
+        with open(self._path("a.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+        # a temporary file longer than the file is downloaded again,
+        # also without a hash to check
+        _FileHandler.ranges = []
+        with open(self._path("b.bin.part"), "wb") as f:
+            f.write(b"x" * 2000)
+        corpus_core._download(f"{self.url}/b.bin", "b.bin", "-")
+        self.assertEqual(_FileHandler.ranges, ["bytes=2000-", None])
+        with open(self._path("b.bin"), "rb") as f:
+            self.assertEqual(f.read(), b"b" * 1000)
+
+    def test_download_lock(self):
+        # the lock is held by "another process"
+        done = threading.Event()
+
+        def download_a():
+            corpus_core._download(f"{self.url}/a.bin", "a.bin", self.md5)
+            done.set()
+
+        thread = threading.Thread(target=download_a)
+        with corpus_core._file_lock(self._path("a.bin.lock")):
+            thread.start()
+            self.assertFalse(done.wait(0.5))
+            self.assertEqual(_FileHandler.ranges, [])
+        thread.join(10)
+        self.assertTrue(done.is_set())
+        with open(self._path("a.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_download_bad_hash(self):
+        with self.assertRaises(Exception):
+            corpus_core._download(f"{self.url}/a.bin", "a.bin", "0" * 32)
+        self.assertFalse(os.path.exists(self._path("a.bin")))
+        self.assertFalse(os.path.exists(self._path("a.bin.part")))
+
+    def _entry(self, filename, md5):
+        return {
+            "latest_version": "0.1",
+            "versions": {
+                "0.1": {
+                    "filename": filename,
+                    "download_url": f"{self.url}/{filename}",
+                    "md5": md5,
+                    "pythainlp_version": "*",
+                    "is_tar_gz": "False",
+                    "is_zip": "False",
+                }
+            },
+        }
+
+    def test_download_many(self):
+        entry = self._entry
+        catalog = {
+            "a": entry("a.bin", self.md5),
+            "b": entry("b.bin", "-"),
+            "bad": entry("a.bin", "0" * 32),
+        }
+        _FileHandler.files["/db.json"] = json.dumps(catalog).encode()
+        result = download_many(
+            ["a", "b", "bad", "missing"],
+            url=f"{self.url}/db.json",
+            max_workers=3,
+        )
+        self.assertEqual(
+            result, {"a": True, "b": True, "bad": False, "missing": False}
+        )
+        with open(self.db_path, encoding="utf-8") as f:
+            local_db = json.load(f)
+        self.assertEqual(
+            sorted(item["name"] for item in local_db["_default"].values()),
+            ["a", "b"],
+        )
+        with open(self._path("b.bin"), "rb") as f:
+            self.assertEqual(f.read(), b"b" * 1000)
+        self.assertEqual(get_corpus_db_detail("b")["filename"], "b.bin")
+        self.assertEqual(
+            get_corpus_db_detail("b", version="0.1")["version"], "0.1"
+        )
+        self.assertEqual(get_corpus_db_detail("b", version="9.9"), {})
+
+    def test_bundle(self):
+        catalog = {
+            "a": self._entry("a.bin", self.md5),
+            "b": self._entry("b.bin", "-"),
+        }
+        _FileHandler.files["/db.json"] = json.dumps(catalog).encode()
+        bundle_path = self._path("bundle.tar")
+        self.assertFalse(
+            pack_bundle(["a", "missing"], bundle_path, url=f"{self.url}/db.json")
+        )
+        self.assertFalse(os.path.exists(bundle_path))
+        self.assertTrue(
+            pack_bundle(["a", "b"], bundle_path, url=f"{self.url}/db.json")
+        )
+
+        self.assertTrue(remove("a"))
+        self.assertTrue(remove("b"))
+        self.server.shutdown()  # no network from here
+        self.assertEqual(
+            unpack_bundle(bundle_path, max_workers=2), {"a": True, "b": True}
+        )
+        with open(self._path("a.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertEqual(get_corpus_db_detail("b")["version"], "0.1")
+        self.assertEqual(
+            sorted(os.listdir(self.data_dir.name)),
+            [
+                "a.bin",
+                "a.bin.lock",
+                "b.bin",
+                "b.bin.lock",
+                "bundle.tar",
+                "db.json",
+                "db.json.lock",
+            ],
+        )
+
+        # an unpacked bundle is a mirror
+        mirror = self._path("mirror")
+        with tarfile.open(bundle_path) as tar:
+            tar.extractall(mirror)
+        self.assertTrue(remove("a"))
+        with mock.patch.dict(os.environ, {"PYTHAINLP_MIRROR": mirror}):
+            self.assertTrue(download("a"))
+        with open(self._path("a.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_get_corpus_cache(self):
+        path = self._path("words.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(" ก \nข\n\nก\n")
+        snapshot_dir = self._path(corpus_core._SNAPSHOT_DIR)
+        with mock.patch.object(
+            corpus_core, "path_pythainlp_corpus", lambda name: path
+        ):
+            # no snapshots by default
+            self.assertEqual(get_corpus("words.txt"), frozenset({"ก", "ข"}))
+            self.assertFalse(os.path.exists(snapshot_dir))
+            corpus_core._corpus_cache.clear()
+
+        with mock.patch.object(
+            corpus_core, "path_pythainlp_corpus", lambda name: path
+        ), mock.patch.dict(os.environ, {corpus_core._SNAPSHOT_ENV: "1"}):
+            words = get_corpus("words.txt")
+            self.assertEqual(words, frozenset({"ก", "ข"}))
+            self.assertIs(get_corpus("words.txt"), words)
+            lines = get_corpus("words.txt", as_is=True)
+            self.assertEqual(lines, [" ก ", "ข", "", "ก"])
+            lines.append("ค")  # the cached list is not modified
+            self.assertEqual(len(get_corpus("words.txt", as_is=True)), 4)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 2)
+
+            # a snapshot is read by another process, and replaced
+            # when the file is modified
+            corpus_core._corpus_cache.clear()
+            self.assertEqual(get_corpus("words.txt"), words)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("ค\n")
+            self.assertEqual(get_corpus("words.txt"), frozenset({"ค"}))
+            self.assertEqual(get_corpus("words.txt", as_is=True), ["ค"])
+            self.assertEqual(len(os.listdir(snapshot_dir)), 2)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("")
+            self.assertEqual(get_corpus("words.txt"), frozenset())
+            corpus_core._corpus_cache.clear()
+            self.assertEqual(get_corpus("words.txt", as_is=True), [])
+
+    def test_catalog_cache(self):
+        self.assertEqual(get_corpus_db_detail("x"), {})
+        local_db = {
+            "_default": {
+                "1": {
+                    "name": "x",
+                    "version": "0.1",
+                    "filename": "x.txt",
+                    "is_folder": False,
+                    "foldername": None,
+                }
+            }
+        }
+        with open(self.db_path, "w", encoding="utf-8") as f:
+            json.dump(local_db, f)
+        # the catalog is read again after it is modified
+        self.assertEqual(get_corpus_db_detail("x")["filename"], "x.txt")
+        get_corpus_db_detail("x")["filename"] = "changed"
+        self.assertEqual(get_corpus_db_detail("x")["filename"], "x.txt")
+
+        def add(i):
+            with corpus_core._locked_local_db() as db:
+                db["_default"][str(i + 2)] = dict(
+                    local_db["_default"]["1"], name=f"x{i}"
+                )
+                corpus_core._write_local_db(db)
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for i in range(8):
+            self.assertEqual(
+                get_corpus_db_detail(f"x{i}")["filename"], "x.txt"
+            )
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import types
 import unittest
-from pythainlp.parse import dependency_parsing
+from unittest import mock
+from pythainlp.parse import core as parse_core
+from pythainlp.parse import dependency_parsing, dependency_parsing_stream
 
 
 class TestParsePackage(unittest.TestCase):
@@ -12,3 +15,50 @@ class TestParsePackage(unittest.TestCase):
         self.assertIsNotNone(dependency_parsing("ผมเป็นคนดี", engine="transformers_ud", tag="list"))
         self.assertIsNotNone(dependency_parsing("ผมเป็นคนดี", engine="spacy_thai"))
         self.assertIsNotNone(dependency_parsing("ผมเป็นคนดี", engine="spacy_thai", tag="list"))
+        self.assertEqual(
+            dependency_parsing(["ผมเป็นคนดี", "แมวกินปลา"], engine="transformers_ud"),
+            [
+                dependency_parsing("ผมเป็นคนดี", engine="transformers_ud"),
+                dependency_parsing("แมวกินปลา", engine="transformers_ud"),
+            ]
+        )
+        _stream = list(dependency_parsing_stream(["ผมเป็นคนดี", "แมวกินปลา"], engine="spacy_thai"))
+        self.assertEqual(len(_stream), 2)
+        self.assertTrue(all(i.endswith("\n\n") for i in _stream))
+
+    def test_parser_cache(self):
+        loaded = []
+
+        class FakeParse:
+            def __init__(self, model=None):
+                loaded.append(model)
+
+            def __call__(self, text, tag="str"):
+                return text
+
+        modules = {}
+        for name in ["esupar_engine", "transformers_ud", "spacy_thai_engine"]:
+            modules[f"pythainlp.parse.{name}"] = types.ModuleType(name)
+            modules[f"pythainlp.parse.{name}"].Parse = FakeParse
+        with mock.patch.dict("sys.modules", modules), mock.patch.dict(
+            parse_core._taggers, clear=True
+        ):
+            # None and the name of the default model share a parser
+            dependency_parsing("ก", engine="esupar")
+            dependency_parsing("ก", model="th", engine="esupar")
+            self.assertEqual(loaded, ["th"])
+            dependency_parsing("ก", engine="spacy_thai")
+            dependency_parsing("ก", model="x", engine="spacy_thai")
+            self.assertEqual(loaded, ["th", None])
+
+            # least recently used parser is dropped
+            dependency_parsing("ก", engine="esupar")
+            dependency_parsing("ก", engine="transformers_ud")
+            self.assertEqual(
+                len(parse_core._taggers), parse_core._TAGGER_CACHE_SIZE
+            )
+            self.assertNotIn(("spacy_thai", None), parse_core._taggers)
+            dependency_parsing("ก", engine="esupar")
+            self.assertEqual(loaded.count("th"), 1)
+            with self.assertRaises(NotImplementedError):
+                dependency_parsing("ก", engine="unknown")
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import unittest
+
+from pythainlp.pipeline import Pipeline, stage_names
+from pythainlp.tokenize import word_tokenize
+from pythainlp.util import (
+    maiyamok,
+    normalize,
+    remove_tonemark,
+    remove_zw,
+    thai_digit_to_arabic_digit,
+)
+
+
+def _strip(text):
+    return text.strip()
+
+
+class TestPipelinePackage(unittest.TestCase):
+    def setUp(self):
+        self.texts = [
+            "บ้านเเม่มี ๓ ห้อง",
+            "เด็กๆ ๒ คนชอบไป​โรงเรียนนนน",
+            "  ",
+            "",
+        ]
+
+    def test_pipeline(self):
+        pipeline = Pipeline([
+            "normalize",
+            "remove_zw",
+            "remove_tonemark",
+            "thai_digit_to_arabic_digit",
+            _strip,
+            ("word_tokenize", {"engine": "newmm"}),
+            "maiyamok",
+        ])
+        for text in self.texts:
+            expected = maiyamok(word_tokenize(_strip(
+                thai_digit_to_arabic_digit(
+                    remove_tonemark(remove_zw(normalize(text)))
+                )
+            ), engine="newmm"))
+            self.assertEqual(pipeline(text), expected)
+
+        # translate stages are fused into one step
+        self.assertEqual(len(pipeline._funcs), 5)
+
+        # default pipeline
+        self.assertEqual(
+            Pipeline()(self.texts[0]), word_tokenize(normalize(self.texts[0]))
+        )
+        self.assertIn("normalize", stage_names())
+
+        with self.assertRaises(ValueError):
+            Pipeline(["xxx"])
+        with self.assertRaises(ValueError):
+            Pipeline(["word_tokenize", "normalize"])
+        with self.assertRaises(ValueError):
+            Pipeline(["lowercase_all"])
+        with self.assertRaises(ValueError):
+            Pipeline(["word_tokenize", "word_tokenize"])
+        with self.assertRaises(ValueError):
+            Pipeline([1])
+
+    def test_pipe(self):
+        pipeline = Pipeline(["normalize", "thai_digit_to_arabic_digit"])
+        expected = [pipeline(text) for text in self.texts]
+        self.assertEqual(list(pipeline.pipe(iter(self.texts))), expected)
+        self.assertEqual(
+            list(pipeline.pipe(self.texts, max_workers=2, chunksize=1)),
+            expected,
+        )
+        self.assertEqual(list(pipeline.pipe([], max_workers=2)), [])
+
+        # lazy: only consumed texts are processed
+        results = pipeline.pipe(iter(["๑", "๒"]))
+        self.assertEqual(next(results), "1")
+
+        clone = pickle.loads(pickle.dumps(pipeline))
+        self.assertEqual(clone.steps, pipeline.steps)
+        self.assertEqual(clone(self.texts[0]), expected[0])
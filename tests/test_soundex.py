@@ -1,8 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import os
+import tempfile
 import unittest
 
-from pythainlp.soundex import lk82, metasound, soundex, udom83, prayut_and_somchaip
+from pythainlp.soundex import (
+    lk82,
+    metasound,
+    soundex,
+    soundex_batch,
+    SoundexIndex,
+    udom83,
+    prayut_and_somchaip,
+)
 
 
 class TestSoundexPackage(unittest.TestCase):
@@ -73,3 +83,54 @@ class TestSoundexPackage(unittest.TestCase):
         self.assertIsNotNone(prayut_and_somchaip("ณาญ"))
         self.assertIsNotNone(prayut_and_somchaip("กาง"))
         self.assertIsNotNone(prayut_and_somchaip("ว้าว"))
+
+    def test_soundex_batch(self):
+        words = ["รัก", "ลัก", "รักษ์", "", "บูรณการ", "รัก", "vp"]
+        for engine in ["udom83", "lk82", "metasound", "prayut_and_somchaip"]:
+            expected = [soundex(word, engine=engine) for word in words]
+            self.assertEqual(soundex_batch(words, engine=engine), expected)
+            self.assertEqual(
+                soundex_batch(
+                    iter(words), engine=engine, max_workers=2, chunksize=2
+                ),
+                expected,
+            )
+        self.assertEqual(
+            soundex_batch(words, engine="metasound", length=6),
+            [soundex(word, engine="metasound", length=6) for word in words],
+        )
+        self.assertEqual(soundex_batch([]), [])
+
+    def test_soundex_index(self):
+        words = ["ศรีสุข", "สารีสุข", "ทองดี", "ทองดำ", "รัก", "ลัก", "รัก"]
+        index = SoundexIndex(words, engines=["udom83", "lk82"])
+        self.assertEqual(len(index), 6)
+        self.assertIn("ทองดี", index)
+        self.assertNotIn("แมว", index)
+        self.assertEqual(index.lookup("รักษ์"), ["รัก", "ลัก"])
+        self.assertEqual(index.lookup("รักษ์", engine="lk82"), ["รัก", "ลัก"])
+        self.assertEqual(index.lookup(""), [])
+        self.assertEqual(index.match("ศรีสุก")[0], ("ศรีสุข", 1))
+        self.assertEqual(index.match("ทองดี", limit=1), [("ทองดี", 0)])
+        self.assertEqual(
+            index.match("ทองดี", max_distance=1), [("ทองดี", 0), ("ทองดำ", 1)]
+        )
+        self.assertEqual(index.match("แมว"), [])
+
+        index.add(["ทองดี", "สมบูรณ์"])
+        self.assertEqual(len(index), 7)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "index.gz")
+            index.save(path)
+            loaded = SoundexIndex.load(path)
+        self.assertEqual(loaded.words, index.words)
+        self.assertEqual(loaded.engines, index.engines)
+        self.assertEqual(loaded.match("ศรีสุก"), index.match("ศรีสุก"))
+
+        with self.assertRaises(ValueError):
+            SoundexIndex(engines=["XXX"])
+        with self.assertRaises(ValueError):
+            SoundexIndex(engines=[])
+        with self.assertRaises(ValueError):
+            index.lookup("รัก", engine="metasound")
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+from unittest import mock
 
-from pythainlp.summarize import summarize
+from pythainlp.summarize import core as summarize_core
+from pythainlp.summarize import summarize, summarize_batch
 
 
 class TestSummarizePackage(unittest.TestCase):
@@ -27,3 +29,90 @@ class TestSummarizePackage(unittest.TestCase):
         self.assertIsNotNone(summarize(text, 1, engine="XX"))
         with self.assertRaises(ValueError):
             self.assertIsNotNone(summarize(text, 1, engine="mt5-cat"))
+
+    def test_summarize_batch(self):
+        texts = [
+            (
+                "อาหาร หมายถึง ของแข็งหรือของเหลว "
+                "ที่กินหรือดื่มเข้าสู่ร่างกายแล้ว "
+                "อาหารจะต้องไม่มีพิษและไม่เกิดโทษต่อร่างกาย"
+            ),
+            "ถ้าพูดถึงขนมหวานในตำนานที่ชื่นใจที่สุดแล้วละก็ต้องไม่พ้น น้ำแข็งใส",
+        ]
+        self.assertEqual(
+            summarize_batch(texts, n=1),
+            [summarize(text, n=1) for text in texts],
+        )
+        self.assertEqual(summarize_batch([]), [])
+        summaries = summarize_batch(
+            texts + [""], engine="mt5-small", batch_size=2
+        )
+        self.assertEqual(len(summaries), 3)
+        self.assertEqual(len(summaries[0]), 1)
+        self.assertEqual(summaries[2], [])
+
+    def test_summarize_extractive(self):
+        text = (
+            "อาหาร หมายถึง ของแข็งหรือของเหลว "
+            "ที่กินหรือดื่มเข้าสู่ร่างกายแล้ว "
+            "จะทำให้เกิดพลังงานและความร้อนแก่ร่างกาย "
+            "ทำให้ร่างกายเจริญเติบโต "
+            "อาหารจะต้องไม่มีพิษและไม่เกิดโทษต่อร่างกาย"
+        )
+        texts = [text, "", "แมวกินปลา แมวชอบนอน หมากินกระดูก"]
+        for engine in ["tfidf", "textrank"]:
+            summaries = summarize_batch(texts, n=2, engine=engine)
+            self.assertEqual(len(summaries), 3)
+            self.assertEqual(len(summaries[0]), 2)
+            self.assertEqual(summaries[1], [])
+            self.assertEqual(
+                summaries,
+                [summarize(t, n=2, engine=engine) for t in texts],
+            )
+            self.assertEqual(
+                summarize_batch(texts, n=2, engine=engine, max_workers=2),
+                summaries,
+            )
+        self.assertEqual(
+            summarize(text, n=1, engine="tfidf"),
+            ["อาหารจะต้องไม่มีพิษและไม่เกิดโทษต่อร่างกาย"],
+        )
+
+    def test_mt5_summarizer_cache(self):
+        created = []
+
+        class FakeSummarizer:
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+                created.append(kwargs)
+
+            def summarize(self, text):
+                return [text]
+
+            def summarize_batch(self, texts, batch_size=8):
+                return [[text] for text in texts]
+
+        with mock.patch(
+            "pythainlp.summarize.mt5.mT5Summarizer", FakeSummarizer
+        ), mock.patch.dict(summarize_core._MT5_SUMMARIZERS, clear=True):
+            self.assertEqual(summarize("ก", engine="mt5-small"), ["ก"])
+            self.assertEqual(
+                summarize("ก", engine="mt5-small", quantize=True), ["ก"]
+            )
+            self.assertEqual(
+                summarize_batch(["ก", "ข"], engine="mt5-small", quantize=True),
+                [["ก"], ["ข"]],
+            )
+            self.assertEqual(
+                [kwargs["quantize"] for kwargs in created], [False, True]
+            )
+            # least recently used model is dropped
+            summarize("ก", engine="mt5-base")
+            self.assertEqual(
+                len(summarize_core._MT5_SUMMARIZERS),
+                summarize_core._MT5_CACHE_SIZE,
+            )
+            summarize("ก", engine="mt5-small", quantize=True)
+            self.assertEqual(len(created), 3)
+            summarize("ก", engine="mt5-small")
+            self.assertEqual(len(created), 4)
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
 from pythainlp import corpus
+import threading
 import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 from pythainlp import tag
 
@@ -16,6 +19,7 @@ from pythainlp.tag import (
     NER,
     NNER,
 )
+from pythainlp.tag.crfchunk import CRFchunk
 from pythainlp.tag.locations import tag_provinces
 from pythainlp.tag.thainer import ThaiNameTagger
 
@@ -354,17 +358,48 @@ class TestTagPackage(unittest.TestCase):
         )
 
     def test_NER_class(self):
+        texts = ["แมวทำอะไรตอนห้าโมงเช้า", "ทดสอบนายวรรณพงษ์ ภัททิยไพบูลย์"]
         ner = NER(engine="thainer")
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า"))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", pos=False))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", tag=True))
+        self.assertEqual(
+            ner.tag_batch(texts), [ner.tag(text) for text in texts]
+        )
         ner = NER(engine="wangchanberta")
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า"))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", pos=False))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", tag=True))
+        self.assertEqual(
+            ner.tag_batch(texts, tag=True),
+            [ner.tag(text, tag=True) for text in texts],
+        )
         ner = NER(engine="lst20_onnx")
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า"))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", tag=True))
+        self.assertEqual(
+            ner.tag_batch(texts, batch_size=1), [ner.tag(text) for text in texts]
+        )
+        with_scores = ner.engine.get_ner(texts[0], scores=True)
+        self.assertEqual(
+            [(w, t) for w, t, _ in with_scores], ner.tag(texts[0])
+        )
+        self.assertTrue(all(0 < p <= 1 for _, _, p in with_scores))
+        self.assertEqual(
+            ner.tag_batch(texts, tag=True),
+            [ner.tag(text, tag=True) for text in texts],
+        )
+        # pieces unknown to the model come back as in the text
+        text = "I คิด therefore I am 😀"
+        for words in (
+            ner.tag(text, pos=False),
+            ner.tag_batch([text], pos=False)[0],
+        ):
+            self.assertEqual(
+                "".join(w for w, _ in words).replace(" ", ""),
+                text.replace(" ", ""),
+            )
+        self.assertIn("therefore", ner.tag(text, pos=False, tag=True))
         ner = NER(engine="tltk")
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า"))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", pos=False))
@@ -372,6 +407,77 @@ class TestTagPackage(unittest.TestCase):
         with self.assertRaises(ValueError):
             NER(engine="thainer", corpus="cat")
 
+    def test_NER_batch_pos_warning(self):
+        class FakeEngine:
+            def get_ner(self, text, tag=False):
+                return [(text, "O")]
+
+            def get_ner_batch(self, texts, tag=False, batch_size=8):
+                return [self.get_ner(text, tag=tag) for text in texts]
+
+        ner = NER.__new__(NER)
+        ner.name_engine = "lst20_onnx"
+        ner.engine = FakeEngine()
+        with self.assertWarns(UserWarning):
+            ner.tag("แมว")
+        with self.assertWarns(UserWarning):
+            self.assertEqual(ner.tag_batch(["แมว"]), [ner.tag("แมว")])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            ner.tag_batch(["แมว"], pos=False)
+
     def test_NNER_class(self):
         nner = NNER()
         self.assertIsNotNone(nner.tag("แมวทำอะไรตอนห้าโมงเช้า"))
+
+    # ### thread safety
+
+    def _assert_thread_safe(self, func, inputs, n_threads=16, rounds=20):
+        expected = [func(x) for x in inputs]
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(func, inputs * rounds))
+        self.assertEqual(results, expected * rounds)
+
+    def _assert_created_once(self, module, n_threads=8):
+        # all threads ask for a fresh singleton at the same time
+        module._PUD_TAGGER = None
+        barrier = threading.Barrier(n_threads)
+
+        def get_tagger(_):
+            barrier.wait()
+            return module._pud_tagger()
+
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            taggers = list(executor.map(get_tagger, range(n_threads)))
+        self.assertIsNotNone(taggers[0])
+        self.assertTrue(all(t is taggers[0] for t in taggers))
+
+    def test_thread_safe_initialization(self):
+        self._assert_created_once(perceptron)
+        self._assert_created_once(unigram)
+
+    def test_thread_safety(self):
+        sents = [
+            ["นักเรียน", "ถาม", "ครู"],
+            ["ผม", "รัก", "คุณ"],
+            ["แมว", "ทำ", "อะไร", "ตอน", "ห้า", "โมง", "เช้า"],
+        ]
+
+        self._assert_thread_safe(
+            lambda x: pos_tag(x, engine="perceptron", corpus="pud"), sents
+        )
+        self._assert_thread_safe(
+            lambda x: pos_tag(x, engine="unigram", corpus="pud"), sents
+        )
+
+        chunker = CRFchunk()
+        tagged = [pos_tag(x, engine="perceptron", corpus="pud") for x in sents]
+        self._assert_thread_safe(chunker.parse, tagged)
+
+        ner = ThaiNameTagger()
+        texts = [
+            "วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.",
+            "ทดสอบนายวรรณพงษ์ ภัททิยไพบูลย์",
+            "แมวทำอะไรตอนห้าโมงเช้า",
+        ]
+        self._assert_thread_safe(ner.get_ner, texts)
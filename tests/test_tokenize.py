@@ -25,6 +25,7 @@ from pythainlp.tokenize import (
     word_detokenize,
 )
 from pythainlp.tokenize import clause_tokenize as sent_clause_tokenize
+from pythainlp.tokenize.thaisumcut import ThaiSentenceSegmentor
 from pythainlp.util import dict_trie
 
 
@@ -280,6 +281,20 @@ class TestTokenizePackage(unittest.TestCase):
         self.assertIsNotNone(
             sent_tokenize(sent_3, engine="thaisum",),
         )
+        segmentor = ThaiSentenceSegmentor()
+        self.assertEqual(
+            segmentor.split_into_sentences_batch([sent_1, sent_2, sent_1]),
+            [
+                sent_tokenize(sent_1, engine="thaisum"),
+                sent_tokenize(sent_2, engine="thaisum"),
+                sent_tokenize(sent_1, engine="thaisum"),
+            ],
+        )
+        self.assertEqual(
+            segmentor.split_into_sentences_batch([sent_3], isMiddleCut=True),
+            [segmentor.split_into_sentences(sent_3, isMiddleCut=True)],
+        )
+        self.assertEqual(segmentor.split_into_sentences_batch([]), [])
         self.assertFalse(
             " "
             in sent_tokenize(
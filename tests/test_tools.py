@@ -6,6 +6,8 @@ from pythainlp.tools import (
     get_full_data_path,
     get_pythainlp_data_path,
     get_pythainlp_path,
+    preload,
+    preload_components,
 )
 
 
@@ -17,3 +19,11 @@ class TestToolsPackage(unittest.TestCase):
         )
         self.assertIsInstance(get_pythainlp_data_path(), str)
         self.assertIsInstance(get_pythainlp_path(), str)
+
+    def test_preload(self):
+        self.assertIn("newmm", preload_components())
+        timings = preload(["newmm", "unigram"], max_workers=2)
+        self.assertEqual(list(timings.keys()), ["newmm", "unigram"])
+        self.assertTrue(all(t >= 0 for t in timings.values()))
+        with self.assertRaises(ValueError):
+            preload(["NOT_EXIST"])
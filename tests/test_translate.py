@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 
+import os
+import sqlite3
+import tempfile
 import unittest
+from unittest import mock
 
 from pythainlp.translate import (
     ThZhTranslator,
     ZhThTranslator,
-    Translate
+    Translate,
+    TranslationCache,
 )
 from pythainlp.translate.en_th import (
     EnThTranslator,
@@ -75,3 +80,131 @@ class TestTranslatePackage(unittest.TestCase):
         )
         with self.assertRaises(ValueError):
             self.th_cat_translator = Translate('th', 'cat')
+
+    def test_translate_batch(self):
+        th_en_translator = Translate('th', 'en')
+        texts = ["แมวกินปลา", "ผมรักคุณ", "ทดสอบระบบ"]
+        translated = th_en_translator.translate_batch(texts, batch_size=2)
+        self.assertEqual(len(translated), len(texts))
+        self.assertEqual(translated[0], th_en_translator.translate(texts[0]))
+        self.assertEqual(
+            len(
+                th_en_translator.translate_batch(
+                    ["แมวกินปลา ผมรักคุณ", "ทดสอบระบบ"], split_sentences=True
+                )
+            ),
+            2,
+        )
+        self.assertEqual(th_en_translator.translate_batch([]), [])
+        en_th_translator = Translate('en', 'th')
+        self.assertEqual(
+            len(en_th_translator.translate_batch(["I love cat.", "Hi"])), 2
+        )
+        th_zh_translator = Translate('th', 'zh')
+        self.assertEqual(
+            th_zh_translator.translate_batch(["ผมรักคุณ"]),
+            [th_zh_translator.translate("ผมรักคุณ")],
+        )
+        zh_th_translator = Translate('zh', 'th')
+        self.assertEqual(
+            len(
+                zh_th_translator.translate_batch(
+                    ["我爱你。你好吗？", "我爱你"], split_sentences=True
+                )
+            ),
+            2,
+        )
+        th_fr_translator = Translate('th', 'fr')
+        self.assertEqual(
+            len(th_fr_translator.translate_batch(["ทดสอบระบบ", "แมว"])), 2
+        )
+
+    def test_translation_cache(self):
+        cache = TranslationCache(maxsize=2)
+        key = ("th-en", "v1", "แมว")
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "cat")
+        self.assertEqual(cache.get(key), "cat")
+        cache.put(("th-en", "v1", "หมา"), "dog")
+        cache.put(("th-en", "v1", "ปลา"), "fish")
+        self.assertIsNone(cache.get(key))  # evicted, least recently used
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["memory_size"], 2)
+        cache.clear()
+        self.assertEqual(cache.stats()["memory_size"], 0)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "translation.db")
+            cache = TranslationCache(maxsize=0, path=path, max_disk_size=2)
+            cache.put(key, "cat")
+            cache.put(("th-en", "v1", "หมา"), "dog")
+            cache.put(("th-en", "v1", "ปลา"), "fish")
+            self.assertEqual(cache.stats()["disk_size"], 2)
+            cache.close()
+            cache = TranslationCache(path=path)
+            self.assertEqual(cache.get(("th-en", "v1", "ปลา")), "fish")
+            self.assertIsNone(cache.get(("th-en", "v2", "ปลา")))
+            cache.close()
+
+        th_fr_translator = Translate('th', 'fr', cache=True)
+        translated = th_fr_translator.translate("ทดสอบระบบ")
+        self.assertEqual(th_fr_translator.translate("ทดสอบระบบ "), translated)
+        self.assertEqual(
+            th_fr_translator.translate_batch(["ทดสอบระบบ", "แมว", "แมว"])[0],
+            translated,
+        )
+        self.assertEqual(th_fr_translator.cache.stats()["hits"], 2)
+
+    def test_translation_cache_disk_reads(self):
+        def atime(path, source):
+            with sqlite3.connect(path) as db:
+                return db.execute(
+                    "SELECT atime FROM translation WHERE source = ?",
+                    (source,),
+                ).fetchone()[0]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "translation.db")
+            cache = TranslationCache(maxsize=0, path=path, max_disk_size=2)
+            cache.put(("th-en", "v1", "แมว"), "cat")
+            cache.put(("th-en", "v1", "หมา"), "dog")
+            before = atime(path, "แมว")
+            self.assertEqual(
+                cache.get_many(
+                    [("th-en", "v1", "แมว"), ("th-en", "v1", "ปลา")]
+                ),
+                ["cat", None],
+            )
+            # access time is written later, not on every read
+            self.assertEqual(atime(path, "แมว"), before)
+            cache.flush()
+            self.assertGreater(atime(path, "แมว"), before)
+            # a recently read result is kept, the oldest one is removed
+            cache.get(("th-en", "v1", "แมว"))
+            cache.put(("th-en", "v1", "ปลา"), "fish")
+            self.assertEqual(cache.get(("th-en", "v1", "แมว")), "cat")
+            self.assertIsNone(cache.get(("th-en", "v1", "หมา")))
+            cache.close()
+
+    def test_translate_batch_cache_normalized(self):
+        class FakeTranslator:
+            def __init__(self, use_gpu=False):
+                self.batches = []
+
+            def translate_batch(self, texts, batch_size=16):
+                self.batches.append(list(texts))
+                return [text.upper() for text in texts]
+
+        with mock.patch(
+            "pythainlp.translate.th_fr.ThFrTranslator", FakeTranslator
+        ):
+            translator = Translate("th", "fr", cache=True)
+        texts = ["abc", " abc ", "e\u0301", "\u00e9", "abc", "xyz"]
+        outputs = translator.translate_batch(texts)
+        self.assertEqual(translator.model.batches, [["abc", "e\u0301", "xyz"]])
+        self.assertEqual(outputs[:2], ["ABC", "ABC"])
+        self.assertEqual(outputs[2], outputs[3])
+        self.assertEqual(translator.translate_batch(texts), outputs)
+        self.assertEqual(len(translator.model.batches), 1)
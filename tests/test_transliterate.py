@@ -1,11 +1,19 @@
 # -*- coding: utf-8 -*-
 
+import sys
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import torch
 from pythainlp.transliterate import romanize, transliterate, pronunciate, puan
 from pythainlp.transliterate.ipa import trans_list, xsampa_list
+from pythainlp.transliterate import thai2rom
 from pythainlp.transliterate.thai2rom import ThaiTransliterator
+from pythainlp.transliterate import w2p
+from pythainlp.transliterate.w2p import pronunciate_batch
 from pythainlp.transliterate.wunsen import WunsenTransliterate
 from pythainlp.corpus import remove
 
@@ -53,6 +61,15 @@ _CONSISTENCY_TESTS = [
 ]
 
 
+class _PreemptedDict(dict):
+    """A dict that lets other threads run while it is iterated."""
+
+    def __iter__(self):
+        for key in dict.__iter__(self):
+            time.sleep(0)
+            yield key
+
+
 class TestTransliteratePackage(unittest.TestCase):
     def test_romanize(self):
         self.assertEqual(romanize(None), "")
@@ -87,6 +104,50 @@ class TestTransliteratePackage(unittest.TestCase):
         self.assertEqual(romanize("สกุนต์", engine="thai2rom"), "sakun")
         self.assertEqual(romanize("ชารินทร์", engine="thai2rom"), "charin")
 
+    def test_romanize_thai2rom_batch(self):
+        words = ["แมว", "บ้านไร่", "สุนัข", "นก", "แมว", "ความอิ่ม"]
+        transliterater = ThaiTransliterator()
+        self.assertEqual(
+            transliterater.romanize_batch(words, batch_size=4),
+            [romanize(word, engine="thai2rom") for word in words],
+        )
+        self.assertEqual(transliterater.romanize_batch([]), [])
+
+    def _assert_cache_thread_safe(self, module, convert_batch, convert):
+        # many threads fill and evict a tiny cache at the same time,
+        # the cache must be an empty _PreemptedDict
+        words = ["ก" * (i % 7 + 1) + str(i % 13) for i in range(64)]
+        expected = [convert(word) for word in words]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with mock.patch.object(module, "_CACHE_SIZE", 4):
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = list(
+                        executor.map(
+                            lambda i: convert_batch(words[i:] + words[:i]),
+                            [i % len(words) for i in range(200)],
+                        )
+                    )
+        finally:
+            sys.setswitchinterval(switch_interval)
+        for i, result in enumerate(results):
+            i %= len(words)
+            self.assertEqual(result, expected[i:] + expected[:i])
+
+    def test_thai2rom_cache_thread_safety(self):
+        transliterater = ThaiTransliterator.__new__(ThaiTransliterator)
+        transliterater._cache = _PreemptedDict()
+        transliterater._cache_lock = threading.Lock()
+        transliterater._romanize_padded = lambda texts: [
+            text[::-1] for text in texts
+        ]
+        self._assert_cache_thread_safe(
+            thai2rom,
+            lambda texts: transliterater.romanize_batch(texts, 3),
+            lambda text: text[::-1],
+        )
+
     def test_thai2rom_prepare_sequence(self):
         transliterater = ThaiTransliterator()
 
@@ -207,6 +268,47 @@ class TestTransliteratePackage(unittest.TestCase):
         self.assertIsNotNone(pronunciate("มช.", engine="w2p"))
         self.assertIsNotNone(pronunciate("jks", engine="w2p"))
 
+    def test_pronunciate_batch(self):
+        words = ["คน", "แมว", "มข.", "jks", "แมว", "ภาพยนตร์"]
+        self.assertEqual(
+            pronunciate_batch(words, batch_size=2),
+            [pronunciate(word, engine="w2p") for word in words],
+        )
+        self.assertEqual(pronunciate_batch([]), [])
+
+    def test_w2p_thread_safe_initialization(self):
+        class SlowW2P:
+            def __init__(self):
+                time.sleep(0.05)
+
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+
+        def get_w2p(_):
+            barrier.wait()
+            return w2p._get_w2p()
+
+        with mock.patch.object(w2p, "Thai_W2P", SlowW2P), mock.patch.object(
+            w2p, "_THAI_W2P", None
+        ):
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                models = list(executor.map(get_w2p, range(n_threads)))
+        self.assertIsInstance(models[0], SlowW2P)
+        self.assertTrue(all(m is models[0] for m in models))
+
+    def test_w2p_cache_thread_safety(self):
+        model = w2p.Thai_W2P.__new__(w2p.Thai_W2P)
+        model.graphemes = ["ก"]
+        model._cache = _PreemptedDict()
+        model._cache_lock = threading.Lock()
+        model._short_word = lambda word: None
+        model._predict_batch = lambda words: [word + "!" for word in words]
+        self._assert_cache_thread_safe(
+            w2p,
+            lambda words: model.pronunciate_batch(words, batch_size=3),
+            lambda word: word + "!",
+        )
+
     def test_puan(self):
         self.assertEqual(puan("แมว"), "แมว")
         self.assertEqual(puan("นาริน"), "นิน-รา")
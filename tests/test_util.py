@@ -21,10 +21,12 @@ from pythainlp.util import (
     emoji_to_thai,
     eng_to_thai,
     find_keyword,
+    KeywordCounter,
     is_native_thai,
     isthai,
     isthaichar,
     normalize,
+    normalize_batch,
     now_reign_year,
     num_to_thaiword,
     maiyamok,
@@ -198,6 +200,64 @@ class TestUtilPackage(unittest.TestCase):
             rank(["แมว", "คน", "แมว"], exclude_stopwords=True)
         )
 
+    def test_keyword_counter(self):
+        docs = [
+            ["แมว", "กิน", "ปลา", "แมว"],
+            ["แมว", "เป็น", "สัตว์"],
+            ["หมา", "กิน", "ข้าว"],
+        ]
+        counter = KeywordCounter()
+        counter.update_many(docs)
+        self.assertEqual(counter.n_documents, 3)
+        self.assertEqual(counter.n_words, 10)
+        self.assertEqual(counter.count("แมว"), 3)
+        self.assertEqual(counter.document_frequency("แมว"), 2)
+        self.assertEqual(counter.document_frequency("xxx"), 0)
+        self.assertEqual(counter.top_k(2), [("แมว", 3), ("กิน", 2)])
+        self.assertEqual(counter.top_k(1, by="tfidf")[0][0], "แมว")
+        self.assertGreater(counter.tfidf("ปลา"), counter.tfidf("กิน") / 2)
+        self.assertEqual(len(counter.top_k(None)), 7)
+        with self.assertRaises(ValueError):
+            counter.top_k(by="xxx")
+
+        counter = KeywordCounter(exclude_stopwords=True)
+        counter.update(iter(docs[1]))
+        self.assertEqual(counter.count("เป็น"), 0)
+
+        # merge partial counters
+        part1 = KeywordCounter()
+        part1.update_many(docs[:2])
+        part2 = KeywordCounter()
+        part2.update_many(docs[2:])
+        total = KeywordCounter()
+        total.update_many(docs)
+        self.assertEqual(part1.merge(part2).top_k(None), total.top_k(None))
+        self.assertEqual(part1.n_documents, 3)
+
+        # bounded memory: frequent words are kept
+        stream = [["แมว", "หมา", str(i)] for i in range(1000)]
+        counter = KeywordCounter(capacity=10, df_width=1024)
+        counter.update_many(stream)
+        self.assertLessEqual(len(counter.top_k(None)), 20)
+        self.assertEqual(
+            {word for word, _ in counter.top_k(2)}, {"แมว", "หมา"}
+        )
+        self.assertGreaterEqual(counter.count("แมว"), 1000)
+        self.assertLessEqual(counter.count("แมว"), 1000 + counter.error)
+        self.assertGreaterEqual(counter.document_frequency("แมว"), 1000)
+
+        part1 = KeywordCounter(capacity=10, df_width=1024)
+        part1.update_many(stream[:500])
+        part2 = KeywordCounter(capacity=10, df_width=1024)
+        part2.update_many(stream[500:])
+        part1.merge(part2)
+        self.assertEqual(
+            {word for word, _ in part1.top_k(2)}, {"แมว", "หมา"}
+        )
+        self.assertGreaterEqual(part1.document_frequency("หมา"), 1000)
+        with self.assertRaises(ValueError):
+            part1.merge(KeywordCounter())
+
     # ### pythainlp.util.keyboard
 
     def test_thai_keyboard_dist(self):
@@ -523,6 +583,12 @@ class TestUtilPackage(unittest.TestCase):
         self.assertEqual(remove_dup_spaces("  ab  c d  "), "ab c d")
         self.assertEqual(remove_dup_spaces("\nab  c   \n d \n"), "ab c\nd")
 
+        # normalize many texts
+        texts = ["เเปลก", "นานาาา", "  กา า  า\u200b  ", "เเปลก", ""]
+        self.assertEqual(normalize_batch(texts), [normalize(t) for t in texts])
+        self.assertEqual(normalize_batch(iter(texts[:2])), ["แปลก", "นานา"])
+        self.assertEqual(normalize_batch([]), [])
+
         # remove tone marks
         self.assertEqual(remove_tonemark("จิ้น"), "จิน")
         self.assertEqual(remove_tonemark("เก๋า"), "เกา")
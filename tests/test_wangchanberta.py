@@ -28,6 +28,15 @@ class TestWangchanberta(unittest.TestCase):
             ner.get_ner("I คิด therefore I am ผ็ฎ์", tag=True)
         )
 
+        texts = [
+            "I คิด therefore I am ผ็ฎ์",
+            "โรงเรียนสวนกุหลาบเป็นโรงเรียนที่ดี แต่ไม่มีสวนกุหลาบ",
+        ]
+        self.assertEqual(ner.get_ner_batch([]), [])
+        self.assertEqual(
+            ner.get_ner_batch(texts), [ner.get_ner(text) for text in texts]
+        )
+
     def test_lst20_ner_wangchanberta(self):
         ner = ThaiNameTagger(dataset_name="lst20")
         self.assertIsNotNone(